@@ -12,12 +12,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+
 from glanceclient import exc as glance_exception
 from novaclient import exceptions as nova_exception
 
 from magnum.api import utils as api_utils
 from magnum.common import clients
 from magnum.common import exception
+from magnum.common import lookup_cache
 from magnum.i18n import _
 
 
@@ -30,12 +33,48 @@ SUPPORTED_IMAGE_PROVIDERS = ['docker', 'appc']
 SUPPORTED_SWARM_STRATEGY = ['spread', 'binpack', 'random']
 
 
+# Names and ids of the resources listed to validate a resource.
+_Index = collections.namedtuple('_Index', 'ids names')
+
+
+def _get_index(cli, resource_type, name, load, ident):
+    """Return the cached index of the resources seen by the project.
+
+    The index is listed again when it does not hold ident, in case the
+    resource was created since it was cached.
+    """
+    scope = lookup_cache.project_scope(cli.context)
+    if scope is None:
+        return load()
+    key = (name, scope)
+    loaded = []
+
+    def load_index():
+        loaded.append(True)
+        return load()
+
+    index = lookup_cache.LOOKUPS.get_or_load(resource_type, key, load_index)
+    if not loaded and ident not in index.ids and ident not in index.names:
+        lookup_cache.LOOKUPS.invalidate(resource_type, key)
+        index = lookup_cache.LOOKUPS.get_or_load(resource_type, key,
+                                                 load_index)
+    return index
+
+
 def validate_image(cli, image):
     """Validate image"""
 
+    def load():
+        return api_utils.get_openstack_resource(cli.glance().images,
+                                                image, 'images')
+
+    scope = lookup_cache.project_scope(cli.context)
     try:
-        image_found = api_utils.get_openstack_resource(cli.glance().images,
-                                                       image, 'images')
+        if scope is None:
+            image_found = load()
+        else:
+            image_found = lookup_cache.LOOKUPS.get_or_load(
+                'image', ('images', scope, image), load)
     except (glance_exception.NotFound, exception.ResourceNotFound):
         raise exception.ImageNotFound(image_id=image)
     except glance_exception.HTTPForbidden:
@@ -45,6 +84,12 @@ def validate_image(cli, image):
     return image_found
 
 
+def _load_flavors(cli):
+    flavors = cli.nova().flavors.list()
+    return _Index(ids={f.id for f in flavors},
+                  names={f.name for f in flavors})
+
+
 def validate_flavor(cli, flavor):
     """Validate flavor.
 
@@ -54,11 +99,10 @@ def validate_flavor(cli, flavor):
 
     if flavor is None:
         return
-    flavor_list = cli.nova().flavors.list()
-    for f in flavor_list:
-        if f.name == flavor or f.id == flavor:
-            return
-    raise exception.FlavorNotFound(flavor=flavor)
+    index = _get_index(cli, 'flavor', 'flavors',
+                       lambda: _load_flavors(cli), flavor)
+    if flavor not in index.ids and flavor not in index.names:
+        raise exception.FlavorNotFound(flavor=flavor)
 
 
 def validate_keypair(cli, keypair):
@@ -74,16 +118,23 @@ def validate_keypair(cli, keypair):
         raise exception.KeyPairNotFound(keypair=keypair)
 
 
+def _load_external_networks(cli):
+    ext_filter = {'router:external': True}
+    networks = cli.neutron().list_networks(**ext_filter).get('networks')
+    return _Index(ids={net.get('id') for net in networks},
+                  names=collections.Counter(net.get('name')
+                                            for net in networks))
+
+
 def validate_external_network(cli, external_network):
     """Validate external network"""
 
-    count = 0
-    ext_filter = {'router:external': True}
-    networks = cli.neutron().list_networks(**ext_filter)
-    for net in networks.get('networks'):
-        if (net.get('name') == external_network or
-                net.get('id') == external_network):
-            count = count + 1
+    index = _get_index(cli, 'network', 'external_networks',
+                       lambda: _load_external_networks(cli),
+                       external_network)
+    count = index.names[external_network]
+    if external_network in index.ids:
+        count = count + 1
 
     if count == 0:
         # Unable to find the external network.
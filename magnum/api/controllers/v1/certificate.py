@@ -153,7 +153,8 @@ class CertificateController(base.Controller):
         """
         context = pecan.request.context
         cluster = api_utils.get_resource('Cluster', cluster_ident)
-        policy.enforce(context, 'certificate:get', cluster.as_dict(),
+        policy.enforce(context, 'certificate:get',
+                       policy.object_target(cluster),
                        action='certificate:get')
         certificate = pecan.request.rpcapi.get_ca_certificate(cluster,
                                                               ca_cert_type)
@@ -167,7 +168,8 @@ class CertificateController(base.Controller):
         """
         context = pecan.request.context
         cluster = certificate.get_cluster()
-        policy.enforce(context, 'certificate:create', cluster.as_dict(),
+        policy.enforce(context, 'certificate:create',
+                       policy.object_target(cluster),
                        action='certificate:create')
         certificate_dict = certificate.as_dict()
         certificate_dict['project_id'] = context.project_id
@@ -182,7 +184,8 @@ class CertificateController(base.Controller):
     def patch(self, cluster_ident):
         context = pecan.request.context
         cluster = api_utils.get_resource('Cluster', cluster_ident)
-        policy.enforce(context, 'certificate:rotate_ca', cluster.as_dict(),
+        policy.enforce(context, 'certificate:rotate_ca',
+                       policy.object_target(cluster),
                        action='certificate:rotate_ca')
         if cluster.cluster_template.tls_disabled:
             raise exception.NotSupported("Rotating the CA certificate on a "
@@ -18,6 +18,7 @@ import uuid
 from oslo_log import log as logging
 from oslo_utils import strutils
 from oslo_utils import timeutils
+from oslo_utils import uuidutils
 import pecan
 import six
 import warnings
@@ -40,6 +41,7 @@ from magnum.common import policy
 import magnum.conf
 from magnum.i18n import _
 from magnum import objects
+from magnum.objects import base as objects_base
 from magnum.objects import fields
 
 LOG = logging.getLogger(__name__)
@@ -328,7 +330,8 @@ class ClustersController(base.Controller):
 
     def _get_clusters_collection(self, marker, limit,
                                  sort_key, sort_dir, expand=False,
-                                 resource_url=None):
+                                 resource_url=None, cursor=None,
+                                 keyset=False):
 
         context = pecan.request.context
         if context.is_admin:
@@ -351,49 +354,92 @@ class ClustersController(base.Controller):
         sort_dir = api_utils.validate_sort_dir(sort_dir)
 
         marker_obj = None
-        if marker:
+        cursor_values = None
+        if cursor:
+            cursor_values = api_utils.decode_cursor(cursor, sort_key,
+                                                    sort_dir)
+        elif marker:
             marker_obj = objects.Cluster.get_by_uuid(pecan.request.context,
                                                      marker)
 
         clusters = objects.Cluster.list(pecan.request.context, limit,
                                         marker_obj, sort_key=sort_key,
-                                        sort_dir=sort_dir)
+                                        sort_dir=sort_dir,
+                                        cursor=cursor_values)
 
+        next_cursor = None
+        if keyset and clusters:
+            next_cursor = api_utils.encode_cursor(clusters[-1], sort_key,
+                                                  sort_dir)
         return ClusterCollection.convert_with_links(clusters, limit,
                                                     url=resource_url,
                                                     expand=expand,
+                                                    cursor=next_cursor,
                                                     sort_key=sort_key,
                                                     sort_dir=sort_dir)
 
     nodegroups = nodegroup.NodeGroupController()
 
+    @base.Controller.api_version("1.1", "1.11")
     @expose.expose(ClusterCollection, types.uuid, int, wtypes.text,
                    wtypes.text)
     def get_all(self, marker=None, limit=None, sort_key='id',
                 sort_dir='asc'):
+        return self._get_all(marker, limit, sort_key, sort_dir)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(ClusterCollection, types.uuid, int, wtypes.text,
+                   wtypes.text, wtypes.text)
+    def get_all(self, marker=None, limit=None, sort_key='id',  # noqa
+                sort_dir='asc', cursor=None):
+        return self._get_all(marker, limit, sort_key, sort_dir, cursor,
+                             keyset=True)
+
+    def _get_all(self, marker, limit, sort_key, sort_dir, cursor=None,
+                 keyset=False):
         """Retrieve a list of clusters.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'cluster:get_all',
                        action='cluster:get_all')
         return self._get_clusters_collection(marker, limit, sort_key,
-                                             sort_dir)
+                                             sort_dir, cursor=cursor,
+                                             keyset=keyset)
 
+    @base.Controller.api_version("1.1", "1.11")
     @expose.expose(ClusterCollection, types.uuid, int, wtypes.text,
                    wtypes.text)
     def detail(self, marker=None, limit=None, sort_key='id',
                sort_dir='asc'):
+        return self._detail(marker, limit, sort_key, sort_dir)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(ClusterCollection, types.uuid, int, wtypes.text,
+                   wtypes.text, wtypes.text)
+    def detail(self, marker=None, limit=None, sort_key='id',  # noqa
+               sort_dir='asc', cursor=None):
+        return self._detail(marker, limit, sort_key, sort_dir, cursor,
+                            keyset=True)
+
+    def _detail(self, marker, limit, sort_key, sort_dir, cursor=None,
+                keyset=False):
         """Retrieve a list of clusters with detail.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'cluster:detail',
@@ -408,7 +454,8 @@ class ClustersController(base.Controller):
         resource_url = '/'.join(['clusters', 'detail'])
         return self._get_clusters_collection(marker, limit,
                                              sort_key, sort_dir, expand,
-                                             resource_url)
+                                             resource_url, cursor=cursor,
+                                             keyset=keyset)
 
     def _collect_fault_info(self, context, cluster):
         """Collect fault info from heat resources of given cluster
@@ -440,8 +487,17 @@ class ClustersController(base.Controller):
             # can list clusters for a particular project.
             context.all_tenants = True
 
-        cluster = api_utils.get_resource('Cluster', cluster_ident)
-        policy.enforce(context, 'cluster:get', cluster.as_dict(),
+        if uuidutils.is_uuid_like(cluster_ident):
+            # Get the nodegroups showing the cluster needs along with it, in
+            # a single call to the conductor.
+            cluster, nodegroups = objects_base.class_actions(context, [
+                (objects.Cluster, 'get_by_uuid', (cluster_ident,), {}),
+                (objects.NodeGroup, 'list', (cluster_ident,), {})])
+            cluster.nodegroups = nodegroups
+        else:
+            cluster = api_utils.get_resource('Cluster', cluster_ident)
+        policy.enforce(context, 'cluster:get',
+                       policy.object_target(cluster),
                        action='cluster:get')
 
         api_cluster = Cluster.convert_with_links(cluster)
@@ -452,18 +508,20 @@ class ClustersController(base.Controller):
         return api_cluster
 
     def _check_cluster_quota_limit(self, context):
-        try:
-            # Check if there is any explicit quota limit set in Quotas table
-            quota = objects.Quota.get_quota_by_project_id_resource(
-                context,
-                context.project_id,
-                'Cluster')
-            cluster_limit = quota.hard_limit
-        except exception.QuotaNotFound:
+        # Check if there is any explicit quota limit set in Quotas table,
+        # and count the clusters, in a single call to the conductor.
+        quotas, cluster_count = objects_base.class_actions(context, [
+            (objects.Quota, 'list', (),
+             {'filters': {'project_id': context.project_id,
+                          'resource': 'Cluster'}}),
+            (objects.Cluster, 'get_count_all', (), {})])
+        if quotas:
+            cluster_limit = quotas[0].hard_limit
+        else:
             # If explicit quota was not set for the project, use default limit
             cluster_limit = CONF.quotas.max_clusters_per_project
 
-        if objects.Cluster.get_count_all(context) >= cluster_limit:
+        if cluster_count >= cluster_limit:
             msg = _("You have reached the maximum clusters per project, "
                     "%d. You may delete a cluster to make room for a new "
                     "one.") % cluster_limit
@@ -637,7 +695,8 @@ class ClustersController(base.Controller):
             context.all_tenants = True
 
         cluster = api_utils.get_resource('Cluster', cluster_ident)
-        policy.enforce(context, 'cluster:update', cluster.as_dict(),
+        policy.enforce(context, 'cluster:update',
+                       policy.object_target(cluster),
                        action='cluster:update')
         policy.enforce(context, "cluster:update_health_status",
                        action="cluster:update_health_status")
@@ -684,7 +743,8 @@ class ClustersController(base.Controller):
             context.all_tenants = True
 
         cluster = api_utils.get_resource('Cluster', cluster_ident)
-        policy.enforce(context, 'cluster:delete', cluster.as_dict(),
+        policy.enforce(context, 'cluster:delete',
+                       policy.object_target(cluster),
                        action='cluster:delete')
 
         pecan.request.rpcapi.cluster_delete_async(cluster.uuid)
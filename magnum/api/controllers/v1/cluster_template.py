@@ -286,7 +286,8 @@ class ClusterTemplatesController(base.Controller):
 
     def _get_cluster_templates_collection(self, marker, limit,
                                           sort_key, sort_dir,
-                                          resource_url=None):
+                                          resource_url=None, cursor=None,
+                                          keyset=False):
 
         context = pecan.request.context
         if context.is_admin:
@@ -309,47 +310,89 @@ class ClusterTemplatesController(base.Controller):
         sort_dir = api_utils.validate_sort_dir(sort_dir)
 
         marker_obj = None
-        if marker:
+        cursor_values = None
+        if cursor:
+            cursor_values = api_utils.decode_cursor(cursor, sort_key,
+                                                    sort_dir)
+        elif marker:
             marker_obj = objects.ClusterTemplate.get_by_uuid(
                 pecan.request.context, marker)
 
         cluster_templates = objects.ClusterTemplate.list(
             pecan.request.context, limit, marker_obj, sort_key=sort_key,
-            sort_dir=sort_dir)
+            sort_dir=sort_dir, cursor=cursor_values)
 
+        next_cursor = None
+        if keyset and cluster_templates:
+            next_cursor = api_utils.encode_cursor(cluster_templates[-1],
+                                                  sort_key, sort_dir)
         return ClusterTemplateCollection.convert_with_links(cluster_templates,
                                                             limit,
                                                             url=resource_url,
+                                                            cursor=next_cursor,
                                                             sort_key=sort_key,
                                                             sort_dir=sort_dir)
 
+    @base.Controller.api_version("1.1", "1.11")
     @expose.expose(ClusterTemplateCollection, types.uuid, int, wtypes.text,
                    wtypes.text)
     def get_all(self, marker=None, limit=None, sort_key='id',
                 sort_dir='asc'):
+        return self._get_all(marker, limit, sort_key, sort_dir)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(ClusterTemplateCollection, types.uuid, int, wtypes.text,
+                   wtypes.text, wtypes.text)
+    def get_all(self, marker=None, limit=None, sort_key='id',  # noqa
+                sort_dir='asc', cursor=None):
+        return self._get_all(marker, limit, sort_key, sort_dir, cursor,
+                             keyset=True)
+
+    def _get_all(self, marker, limit, sort_key, sort_dir, cursor=None,
+                 keyset=False):
         """Retrieve a list of ClusterTemplates.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'clustertemplate:get_all',
                        action='clustertemplate:get_all')
         return self._get_cluster_templates_collection(marker, limit, sort_key,
-                                                      sort_dir)
+                                                      sort_dir, cursor=cursor,
+                                                      keyset=keyset)
 
+    @base.Controller.api_version("1.1", "1.11")
     @expose.expose(ClusterTemplateCollection, types.uuid, int, wtypes.text,
                    wtypes.text)
     def detail(self, marker=None, limit=None, sort_key='id',
                sort_dir='asc'):
+        return self._detail(marker, limit, sort_key, sort_dir)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(ClusterTemplateCollection, types.uuid, int, wtypes.text,
+                   wtypes.text, wtypes.text)
+    def detail(self, marker=None, limit=None, sort_key='id',  # noqa
+               sort_dir='asc', cursor=None):
+        return self._detail(marker, limit, sort_key, sort_dir, cursor,
+                            keyset=True)
+
+    def _detail(self, marker, limit, sort_key, sort_dir, cursor=None,
+                keyset=False):
         """Retrieve a list of ClusterTemplates with detail.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'clustertemplate:detail',
@@ -363,7 +406,9 @@ class ClusterTemplatesController(base.Controller):
         resource_url = '/'.join(['clustertemplates', 'detail'])
         return self._get_cluster_templates_collection(marker, limit,
                                                       sort_key, sort_dir,
-                                                      resource_url)
+                                                      resource_url,
+                                                      cursor=cursor,
+                                                      keyset=keyset)
 
     @expose.expose(ClusterTemplate, types.uuid_or_name)
     def get_one(self, cluster_template_ident):
@@ -391,7 +436,7 @@ class ClusterTemplatesController(base.Controller):
 
         if not cluster_template.public:
             policy.enforce(context, 'clustertemplate:get',
-                           cluster_template.as_dict(),
+                           policy.object_target(cluster_template),
                            action='clustertemplate:get')
 
         return ClusterTemplate.convert_with_links(cluster_template)
@@ -478,7 +523,7 @@ class ClusterTemplatesController(base.Controller):
         cluster_template = api_utils.get_resource('ClusterTemplate',
                                                   cluster_template_ident)
         policy.enforce(context, 'clustertemplate:update',
-                       cluster_template.as_dict(),
+                       policy.object_target(cluster_template),
                        action='clustertemplate:update')
         try:
             cluster_template_dict = cluster_template.as_dict()
@@ -535,6 +580,6 @@ class ClusterTemplatesController(base.Controller):
         cluster_template = api_utils.get_resource('ClusterTemplate',
                                                   cluster_template_ident)
         policy.enforce(context, 'clustertemplate:delete',
-                       cluster_template.as_dict(),
+                       policy.object_target(cluster_template),
                        action='clustertemplate:delete')
         cluster_template.destroy()
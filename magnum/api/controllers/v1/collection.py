@@ -33,16 +33,25 @@ class Collection(base.APIBase):
         """Return whether collection has more items."""
         return len(self.collection) and len(self.collection) == limit
 
-    def get_next(self, limit, url=None, marker_attribute='uuid', **kwargs):
-        """Return a link to the next subset of the collection."""
+    def get_next(self, limit, url=None, marker_attribute='uuid', cursor=None,
+                 **kwargs):
+        """Return a link to the next subset of the collection.
+
+        The link carries the cursor of the next page when one is given, the
+        marker attribute of the last item otherwise.
+        """
         if not self.has_next(limit):
             return wtypes.Unset
 
         resource_url = url or self._type
         q_args = ''.join(['%s=%s&' % (key, kwargs[key]) for key in kwargs])
-        next_args = '?%(args)slimit=%(limit)d&marker=%(marker)s' % {
-            'args': q_args, 'limit': limit,
-            'marker': getattr(self.collection[-1], marker_attribute)}
+        if cursor is not None:
+            next_args = '?%(args)slimit=%(limit)d&cursor=%(cursor)s' % {
+                'args': q_args, 'limit': limit, 'cursor': cursor}
+        else:
+            next_args = '?%(args)slimit=%(limit)d&marker=%(marker)s' % {
+                'args': q_args, 'limit': limit,
+                'marker': getattr(self.collection[-1], marker_attribute)}
 
         return link.Link.make_link('next', pecan.request.host_url,
                                    resource_url, next_args).href
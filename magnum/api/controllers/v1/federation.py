@@ -254,7 +254,8 @@ class FederationsController(base.Controller):
         """
         context = pecan.request.context
         federation = api_utils.get_resource('Federation', federation_ident)
-        policy.enforce(context, 'federation:get', federation.as_dict(),
+        policy.enforce(context, 'federation:get',
+                       policy.object_target(federation),
                        action='federation:get')
 
         federation = Federation.convert_with_links(federation)
@@ -316,7 +317,8 @@ class FederationsController(base.Controller):
     def _patch(self, federation_ident, patch):
         context = pecan.request.context
         federation = api_utils.get_resource('Federation', federation_ident)
-        policy.enforce(context, 'federation:update', federation.as_dict(),
+        policy.enforce(context, 'federation:update',
+                       policy.object_target(federation),
                        action='federation:update')
 
         # NOTE(clenimar): Magnum does not allow one to append items to existing
@@ -448,7 +450,8 @@ class FederationsController(base.Controller):
         """
         context = pecan.request.context
         federation = api_utils.get_resource('Federation', federation_ident)
-        policy.enforce(context, 'federation:delete', federation.as_dict(),
+        policy.enforce(context, 'federation:delete',
+                       policy.object_target(federation),
                        action='federation:delete')
 
         pecan.request.rpcapi.federation_delete_async(federation.uuid)
@@ -224,13 +224,18 @@ class NodeGroupController(base.Controller):
         super(NodeGroupController, self).__init__()
 
     def _get_nodegroup_collection(self, cluster_id, marker, limit, sort_key,
-                                  sort_dir, filters, expand=True):
+                                  sort_dir, filters, expand=True,
+                                  cursor=None, keyset=False):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
 
         marker_obj = None
-        if marker:
+        cursor_values = None
+        if cursor:
+            cursor_values = api_utils.decode_cursor(cursor, sort_key,
+                                                    sort_dir)
+        elif marker:
             marker_obj = objects.NodeGroup.get(pecan.request.context,
                                                cluster_id,
                                                marker)
@@ -241,20 +246,39 @@ class NodeGroupController(base.Controller):
                                             marker=marker_obj,
                                             sort_key=sort_key,
                                             sort_dir=sort_dir,
-                                            filters=filters)
+                                            filters=filters,
+                                            cursor=cursor_values)
 
+        next_cursor = None
+        if keyset and nodegroups:
+            next_cursor = api_utils.encode_cursor(nodegroups[-1], sort_key,
+                                                  sort_dir)
         return NodeGroupCollection.convert(nodegroups,
                                            cluster_id,
                                            limit,
                                            expand=expand,
+                                           cursor=next_cursor,
                                            sort_key=sort_key,
                                            sort_dir=sort_dir)
 
-    @base.Controller.api_version("1.9")
+    @base.Controller.api_version("1.9", "1.11")
     @expose.expose(NodeGroupCollection, types.uuid_or_name, types.uuid, int,
                    wtypes.text, wtypes.text, wtypes.text)
     def get_all(self, cluster_id, marker=None, limit=None, sort_key='id',
                 sort_dir='asc', role=None):
+        return self._get_all(cluster_id, marker, limit, sort_key, sort_dir,
+                             role)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(NodeGroupCollection, types.uuid_or_name, types.uuid, int,
+                   wtypes.text, wtypes.text, wtypes.text, wtypes.text)
+    def get_all(self, cluster_id, marker=None, limit=None,  # noqa
+                sort_key='id', sort_dir='asc', role=None, cursor=None):
+        return self._get_all(cluster_id, marker, limit, sort_key, sort_dir,
+                             role, cursor, keyset=True)
+
+    def _get_all(self, cluster_id, marker, limit, sort_key, sort_dir, role,
+                 cursor=None, keyset=False):
         """Retrieve a list of nodegroups.
 
         :param cluster_id: the cluster id or name
@@ -263,6 +287,9 @@ class NodeGroupController(base.Controller):
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
         :param role: list all nodegroups with the specified role.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'nodegroup:get_all',
@@ -287,7 +314,9 @@ class NodeGroupController(base.Controller):
                                               sort_key,
                                               sort_dir,
                                               filters,
-                                              expand=False)
+                                              expand=False,
+                                              cursor=cursor,
+                                              keyset=keyset)
 
     @base.Controller.api_version("1.9")
     @expose.expose(NodeGroup, types.uuid_or_name, types.uuid_or_name)
@@ -99,13 +99,17 @@ class QuotaController(base.Controller):
     }
 
     def _get_quota_collection(self, marker, limit, sort_key, sort_dir,
-                              filters):
+                              filters, cursor=None, keyset=False):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
 
         marker_obj = None
-        if marker:
+        cursor_values = None
+        if cursor:
+            cursor_values = api_utils.decode_cursor(cursor, sort_key,
+                                                    sort_dir)
+        elif marker:
             marker_obj = objects.Quota.get_by_id(pecan.request.context,
                                                  marker)
 
@@ -114,17 +118,36 @@ class QuotaController(base.Controller):
                                     marker_obj,
                                     sort_key=sort_key,
                                     sort_dir=sort_dir,
-                                    filters=filters)
+                                    filters=filters,
+                                    cursor=cursor_values)
 
+        next_cursor = None
+        if keyset and quotas:
+            next_cursor = api_utils.encode_cursor(quotas[-1], sort_key,
+                                                  sort_dir)
         return QuotaCollection.convert(quotas,
                                        limit,
+                                       cursor=next_cursor,
                                        sort_key=sort_key,
                                        sort_dir=sort_dir)
 
+    @base.Controller.api_version("1.1", "1.11")
     @expose.expose(QuotaCollection, int, int, wtypes.text, wtypes.text,
                    types.boolean)
     def get_all(self, marker=None, limit=None, sort_key='id',
                 sort_dir='asc', all_tenants=False):
+        return self._get_all(marker, limit, sort_key, sort_dir, all_tenants)
+
+    @base.Controller.api_version("1.12")  # noqa
+    @expose.expose(QuotaCollection, int, int, wtypes.text, wtypes.text,
+                   types.boolean, wtypes.text)
+    def get_all(self, marker=None, limit=None, sort_key='id',  # noqa
+                sort_dir='asc', all_tenants=False, cursor=None):
+        return self._get_all(marker, limit, sort_key, sort_dir, all_tenants,
+                             cursor, keyset=True)
+
+    def _get_all(self, marker, limit, sort_key, sort_dir, all_tenants,
+                 cursor=None, keyset=False):
         """Retrieve a list of quotas.
 
         :param marker: pagination marker for large data sets.
@@ -132,6 +155,9 @@ class QuotaController(base.Controller):
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
         :param all_tenants: a flag to indicate all or current tenant.
+        :param cursor: pagination cursor, from the next link of the
+                       previous page. Takes precedence over marker.
+        :param keyset: whether the next link carries a cursor.
         """
         context = pecan.request.context
         policy.enforce(context, 'quota:get_all',
@@ -145,7 +171,9 @@ class QuotaController(base.Controller):
                                           limit,
                                           sort_key,
                                           sort_dir,
-                                          filters)
+                                          filters,
+                                          cursor=cursor,
+                                          keyset=keyset)
 
     @expose.expose(Quota, wtypes.text, wtypes.text)
     def get_one(self, project_id, resource):
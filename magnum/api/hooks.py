@@ -78,10 +78,19 @@ class ContextHook(hooks.PecanHook):
 
 
 class RPCHook(hooks.PecanHook):
-    """Attach the rpcapi object to the request so controllers can get to it."""
+    """Attach the rpcapi object to the request so controllers can get to it.
+
+    The rpcapi objects only bind the request context to the RPC client,
+    which is created once and shared by every request of the process.
+    """
 
     def before(self, state):
-        state.request.rpcapi = conductor_api.API(context=state.request.context)
+        # Forked werkzeug workers exit as soon as they responded, casts
+        # still to be sent would be lost.
+        async_casts = (CONF.api.async_rpc_casts and
+                       CONF.api.server_mode == 'prefork')
+        state.request.rpcapi = conductor_api.API(
+            context=state.request.context, async_casts=async_casts)
 
 
 class NoExceptionTracebackHook(hooks.PecanHook):
@@ -14,7 +14,11 @@
 #    under the License.
 
 import ast
+import base64
+import binascii
+
 import jsonpatch
+from oslo_serialization import jsonutils
 from oslo_utils import uuidutils
 import pecan
 import wsme
@@ -54,6 +58,49 @@ def validate_sort_dir(sort_dir):
     return sort_dir
 
 
+def _cursor_keys(sort_key):
+    # The keys the database sorts by, see _paginate_query.
+    if sort_key and sort_key != 'id':
+        return [sort_key, 'id']
+    return ['id']
+
+
+def encode_cursor(resource, sort_key, sort_dir):
+    """Return the cursor of the page following a resource.
+
+    The cursor is opaque to clients. It holds the sort order along with the
+    values of the sort key and of the id of the resource, letting the
+    database seek to the next page without loading a marker first.
+    """
+    values = [jsonutils.to_primitive(getattr(resource, key),
+                                     convert_datetime=True)
+              for key in _cursor_keys(sort_key)]
+    cursor = jsonutils.dump_as_bytes([sort_key, sort_dir, values])
+    return base64.urlsafe_b64encode(cursor).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(cursor, sort_key, sort_dir):
+    """Return the sort key values held by a cursor.
+
+    :raises: ClientSideError if the cursor is invalid or was issued for
+             another sort order.
+    """
+    try:
+        cursor = cursor.encode('ascii')
+        cursor = base64.urlsafe_b64decode(cursor + b'=' * (-len(cursor) % 4))
+        cursor_key, cursor_dir, values = jsonutils.loads(cursor)
+    except (binascii.Error, TypeError, ValueError):
+        raise wsme.exc.ClientSideError(_("Invalid pagination cursor"))
+    if (cursor_key, cursor_dir) != (sort_key, sort_dir):
+        raise wsme.exc.ClientSideError(_(
+            "The pagination cursor was issued for another sort_key or "
+            "sort_dir"))
+    if (not isinstance(values, list) or
+            len(values) != len(_cursor_keys(sort_key))):
+        raise wsme.exc.ClientSideError(_("Invalid pagination cursor"))
+    return values
+
+
 def validate_docker_memory(mem_str):
     """Docker require that Minimum memory limit >= 4M."""
     try:
@@ -18,6 +18,7 @@ import decorator
 import pecan
 
 from keystoneauth1 import exceptions as ka_exception
+from oslo_utils import uuidutils
 
 from magnum.api import utils as api_utils
 from magnum.common import clients
@@ -48,11 +49,18 @@ def ct_not_found_to_bad_request():
     return wrapper
 
 
+def _get_cluster_template(context, cluster_template_ident):
+    if uuidutils.is_uuid_like(cluster_template_ident):
+        return objects.ClusterTemplate.get_cached(context,
+                                                  cluster_template_ident)
+    return objects.ClusterTemplate.get(context, cluster_template_ident)
+
+
 def enforce_cluster_type_supported():
     @decorator.decorator
     def wrapper(func, *args, **kwargs):
         cluster = args[1]
-        cluster_template = objects.ClusterTemplate.get(
+        cluster_template = _get_cluster_template(
             pecan.request.context, cluster.cluster_template_id)
         cluster_type = (cluster_template.server_type,
                         cluster_template.cluster_distro,
@@ -91,7 +99,7 @@ def enforce_cluster_volume_storage_size():
     @decorator.decorator
     def wrapper(func, *args, **kwargs):
         cluster = args[1]
-        cluster_template = objects.ClusterTemplate.get(
+        cluster_template = _get_cluster_template(
             pecan.request.context, cluster.cluster_template_id)
         _enforce_volume_storage_size(
             cluster_template.as_dict(), cluster.as_dict())
@@ -25,6 +25,7 @@ from werkzeug import serving
 from magnum.api import app as api_app
 from magnum.common import profiler
 from magnum.common import service
+from magnum.common import wsgi_service
 import magnum.conf
 from magnum.i18n import _
 from magnum.objects import base
@@ -82,6 +83,13 @@ def main():
     workers = CONF.api.workers
     if not workers:
         workers = processutils.get_worker_count()
+    if CONF.api.server_mode == 'prefork':
+        LOG.info('Server will handle requests in %(workers)s worker '
+                 'processes of up to %(pool)s concurrent requests each',
+                 {'workers': workers, 'pool': CONF.api.worker_pool_size})
+        wsgi_service.serve('magnum-api', app, host, port, workers,
+                           ssl_files=_get_ssl_configs(use_ssl))
+        return
     LOG.info('Server will handle each request in a new process up to'
              ' %s concurrent processes', workers)
     serving.run_simple(host, port, app, processes=workers,
@@ -32,6 +32,7 @@ from magnum.conductor.handlers import federation_conductor
 from magnum.conductor.handlers import indirection_api
 from magnum.conductor.handlers import nodegroup_conductor
 import magnum.conf
+from magnum.drivers.heat import template_cache
 from magnum import version
 
 CONF = magnum.conf.CONF
@@ -60,6 +61,10 @@ def main():
     server = rpc_service.Service.create(CONF.conductor.topic,
                                         conductor_id, endpoints,
                                         binary='magnum-conductor')
+    # Resolve the Heat templates once, before forking, so that the workers
+    # share them.
+    template_cache.prewarm()
+
     workers = CONF.conductor.workers
     if not workers:
         workers = processutils.get_worker_count()
@@ -70,6 +75,9 @@ def main():
     #               duplicated in all the children if multiple
     #               workers are being used.
     server.create_periodic_tasks()
+    # The Heat notification listener complements the periodic status
+    # sync, so it is attached to the main process as well.
+    server.create_notification_listener()
     server.start()
 
     launcher.wait()
@@ -24,6 +24,7 @@ from oslo_log import log as logging
 
 from magnum.common import exception
 from magnum.common import keystone
+from magnum.common import lookup_cache
 import magnum.conf
 
 CONF = magnum.conf.CONF
@@ -45,7 +46,13 @@ class OpenStackClients(object):
         self._cinder = None
 
     def url_for(self, **kwargs):
-        return self.keystone().session.get_endpoint(**kwargs)
+        scope = lookup_cache.project_scope(self.context)
+        if scope is None:
+            return self.keystone().session.get_endpoint(**kwargs)
+        return lookup_cache.LOOKUPS.get_or_load(
+            'endpoint', (scope, tuple(sorted(kwargs.items()))),
+            lambda: self.keystone().session.get_endpoint(**kwargs),
+            negative=(catalog.EndpointNotFound,))
 
     def magnum_url(self):
         endpoint_type = self._get_client_option('magnum', 'endpoint_type')
@@ -64,7 +71,11 @@ class OpenStackClients(object):
 
     def cinder_region_name(self):
         cinder_region_name = self._get_client_option('cinder', 'region_name')
-        return self.keystone().get_validate_region_name(cinder_region_name)
+        return lookup_cache.LOOKUPS.get_or_load(
+            'region', cinder_region_name,
+            lambda: self.keystone().get_validate_region_name(
+                cinder_region_name),
+            negative=(exception.InvalidParameterValue,))
 
     @property
     def auth_url(self):
@@ -13,6 +13,7 @@
 from eventlet.green import threading
 from oslo_context import context
 
+from magnum.common import keystone
 from magnum.common import policy
 
 import magnum.conf
@@ -29,7 +30,8 @@ class RequestContext(context.RequestContext):
                  project_name=None, project_id=None, roles=None,
                  is_admin=None, read_only=False, show_deleted=False,
                  request_id=None, trust_id=None, auth_token_info=None,
-                 all_tenants=False, password=None, **kwargs):
+                 all_tenants=False, password=None,
+                 auth_token_info_omitted=False, **kwargs):
         """Stores several additional request parameters:
 
         :param domain_id: The ID of the domain.
@@ -38,6 +40,9 @@ class RequestContext(context.RequestContext):
                                authenticate a user against.
         :param user_domain_name: The name of the domain to
                                  authenticate a user against.
+        :param auth_token_info_omitted: Whether auth_token_info was left
+                                        out when sending the context over
+                                        RPC, to be looked up when used.
 
         """
         super(RequestContext, self).__init__(auth_token=auth_token,
@@ -58,7 +63,8 @@ class RequestContext(context.RequestContext):
         self.user_domain_id = user_domain_id
         self.user_domain_name = user_domain_name
         self.auth_url = auth_url
-        self.auth_token_info = auth_token_info
+        self._auth_token_info = auth_token_info
+        self.auth_token_info_omitted = auth_token_info_omitted
         self.trust_id = trust_id
         self.all_tenants = all_tenants
         self.password = password
@@ -67,6 +73,20 @@ class RequestContext(context.RequestContext):
         else:
             self.is_admin = is_admin
 
+    @property
+    def auth_token_info(self):
+        if self.auth_token_info_omitted:
+            self.auth_token_info_omitted = False
+            if self.auth_token:
+                self._auth_token_info = keystone.TOKEN_INFO.get(
+                    self.auth_token)
+        return self._auth_token_info
+
+    @auth_token_info.setter
+    def auth_token_info(self, auth_token_info):
+        self._auth_token_info = auth_token_info
+        self.auth_token_info_omitted = False
+
     def to_dict(self):
         value = super(RequestContext, self).to_dict()
         value.update({'auth_token': self.auth_token,
@@ -85,7 +105,8 @@ class RequestContext(context.RequestContext):
                       'show_deleted': self.show_deleted,
                       'request_id': self.request_id,
                       'trust_id': self.trust_id,
-                      'auth_token_info': self.auth_token_info,
+                      'auth_token_info': self._auth_token_info,
+                      'auth_token_info_omitted': self.auth_token_info_omitted,
                       'password': self.password,
                       'all_tenants': self.all_tenants})
         return value
@@ -0,0 +1,50 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Consistent hash ring used to spread work across service hosts.
+
+Every host is placed on the ring several times so that keys stay evenly
+distributed, and adding or removing a host only moves the keys that hashed
+next to it.
+"""
+
+import bisect
+import hashlib
+
+from magnum.common import exception
+
+DEFAULT_REPLICAS = 32
+
+
+def _hash(value):
+    digest = hashlib.sha256(value.encode('utf-8')).hexdigest()
+    return int(digest[:16], 16)
+
+
+class HashRing(object):
+    """Map keys onto a set of hosts."""
+
+    def __init__(self, hosts, replicas=DEFAULT_REPLICAS):
+        self.hosts = frozenset(hosts)
+        self._ring = {}
+        for host in self.hosts:
+            for replica in range(replicas):
+                self._ring[_hash('%s-%d' % (host, replica))] = host
+        self._partitions = sorted(self._ring)
+
+    def get_host(self, key):
+        """Return the host owning the given key."""
+        if not self._partitions:
+            raise exception.MagnumException(
+                message='No hosts available in the hash ring.')
+        index = bisect.bisect(self._partitions, _hash(key))
+        return self._ring[self._partitions[index % len(self._partitions)]]
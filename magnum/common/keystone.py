@@ -10,6 +10,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import hashlib
+import threading
+import time
+
 from keystoneauth1.access import access as ka_access
 from keystoneauth1 import exceptions as ka_exception
 from keystoneauth1.identity import access as ka_access_plugin
@@ -18,6 +23,8 @@ from keystoneauth1 import loading as ka_loading
 import keystoneclient.exceptions as kc_exception
 from keystoneclient.v3 import client as kc_v3
 from oslo_log import log as logging
+from oslo_utils import timeutils
+import requests
 
 from magnum.common import exception
 import magnum.conf
@@ -26,6 +33,197 @@ from magnum.i18n import _
 
 CONF = magnum.conf.CONF
 LOG = logging.getLogger(__name__)
+# Seconds during which a token Keystone did not validate is not asked again.
+_TOKEN_FETCH_RETRY_DELAY = 10
+
+
+def _digest(secret):
+    return hashlib.sha256(secret.encode('utf-8')).hexdigest()
+
+
+class SessionCache(object):
+    """Authenticated Keystone sessions shared by the whole process.
+
+    Sessions are looked up by a key describing the credentials they were
+    authenticated with. An entry is evicted once it is older than
+    ``session_cache_ttl``, when the token it holds is about to expire, or
+    when the least recently used entries go beyond ``session_cache_size``.
+    Every session uses the same HTTP connection pool.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = collections.OrderedDict()
+        self._http = None
+
+    @property
+    def http(self):
+        if self._http is None:
+            self._http = requests.Session()
+        return self._http
+
+    @staticmethod
+    def _expires_soon(session):
+        auth_ref = getattr(session.auth, 'auth_ref', None)
+        if auth_ref is None:
+            return False
+        return auth_ref.will_expire_soon(
+            ka_v3.Password.MIN_TOKEN_LIFE_SECONDS)
+
+    def get(self, key, create):
+        """Return the session cached for key, calling create on a miss."""
+        size = CONF[ksconf.CFG_GROUP].session_cache_size
+        if key is None or not size:
+            return create()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None:
+                session, deadline = entry
+                if now < deadline and not self._expires_soon(session):
+                    self._sessions.move_to_end(key)
+                    return session
+                del self._sessions[key]
+
+        session = create()
+        with self._lock:
+            self._sessions[key] = (
+                session, now + CONF[ksconf.CFG_GROUP].session_cache_ttl)
+            while len(self._sessions) > size:
+                self._sessions.popitem(last=False)
+        return session
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+
+SESSION_CACHE = SessionCache()
+
+
+def _get_auth_url():
+    # FIXME(pauloewerton): auth_url should be retrieved from keystone_auth
+    # section by default
+    conf = CONF[ksconf.CFG_LEGACY_GROUP]
+    auth_uri = (getattr(conf, 'www_authenticate_uri', None) or
+                getattr(conf, 'auth_uri', None))
+    if auth_uri:
+        auth_uri = auth_uri.replace('v2.0', 'v3')
+    return auth_uri
+
+
+class TokenInfoCache(object):
+    """Keystone token bodies, looked up by the digest of their token.
+
+    Request contexts travel over RPC without the body of their token, see
+    ``[DEFAULT]/rpc_compact_context``. The services receiving them find it
+    here, and validate the token with Keystone to get it when it is missing.
+    An entry is evicted once its token expired, or when the least recently
+    used entries go beyond ``token_info_cache_size``. A token that could not
+    be validated is not validated again for a few seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._failures = collections.OrderedDict()
+        self._warned_no_auth_url = False
+        self.hits = 0
+        self.misses = 0
+        self.fetch_errors = 0
+
+    def put(self, token, token_info):
+        size = CONF[ksconf.CFG_GROUP].token_info_cache_size
+        if not size:
+            return
+        expires = ka_access.create(body=token_info, auth_token=token).expires
+        key = _digest(token)
+        with self._lock:
+            self._entries[key] = (token_info, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def get(self, token):
+        """Return the body of token, None if Keystone refused it."""
+        key = _digest(token)
+        now = timeutils.utcnow(with_timezone=True)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry[1]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._entries.pop(key, None)
+            self.misses += 1
+            retry_at = self._failures.get(key)
+            if retry_at is not None:
+                if time.monotonic() < retry_at:
+                    return None
+                del self._failures[key]
+
+        token_info = self._fetch(token)
+        if token_info is not None:
+            self.put(token, token_info)
+        else:
+            self._fetch_failed(key)
+        return token_info
+
+    def _fetch_failed(self, key):
+        size = max(CONF[ksconf.CFG_GROUP].token_info_cache_size, 1)
+        with self._lock:
+            self._failures[key] = time.monotonic() + _TOKEN_FETCH_RETRY_DELAY
+            self._failures.move_to_end(key)
+            while len(self._failures) > size:
+                self._failures.popitem(last=False)
+
+    def _fetch(self, token):
+        auth_url = _get_auth_url()
+        if not auth_url:
+            with self._lock:
+                self.fetch_errors += 1
+                warn = not self._warned_no_auth_url
+                self._warned_no_auth_url = True
+            if warn:
+                LOG.warning('Request tokens cannot be validated with '
+                            'Keystone, neither [%s]/www_authenticate_uri '
+                            'nor [%s]/auth_uri is set.',
+                            ksconf.CFG_LEGACY_GROUP, ksconf.CFG_LEGACY_GROUP)
+            return None
+
+        session = ka_loading.load_session_from_conf_options(
+            CONF, ksconf.CFG_GROUP, session=SESSION_CACHE.http)
+        try:
+            # A token is allowed to validate itself.
+            resp = session.get(
+                auth_url.rstrip('/') + '/auth/tokens',
+                headers={'X-Auth-Token': token, 'X-Subject-Token': token},
+                authenticated=False)
+            return resp.json()
+        except (ka_exception.ClientException, ValueError) as e:
+            with self._lock:
+                self.fetch_errors += 1
+            LOG.warning('Failed to validate a request token with Keystone: '
+                        '%s', e)
+            return None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+            self.hits = 0
+            self.misses = 0
+            self.fetch_errors = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'fetch_errors': self.fetch_errors,
+                    'size': len(self._entries)}
+
+
+TOKEN_INFO = TokenInfoCache()
 
 
 class KeystoneClientV3(object):
@@ -42,14 +240,7 @@ class KeystoneClientV3(object):
 
     @property
     def auth_url(self):
-        # FIXME(pauloewerton): auth_url should be retrieved from keystone_auth
-        # section by default
-        conf = CONF[ksconf.CFG_LEGACY_GROUP]
-        auth_uri = (getattr(conf, 'www_authenticate_uri', None) or
-                    getattr(conf, 'auth_uri', None))
-        if auth_uri:
-            auth_uri = auth_uri.replace('v2.0', 'v3')
-        return auth_uri
+        return _get_auth_url()
 
     @property
     def auth_token(self):
@@ -59,14 +250,32 @@ class KeystoneClientV3(object):
     def session(self):
         if self._session:
             return self._session
-        auth = self._get_auth()
-        session = self._get_session(auth)
+        session = SESSION_CACHE.get(
+            self._session_key(),
+            lambda: self._get_session(self._get_auth()))
         self._session = session
         return session
 
+    def _session_key(self):
+        # Identifies the credentials _get_auth() authenticates with. Scoped
+        # token bodies already carry their catalog, so they are not cached.
+        if self.context.auth_token_info:
+            return None
+        elif self.context.auth_token:
+            return ('token', _digest(self.context.auth_token),
+                    self.context.project_id, self.auth_url)
+        elif self.context.trust_id:
+            return ('trust', self.context.trust_id, self.context.user_name,
+                    _digest(self.context.password or ''),
+                    self.context.user_domain_id,
+                    self.context.user_domain_name, self.auth_url)
+        elif self.context.is_admin:
+            return ('admin', self.auth_url)
+        return None
+
     def _get_session(self, auth):
         session = ka_loading.load_session_from_conf_options(
-            CONF, ksconf.CFG_GROUP, auth=auth)
+            CONF, ksconf.CFG_GROUP, auth=auth, session=SESSION_CACHE.http)
         return session
 
     def _get_auth(self):
@@ -160,15 +369,21 @@ class KeystoneClientV3(object):
     @property
     def domain_admin_session(self):
         if not self._domain_admin_session:
-            session = ka_loading.session.Session().load_from_options(
-                auth=self.domain_admin_auth,
-                insecure=CONF[ksconf.CFG_LEGACY_GROUP].insecure,
-                cacert=CONF[ksconf.CFG_LEGACY_GROUP].cafile,
-                key=CONF[ksconf.CFG_LEGACY_GROUP].keyfile,
-                cert=CONF[ksconf.CFG_LEGACY_GROUP].certfile)
-            self._domain_admin_session = session
+            self._domain_admin_session = SESSION_CACHE.get(
+                ('domain_admin', self.auth_url),
+                self._get_domain_admin_session)
+            self._domain_admin_auth = self._domain_admin_session.auth
         return self._domain_admin_session
 
+    def _get_domain_admin_session(self):
+        return ka_loading.session.Session().load_from_options(
+            auth=self.domain_admin_auth,
+            insecure=CONF[ksconf.CFG_LEGACY_GROUP].insecure,
+            cacert=CONF[ksconf.CFG_LEGACY_GROUP].cafile,
+            key=CONF[ksconf.CFG_LEGACY_GROUP].keyfile,
+            cert=CONF[ksconf.CFG_LEGACY_GROUP].certfile,
+            session=SESSION_CACHE.http)
+
     @property
     def domain_admin_client(self):
         if not self._domain_admin_client:
@@ -181,9 +396,10 @@ class KeystoneClientV3(object):
     def trustee_domain_id(self):
         if not self._trustee_domain_id:
             try:
-                access = self.domain_admin_auth.get_access(
-                    self.domain_admin_session
-                )
+                # The session comes first, as it may bring the already
+                # authenticated plugin from the process wide cache.
+                session = self.domain_admin_session
+                access = self.domain_admin_auth.get_access(session)
             except kc_exception.Unauthorized:
                 msg = "Keystone client authentication failed"
                 LOG.error(msg)
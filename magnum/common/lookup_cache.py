@@ -0,0 +1,151 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide cache of OpenStack resource lookups.
+
+Building the Heat parameters of a cluster resolves keypairs, networks,
+subnets, endpoints and regions through the OpenStack APIs, for every stack
+created or updated. These change rarely, so the results are kept for
+``[drivers]/lookup_cache_ttl`` seconds, per resource type, and lookups of
+missing resources for ``[drivers]/lookup_negative_cache_ttl`` seconds.
+
+Entries are scoped by what the resource visibility depends on: keypairs
+belong to a user, networks, subnets and the service catalog are seen
+through a project, and the regions are the same for everyone. Contexts
+authenticating with a trust are scoped by the trust, which fixes both the
+trustor and the project. Lookups made with a context whose scope is not
+known, such as the admin context, are not cached.
+"""
+
+import functools
+import threading
+import time
+
+import magnum.conf
+
+CONF = magnum.conf.CONF
+
+
+def global_scope(context):
+    return ()
+
+
+def project_scope(context):
+    """Return the project the context is scoped to, None if unknown."""
+    if context is None:
+        return None
+    if context.trust_id:
+        return ('trust', context.trust_id)
+    return context.project_id
+
+
+def user_scope(context):
+    """Return the user and project of the context, None if unknown."""
+    if context is None:
+        return None
+    if context.trust_id:
+        return ('trust', context.trust_id)
+    if not context.project_id or not context.user_id:
+        return None
+    return (context.project_id, context.user_id)
+
+
+class LookupCache(object):
+    """Results of OpenStack lookups, per resource type and scope."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, resource_type, key, load, negative=()):
+        """Return the cached result of load, calling it if needed.
+
+        :param resource_type: the resource type, selecting the TTL.
+        :param key: the key of the lookup within the resource type.
+        :param load: a callable doing the lookup.
+        :param negative: the exceptions meaning that the resource was not
+                         found, cached and raised again until they expire.
+        """
+        key = (resource_type, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                expires, value, error = entry
+            else:
+                self._entries.pop(key, None)
+                self.misses += 1
+                entry = None
+        if entry is not None:
+            if error is not None:
+                raise error.with_traceback(None)
+            return value
+
+        try:
+            value = load()
+        except negative as e:
+            self._set(key, CONF.drivers.lookup_negative_cache_ttl, None, e)
+            raise
+        self._set(key, CONF.drivers.lookup_cache_ttl.get(resource_type),
+                  value, None)
+        return value
+
+    def _set(self, key, ttl, value, error):
+        if not ttl:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, error)
+
+    def invalidate(self, resource_type, key):
+        with self._lock:
+            self._entries.pop((resource_type, key), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries)}
+
+
+LOOKUPS = LookupCache()
+
+
+def cached(resource_type, scope, negative=()):
+    """Cache the results of a lookup function taking a context first.
+
+    :param resource_type: the resource type, selecting the TTL.
+    :param scope: a callable returning the part of the context the
+                  result depends on, or None if the result is not to be
+                  cached.
+    :param negative: the exceptions meaning that the resource was not found.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(context, *args, **kwargs):
+            scope_key = scope(context)
+            if scope_key is None:
+                return func(context, *args, **kwargs)
+            key = (func.__module__, func.__name__, scope_key, args,
+                   tuple(sorted(kwargs.items())))
+            return LOOKUPS.get_or_load(
+                resource_type, key,
+                lambda: func(context, *args, **kwargs), negative=negative)
+        return wrapper
+    return decorator
@@ -18,6 +18,7 @@ from oslo_utils import uuidutils
 
 from magnum.common import clients
 from magnum.common import exception
+from magnum.common import lookup_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -55,6 +56,39 @@ def delete_floatingip(context, fix_port_id, cluster):
                                           msg=str(e))
 
 
+# Number of ports whose floating IPs are listed in a single request, to
+# keep the query string short.
+FLOATINGIP_PORTS_PER_REQUEST = 50
+
+
+def delete_floatingips(context, port_ids, cluster):
+    """Deletes the floating IPs associated with the given ports.
+
+    Same as delete_floatingip, with the floating IPs of many ports looked up
+    in a few requests.
+    """
+    pattern = (r'Floating IP for Kubernetes .+ from cluster %s$' %
+               cluster.uuid)
+    port_ids = list(port_ids)
+
+    try:
+        n_client = clients.OpenStackClients(context).neutron()
+        for i in range(0, len(port_ids), FLOATINGIP_PORTS_PER_REQUEST):
+            fips = n_client.list_floatingips(
+                port_id=port_ids[i:i + FLOATINGIP_PORTS_PER_REQUEST])
+            for fip in fips["floatingips"]:
+                if re.match(pattern, fip.get("description", "")):
+                    LOG.info("Deleting floating ip %s for cluster %s",
+                             fip["id"], cluster.uuid)
+                    n_client.delete_floatingip(fip["id"])
+    except Exception as e:
+        raise exception.PreDeletionFailed(cluster_uuid=cluster.uuid,
+                                          msg=str(e))
+
+
+@lookup_cache.cached('network', lookup_cache.project_scope,
+                     negative=(exception.ExternalNetworkNotFound,
+                               exception.FixedNetworkNotFound))
 def get_network(context, network, source, target, external):
     nets = []
     n_client = clients.OpenStackClients(context).neutron()
@@ -96,6 +130,8 @@ def get_fixed_network_name(context, network):
         return network
 
 
+@lookup_cache.cached('subnet', lookup_cache.project_scope,
+                     negative=(exception.FixedSubnetNotFound,))
 def get_subnet(context, subnet, source, target):
     nets = []
     n_client = clients.OpenStackClients(context).neutron()
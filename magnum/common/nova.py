@@ -16,18 +16,25 @@ from oslo_config import cfg
 from oslo_log import log as logging
 
 from magnum.common import clients
+from magnum.common import lookup_cache
 from novaclient import exceptions as nova_exception
 
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
 
+@lookup_cache.cached('keypair', lookup_cache.user_scope,
+                     negative=(nova_exception.NotFound,))
+def _get_public_key(context, keypair_ident):
+    n_client = clients.OpenStackClients(context).nova()
+    keypair = n_client.keypairs.get(keypair_ident)
+    # no spaces or break lines at the end, single line string
+    return keypair.public_key.strip()
+
+
 def get_ssh_key(context, keypair_ident):
     try:
-        n_client = clients.OpenStackClients(context).nova()
-        keypair = n_client.keypairs.get(keypair_ident)
-        # no spaces or break lines at the end, single line string
-        return keypair.public_key.strip()
+        return _get_public_key(context, keypair_ident)
     except nova_exception.NotFound:
         # we don't have a way to tell if the keypair doesn't
         # exist or the cluster is already creted
@@ -14,6 +14,8 @@
 import re
 import time
 
+import futurist
+from futurist import waiters
 import heatclient.exc as heat_exc
 from osc_lib import exceptions as osc_exc
 from oslo_config import cfg
@@ -28,51 +30,93 @@ LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
 
-def wait_for_lb_deleted(octavia_client, deleted_lbs):
-    """Wait for the loadbalancers to be deleted.
+# Delays between two status checks of a load balancer being deleted, in
+# seconds, doubling from the first to the last.
+LB_POLL_INTERVAL = 0.5
+LB_POLL_MAX_INTERVAL = 8
+
+
+def wait_for_lb_deleted(octavia_client, lb_id, deadline):
+    """Wait for a loadbalancer to be deleted.
 
     Load balancer deletion API in Octavia is asynchronous so that the called
     needs to wait if it wants to guarantee the load balancer to be deleted.
-    The timeout is necessary to avoid waiting infinitely.
+    The deadline is necessary to avoid waiting infinitely.
     """
-    timeout = CONF.cluster.pre_delete_lb_timeout
-    start_time = time.time()
+    interval = LB_POLL_INTERVAL
 
     while True:
-        lbs = octavia_client.load_balancer_list().get("loadbalancers", [])
-        lbIDs = set(
-            [lb["id"]
-             for lb in lbs if lb["provisioning_status"] != "DELETED"]
-        )
-        if not (deleted_lbs & lbIDs):
-            break
-
-        if (time.time() - timeout) > start_time:
-            raise Exception("Timeout waiting for the load balancers "
-                            "%s to be deleted." % deleted_lbs)
-
-        time.sleep(1)
-
-
-def _delete_loadbalancers(context, lbs, cluster, octavia_client,
-                          remove_fip=False, cascade=True):
-    candidates = set()
+        try:
+            lb = octavia_client.load_balancer_show(lb_id)
+        except osc_exc.NotFound:
+            return
+        if lb["provisioning_status"] == "DELETED":
+            return
 
-    for lb in lbs:
-        status = lb["provisioning_status"]
-        if status not in ["PENDING_DELETE", "DELETED"]:
-            LOG.info("Deleting load balancer %s for cluster %s",
-                     lb["id"], cluster.uuid)
-            octavia_client.load_balancer_delete(lb["id"], cascade=cascade)
-            candidates.add(lb["id"])
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise Exception("Timeout waiting for the load balancer "
+                            "%s to be deleted." % lb_id)
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, LB_POLL_MAX_INTERVAL)
+
+
+def _delete_loadbalancer(octavia_client_adm, octavia_client, lb, cluster,
+                         deadline, cascade=True):
+    if lb["provisioning_status"] != "PENDING_DELETE":
+        LOG.info("Deleting load balancer %s for cluster %s",
+                 lb["id"], cluster.uuid)
+        octavia_client_adm.load_balancer_delete(lb["id"], cascade=cascade)
+    wait_for_lb_deleted(octavia_client, lb["id"], deadline)
+
+
+def _delete_loadbalancers(lbs, cluster, octavia_client_adm, octavia_client,
+                          cascade=True):
+    """Delete the load balancers, a few at a time, and wait for them."""
+    deadline = time.time() + CONF.cluster.pre_delete_lb_timeout
+    with futurist.GreenThreadPoolExecutor(
+            max_workers=CONF.cluster.pre_delete_lb_workers) as executor:
+        futures = [executor.submit(_delete_loadbalancer, octavia_client_adm,
+                                   octavia_client, lb, cluster, deadline,
+                                   cascade=cascade)
+                   for lb in lbs]
+        waiters.wait_for_all(futures)
+    for future in futures:
+        future.result()
+
+
+def _get_stack_loadbalancers(heat_client, octavia_client, cluster):
+    """Return the load balancers created for Kubernetes api/etcd."""
+    lb_resource_type = "Magnum::Optional::Neutron::LBaaS::LoadBalancer"
 
-            if remove_fip:
-                neutron.delete_floatingip(context, lb["vip_port_id"], cluster)
+    # NOTE (brtknr): If stack has been deleted, cluster fails to delete
+    # because stack_id resolves to None. Return if that is the case.
+    if not cluster.stack_id:
+        return []
 
-    return candidates
+    lbs = []
+    try:
+        lb_resources = heat_client.resources.list(
+            cluster.stack_id, nested_depth=2,
+            filters={"type": lb_resource_type})
+    except heat_exc.HTTPNotFound:
+        # NOTE(mnaser): It's possible that the stack has been deleted
+        #               but Magnum still has a `stack_id` pointing.
+        return []
+    for lb_res in lb_resources:
+        lb_id = lb_res.physical_resource_id
+        if not lb_id:
+            continue
+        try:
+            lb = octavia_client.load_balancer_show(lb_id)
+            lbs.append(lb)
+        except osc_exc.NotFound:
+            continue
+    return lbs
 
 
-def delete_loadbalancers(context, cluster):  # noqa: C901
+def delete_loadbalancers(context, cluster):
     """Delete loadbalancers for the cluster.
 
     The following load balancers are deleted:
@@ -81,12 +125,10 @@ def delete_loadbalancers(context, cluster):  # noqa: C901
     - The load balancers created for Kubernetes API and etcd for HA cluster.
     """
     pattern = (r'Kubernetes .+ from cluster %s' % cluster.uuid)
-    lb_resource_type = "Magnum::Optional::Neutron::LBaaS::LoadBalancer"
 
     adm_ctx = magnum_context.get_admin_context()
     adm_clients = clients.OpenStackClients(adm_ctx)
     user_clients = clients.OpenStackClients(context)
-    candidates = set()
 
     try:
         octavia_client_adm = adm_clients.octavia()
@@ -96,42 +138,28 @@ def delete_loadbalancers(context, cluster):  # noqa: C901
         # Get load balancers created for service/ingress
         lbs = octavia_client.load_balancer_list().get("loadbalancers", [])
         lbs = [lb for lb in lbs if re.match(pattern, lb["description"])]
-        deleted = _delete_loadbalancers(context, lbs, cluster,
-                                        octavia_client_adm, remove_fip=True)
-        candidates.update(deleted)
-
-        # NOTE (brtknr): If stack has been deleted, cluster fails to delete
-        # because stack_id resolves to None. Return if that is the case.
-        if not cluster.stack_id:
-            return
-
-        # Get load balancers created for Kubernetes api/etcd
-        lbs = []
-        try:
-            lb_resources = heat_client.resources.list(
-                cluster.stack_id, nested_depth=2,
-                filters={"type": lb_resource_type})
-        except heat_exc.HTTPNotFound:
-            # NOTE(mnaser): It's possible that the stack has been deleted
-            #               but Magnum still has a `stack_id` pointing.
-            return
-        for lb_res in lb_resources:
-            lb_id = lb_res.physical_resource_id
-            if not lb_id:
-                continue
-            try:
-                lb = octavia_client.load_balancer_show(lb_id)
+        lbs = [lb for lb in lbs if lb["provisioning_status"] != "DELETED"]
+
+        # The floating IPs are looked up by the VIP ports, which go away
+        # with the load balancers.
+        fip_ports = [lb["vip_port_id"] for lb in lbs
+                     if lb["provisioning_status"] != "PENDING_DELETE"]
+        if fip_ports:
+            neutron.delete_floatingips(context, fip_ports, cluster)
+
+        lb_ids = {lb["id"] for lb in lbs}
+        for lb in _get_stack_loadbalancers(heat_client, octavia_client,
+                                           cluster):
+            if (lb["id"] not in lb_ids and
+                    lb["provisioning_status"] != "DELETED"):
                 lbs.append(lb)
-            except osc_exc.NotFound:
-                continue
-        deleted = _delete_loadbalancers(context, lbs, cluster,
-                                        octavia_client_adm, remove_fip=False)
-        candidates.update(deleted)
+                lb_ids.add(lb["id"])
 
-        if not candidates:
+        if not lbs:
             return
 
-        wait_for_lb_deleted(octavia_client, candidates)
+        _delete_loadbalancers(lbs, cluster, octavia_client_adm,
+                              octavia_client)
     except Exception as e:
         raise exception.PreDeletionFailed(cluster_uuid=cluster.uuid,
                                           msg=str(e))
@@ -15,8 +15,14 @@
 
 """Policy Engine For magnum."""
 
+import collections
+from collections import abc
+import re
+import threading
+
 import decorator
 from oslo_config import cfg
+from oslo_policy import _checks
 from oslo_policy import opts
 from oslo_policy import policy
 from oslo_utils import importutils
@@ -37,6 +43,212 @@ DEFAULT_POLICY_FILE = 'policy.yaml'
 opts.set_defaults(CONF, DEFAULT_POLICY_FILE)
 
 
+_TARGET_KEY = re.compile(r'%\((?P<key>[^)]+)\)')
+# The credentials deciding whether the scope of a token suits a rule.
+_SCOPE_CREDENTIALS = ('system_scope', 'system', 'domain_id', 'project_id')
+_MISSING = object()
+
+
+class LazyTarget(abc.Mapping):
+    """A policy target getting its values when a rule reads them.
+
+    :param values: a mapping of the values known already.
+    :param lazy: a dict of callables returning the other values.
+    """
+
+    def __init__(self, values=None, lazy=None):
+        self._values = values if values is not None else {}
+        self._lazy = dict(lazy or {})
+
+    def __getitem__(self, key):
+        if key in self._lazy:
+            if not isinstance(self._values, dict):
+                self._values = dict(self._values)
+            self._values[key] = self._lazy.pop(key)()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(set(self._values) | set(self._lazy))
+
+    def __len__(self):
+        return len(set(self._values) | set(self._lazy))
+
+
+def object_target(obj):
+    """Return the policy target of an object, as its as_dict() would be.
+
+    The attributes are read only when a rule uses them, so that checking a
+    rule on a cluster does not load its nodegroups.
+    """
+    keys = [k for k in obj.fields if obj.obj_attr_is_set(k)]
+    keys.extend(getattr(obj, 'as_dict_properties', ()))
+    return LazyTarget(lazy={k: (lambda k=k: getattr(obj, k)) for k in keys})
+
+
+def _references(rules, check, seen):
+    """Return the credential and target keys a check reads, None if unknown.
+
+    Only the checks comparing credentials with target values can be told
+    apart, a rule using others, such as http checks, is never cached.
+    """
+    check_type = type(check)
+    if check_type in (_checks.TrueCheck, _checks.FalseCheck):
+        return set(), set()
+    if check_type is _checks.NotCheck:
+        return _references(rules, check.rule, seen)
+    if check_type in (_checks.AndCheck, _checks.OrCheck):
+        credentials, target = set(), set()
+        for rule in check.rules:
+            refs = _references(rules, rule, seen)
+            if refs is None:
+                return None
+            credentials |= refs[0]
+            target |= refs[1]
+        return credentials, target
+    if check_type is _checks.RuleCheck:
+        if check.match in seen:
+            return set(), set()
+        try:
+            # As evaluated, the rules may fall back to a default one.
+            rule = rules[check.match]
+        except KeyError:
+            return set(), set()
+        return _references(rules, rule, seen | {check.match})
+    if check_type in (_checks.RoleCheck, _checks.GenericCheck):
+        target = set(m.group('key') for m in _TARGET_KEY.finditer(
+            check.match))
+        if check_type is _checks.RoleCheck:
+            return {'roles'}, target
+        return {check.kind.split('.')[0]}, target
+    return None
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(v) for v in value)
+        return items if isinstance(value, (list, tuple)) else frozenset(items)
+    if isinstance(value, abc.Mapping):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    hash(value)
+    return value
+
+
+class PolicyDecisionCache(object):
+    """Decisions of the policy rules, dropped when the rules are reloaded.
+
+    A decision is looked up by the rule, and by the values of the
+    credentials and of the target attributes the rule reads, so that
+    requests from the same user on the same resource share it. The least
+    recently used decisions beyond ``policy_decision_cache_size`` are
+    evicted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._decisions = collections.OrderedDict()
+        self._references = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, enforcer, rule, target, credentials):
+        """Return the key of a decision, None if it is not to be cached."""
+        if not CONF.policy_decision_cache_size or not isinstance(rule, str):
+            return None
+        with self._lock:
+            refs = self._references.get(rule, _MISSING)
+        if refs is _MISSING:
+            refs = _references(enforcer.rules, _checks.RuleCheck('rule', rule),
+                               set())
+            if refs is not None:
+                refs = (tuple(sorted(refs[0] | set(_SCOPE_CREDENTIALS))),
+                        tuple(sorted(refs[1])))
+            with self._lock:
+                self._references[rule] = refs
+        if refs is None:
+            return None
+        try:
+            return (rule,
+                    tuple(_freeze(credentials.get(k, _MISSING))
+                          for k in refs[0]),
+                    tuple(_freeze(target.get(k, _MISSING)) for k in refs[1]))
+        except TypeError:
+            # Unhashable values, the rule is evaluated every time.
+            return None
+
+    def get(self, key):
+        with self._lock:
+            decision = self._decisions.get(key, _MISSING)
+            if decision is _MISSING:
+                self.misses += 1
+            else:
+                self._decisions.move_to_end(key)
+                self.hits += 1
+            return decision
+
+    def put(self, key, decision):
+        with self._lock:
+            self._decisions[key] = decision
+            self._decisions.move_to_end(key)
+            while len(self._decisions) > CONF.policy_decision_cache_size:
+                self._decisions.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._decisions.clear()
+            self._references.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._decisions)}
+
+
+class Enforcer(policy.Enforcer):
+    """A policy enforcer caching its decisions until its rules change."""
+
+    def __init__(self, *args, **kwargs):
+        self.decisions = PolicyDecisionCache()
+        super(Enforcer, self).__init__(*args, **kwargs)
+
+    def set_rules(self, rules, overwrite=True, use_conf=False):
+        super(Enforcer, self).set_rules(rules, overwrite=overwrite,
+                                        use_conf=use_conf)
+        self.decisions.clear()
+
+    def register_default(self, default):
+        super(Enforcer, self).register_default(default)
+        self.decisions.clear()
+
+    def cached_enforce(self, rule, target, creds, do_raise=False, exc=None,
+                       *args, **kwargs):
+        """Enforce a rule, or return the decision taken for the same values.
+
+        Takes the arguments of :meth:`oslo_policy.policy.Enforcer.enforce`.
+        """
+        # Reloads the policy file if it changed, dropping the decisions.
+        self.load_rules()
+        key = self.decisions.key(self, rule, target, creds)
+        if key is None:
+            return self.enforce(rule, target, creds, do_raise=do_raise,
+                                exc=exc, *args, **kwargs)
+
+        decision = self.decisions.get(key)
+        if decision is _MISSING:
+            try:
+                decision = self.enforce(rule, target, creds,
+                                        do_raise=do_raise, exc=exc, *args,
+                                        **kwargs)
+            except (exc or policy.PolicyNotAuthorized):
+                self.decisions.put(key, False)
+                raise
+            self.decisions.put(key, decision)
+        elif not decision and do_raise:
+            if exc:
+                raise exc(*args, **kwargs)
+            raise policy.PolicyNotAuthorized(rule, target, creds)
+        return decision
+
+
 # we can get a policy enforcer by this init.
 # oslo policy support change policy rule dynamically.
 # at present, policy.enforce will reload the policy rules when it checks
@@ -62,12 +274,12 @@ def init(policy_file=None, rules=None,
     global _ENFORCER
     if not _ENFORCER:
         # http://docs.openstack.org/developer/oslo.policy/usage.html
-        _ENFORCER = policy.Enforcer(CONF,
-                                    policy_file=policy_file,
-                                    rules=rules,
-                                    default_rule=default_rule,
-                                    use_conf=use_conf,
-                                    overwrite=overwrite)
+        _ENFORCER = Enforcer(CONF,
+                             policy_file=policy_file,
+                             rules=rules,
+                             default_rule=default_rule,
+                             use_conf=use_conf,
+                             overwrite=overwrite)
         _ENFORCER.register_defaults(policies.list_rules())
 
     return _ENFORCER
@@ -82,7 +294,8 @@ def enforce(context, rule=None, target=None,
                              action as possible.
         :param rule: The rule to evaluate.
         :param dict target: As much information about the object being operated
-                            on as possible.
+                            on as possible, as a dict or a mapping such as
+                            :func:`object_target` returns.
         :param do_raise: Whether to raise an exception or not if check
                          fails.
         :param exc: Class of the exception to raise if the check fails.
@@ -104,9 +317,15 @@ def enforce(context, rule=None, target=None,
     if target is None:
         target = {'project_id': context.project_id,
                   'user_id': context.user_id}
-    add_policy_attributes(target)
-    return enforcer.enforce(rule, target, credentials,
-                            do_raise=do_raise, exc=exc, *args, **kwargs)
+    # Only the rules reading the trustee domain ask Keystone for it.
+    target = LazyTarget(target, {'trustee_domain_id': _trustee_domain_id})
+    return enforcer.cached_enforce(rule, target, credentials,
+                                   do_raise=do_raise, exc=exc, *args,
+                                   **kwargs)
+
+
+def _trustee_domain_id():
+    return add_policy_attributes({})['trustee_domain_id']
 
 
 def add_policy_attributes(target):
@@ -126,7 +345,7 @@ def check_is_admin(context):
     init()
     target = {}
     credentials = context.to_dict()
-    return _ENFORCER.enforce('context_is_admin', target, credentials)
+    return _ENFORCER.cached_enforce('context_is_admin', target, credentials)
 
 
 def enforce_wsgi(api_name, act=None):
@@ -24,10 +24,11 @@ __all__ = [
     'get_client',
     'get_server',
     'get_notifier',
+    'get_notification_listener',
 ]
 
 import socket
-
+import threading
 
 import oslo_messaging as messaging
 from oslo_messaging.rpc import dispatcher
@@ -36,6 +37,7 @@ from oslo_utils import importutils
 
 from magnum.common import context as magnum_context
 from magnum.common import exception
+from magnum.common import keystone
 import magnum.conf
 
 profiler = importutils.try_import("osprofiler.profiler")
@@ -105,12 +107,68 @@ class RequestContextSerializer(messaging.Serializer):
         return self._base.deserialize_entity(context, entity)
 
     def serialize_context(self, context):
-        return context.to_dict()
+        values = context.to_dict()
+        measure = CONF.rpc_context_size_metrics
+        compacted = False
+        omitted = 0
+        if CONF.rpc_compact_context and values.get('auth_token_info'):
+            # The token body holds the whole service catalog, the
+            # receiving services look it up by the token instead.
+            compacted = True
+            if measure:
+                omitted = len(jsonutils.dumps(values['auth_token_info']))
+            values['auth_token_info'] = None
+            values['auth_token_info_omitted'] = True
+        size = len(jsonutils.dumps(values)) if measure else None
+        CONTEXT_METRICS.record(compacted, size, omitted)
+        return values
 
     def deserialize_context(self, context):
         return magnum_context.RequestContext.from_dict(context)
 
 
+class ContextMetrics(object):
+    """Request contexts serialized for RPC by this process.
+
+    Their sizes are only measured with ``[DEFAULT]/rpc_context_size_metrics``
+    enabled, ``measured`` counting the contexts the byte counts cover.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def record(self, compacted, size=None, omitted=0):
+        with self._lock:
+            self.contexts += 1
+            if compacted:
+                self.compacted += 1
+            if size is not None:
+                self.measured += 1
+                self.bytes += size
+                self.omitted_bytes += omitted
+
+    def clear(self):
+        with self._lock:
+            self.contexts = 0
+            self.compacted = 0
+            self.measured = 0
+            self.bytes = 0
+            self.omitted_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'contexts': self.contexts,
+                    'compacted': self.compacted,
+                    'measured': self.measured,
+                    'bytes': self.bytes,
+                    'omitted_bytes': self.omitted_bytes,
+                    'token_info_cache': keystone.TOKEN_INFO.stats()}
+
+
+CONTEXT_METRICS = ContextMetrics()
+
+
 class ProfilerRequestContextSerializer(RequestContextSerializer):
     def serialize_context(self, context):
         _context = super(ProfilerRequestContextSerializer,
@@ -176,3 +234,13 @@ def get_notifier(service='container-infra', host=None, publisher_id=None):
     if not publisher_id:
         publisher_id = "%s.%s" % (service, host or myhost)
     return NOTIFIER.prepare(publisher_id=publisher_id)
+
+
+def get_notification_listener(targets, endpoints, pool=None,
+                              executor='eventlet'):
+    transport = messaging.get_notification_transport(CONF)
+    return messaging.get_notification_listener(transport,
+                                               targets,
+                                               endpoints,
+                                               executor=executor,
+                                               pool=pool)
@@ -14,18 +14,28 @@
 
 """Common RPC service and API tools for Magnum."""
 
+import collections
+import threading
+import time
+
+import futurist
+from futurist import waiters
+from oslo_log import log as logging
 import oslo_messaging as messaging
 from oslo_service import service
 
 from magnum.common import profiler
 from magnum.common import rpc
+from magnum.common.x509 import key_pool
 import magnum.conf
 from magnum.objects import base as objects_base
+from magnum.service import heat_notification
 from magnum.service import periodic
 from magnum.servicegroup import magnum_service_periodic as servicegroup
 
 
 CONF = magnum.conf.CONF
+LOG = logging.getLogger(__name__)
 
 
 class Service(service.Service):
@@ -40,20 +50,33 @@ class Service(service.Service):
         )
 
         self.binary = binary
+        self._listener = None
         profiler.setup(binary, CONF.host)
 
     def start(self):
+        # Fill the RSA key pool of this worker ahead of the first
+        # certificate it issues.
+        key_pool.start()
         self._server.start()
+        if self._listener:
+            self._listener.start()
 
     def create_periodic_tasks(self):
         if CONF.periodic_enable:
             periodic.setup(CONF, self.tg)
         servicegroup.setup(CONF, self.binary, self.tg)
 
+    def create_notification_listener(self):
+        if CONF.cluster_heat.stack_notifications_enabled:
+            self._listener = heat_notification.get_listener()
+
     def stop(self):
         if self._server:
             self._server.stop()
             self._server.wait()
+        if self._listener:
+            self._listener.stop()
+            self._listener.wait()
         super(Service, self).stop()
 
     @classmethod
@@ -62,24 +85,125 @@ class Service(service.Service):
         return service_obj
 
 
+class CallMetrics(object):
+    """Latency of the RPC calls and casts made by this process, per method."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods = collections.defaultdict(
+            lambda: {'count': 0, 'errors': 0, 'total': 0.0, 'max': 0.0})
+
+    def record(self, method, elapsed, error=False):
+        with self._lock:
+            entry = self._methods[method]
+            entry['count'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+            if error:
+                entry['errors'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._methods.clear()
+
+    def stats(self):
+        """Return the calls, errors, mean and max latency in ms per method."""
+        with self._lock:
+            return {method: {'count': entry['count'],
+                             'errors': entry['errors'],
+                             'mean_ms': entry['total'] * 1000 / entry['count'],
+                             'max_ms': entry['max'] * 1000}
+                    for method, entry in self._methods.items()}
+
+
+CALL_METRICS = CallMetrics()
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+_CAST_EXECUTOR = None
+_CAST_FUTURES = set()
+
+
+def _get_client(topic, server, timeout):
+    """Return the RPC client of a target, shared by the whole process."""
+    key = (topic, server, timeout)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        # A new transport, after rpc.init() was called again, needs new
+        # clients.
+        if client is None or client.transport is not rpc.TRANSPORT:
+            target = messaging.Target(topic=topic, server=server)
+            client = rpc.get_client(
+                target,
+                serializer=objects_base.MagnumObjectSerializer(),
+                timeout=timeout
+            )
+            _CLIENTS[key] = client
+    return client
+
+
+def _get_cast_executor():
+    global _CAST_EXECUTOR
+    with _CLIENTS_LOCK:
+        if _CAST_EXECUTOR is None:
+            _CAST_EXECUTOR = futurist.GreenThreadPoolExecutor(
+                max_workers=CONF.api.async_rpc_cast_workers)
+        return _CAST_EXECUTOR
+
+
+def wait_for_casts(timeout=None):
+    """Wait for the casts sent in the background to be sent."""
+    waiters.wait_for_all(list(_CAST_FUTURES), timeout=timeout)
+
+
 class API(object):
     def __init__(self, context=None, topic=None, server=None,
-                 timeout=None):
+                 timeout=None, async_casts=False):
         self._context = context
         if topic is None:
             topic = ''
-        target = messaging.Target(topic=topic, server=server)
-        self._client = rpc.get_client(
-            target,
-            serializer=objects_base.MagnumObjectSerializer(),
-            timeout=timeout
-        )
+        self._client = _get_client(topic, server, timeout)
+        self._async_casts = async_casts
 
     def _call(self, method, *args, **kwargs):
-        return self._client.call(self._context, method, *args, **kwargs)
+        return self._call_with_context(self._context, method, *args,
+                                       **kwargs)
+
+    def _call_with_context(self, context, method, *args, **kwargs):
+        start = time.monotonic()
+        error = True
+        try:
+            result = self._client.call(context, method, *args, **kwargs)
+            error = False
+            return result
+        finally:
+            CALL_METRICS.record(method, time.monotonic() - start, error)
 
     def _cast(self, method, *args, **kwargs):
-        self._client.cast(self._context, method, *args, **kwargs)
+        if not self._async_casts:
+            self._send_cast(self._context, method, *args, **kwargs)
+            return
+        future = _get_cast_executor().submit(
+            self._send_cast, self._context, method, *args, **kwargs)
+        _CAST_FUTURES.add(future)
+        future.add_done_callback(self._cast_done)
+
+    def _send_cast(self, context, method, *args, **kwargs):
+        start = time.monotonic()
+        error = True
+        try:
+            self._client.cast(context, method, *args, **kwargs)
+            error = False
+        finally:
+            CALL_METRICS.record('cast:%s' % method,
+                                time.monotonic() - start, error)
+
+    @staticmethod
+    def _cast_done(future):
+        _CAST_FUTURES.discard(future)
+        if future.exception() is not None:
+            LOG.error('Failed to send an RPC cast in the background: %s',
+                      future.exception())
 
     def echo(self, message):
         self._cast('echo', message=message)
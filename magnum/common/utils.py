@@ -299,11 +299,26 @@ def generate_password(length, symbolgroups=None):
     return ''.join(password)
 
 
+# Contents of the OpenStack CA files read, with their modification time.
+_OPENSTACK_CA = {}
+
+
 def get_openstack_ca():
     openstack_ca_file = CONF.drivers.openstack_ca_file
 
     if openstack_ca_file:
+        # The file is only read again when it changes.
+        try:
+            mtime = os.stat(openstack_ca_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = _OPENSTACK_CA.get(openstack_ca_file)
+        if mtime is not None and cached and cached[0] == mtime:
+            return cached[1]
         with open(openstack_ca_file) as fd:
-            return fd.read()
+            openstack_ca = fd.read()
+        if mtime is not None:
+            _OPENSTACK_CA[openstack_ca_file] = (mtime, openstack_ca)
+        return openstack_ca
     else:
         return ''
@@ -0,0 +1,130 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Long lived WSGI workers for the Magnum API service."""
+
+import os
+import signal
+
+from oslo_log import log as logging
+from oslo_service import service
+from oslo_service import sslutils
+from oslo_service import wsgi
+
+from magnum.common import rpc_service
+import magnum.conf
+
+CONF = magnum.conf.CONF
+LOG = logging.getLogger(__name__)
+
+
+class _CountedResponse(object):
+    """WSGI response calling back once the server has sent it."""
+
+    def __init__(self, response, on_close):
+        self._response = response
+        self._on_close = on_close
+
+    def __iter__(self):
+        return iter(self._response)
+
+    def close(self):
+        try:
+            if hasattr(self._response, 'close'):
+                self._response.close()
+        finally:
+            self._on_close()
+
+
+class WSGIService(service.ServiceBase):
+    """Serve a WSGI application from a pool of green threads.
+
+    The listening socket is opened when the service is created, so that it
+    is shared by every worker forked by the process launcher. Each worker
+    keeps its database and client connections for its whole life, and is
+    recycled once it has served ``max_requests`` requests.
+    """
+
+    def __init__(self, name, app, host, port, pool_size=None,
+                 max_requests=0, ssl_files=None):
+        self.name = name
+        self.max_requests = max_requests
+        self.served = 0
+        if ssl_files:
+            # oslo.service reads the certificate from the [ssl] group, take
+            # it from the [api] options unless the group sets it already.
+            sslutils.register_opts(CONF)
+            cert_file, key_file = ssl_files
+            CONF.set_default('cert_file', cert_file, group='ssl')
+            CONF.set_default('key_file', key_file, group='ssl')
+        self.server = wsgi.Server(CONF, name, self._app(app),
+                                  host=host, port=port, pool_size=pool_size,
+                                  use_ssl=bool(ssl_files))
+
+    def _app(self, app):
+        if not self.max_requests:
+            return app
+
+        def counted_app(environ, start_response):
+            # The request is counted once its response has been sent, when
+            # the server closes it, so that the last one is not cut short.
+            try:
+                response = app(environ, start_response)
+            except Exception:
+                self._request_done()
+                raise
+            return _CountedResponse(response, self._request_done)
+        return counted_app
+
+    def _request_done(self):
+        self.served += 1
+        if self.served == self.max_requests:
+            LOG.info('%(name)s worker %(pid)s served %(count)d requests, '
+                     'replacing it', {'name': self.name, 'pid': os.getpid(),
+                                      'count': self.served})
+            # The launcher stops the worker gracefully, letting in-flight
+            # requests finish, and forks a new one in its place.
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    @property
+    def host(self):
+        return self.server.host
+
+    @property
+    def port(self):
+        return self.server.port
+
+    def start(self):
+        self.served = 0
+        self.server.start()
+
+    def stop(self):
+        self.server.stop()
+
+    def wait(self):
+        self.server.wait()
+        # Send the casts the last requests left in the background.
+        rpc_service.wait_for_casts()
+
+    def reset(self):
+        self.server.reset()
+
+
+def serve(name, app, host, port, workers, ssl_files=None):
+    """Fork the API workers and wait for them."""
+    server = WSGIService(name, app, host, port,
+                         pool_size=CONF.api.worker_pool_size,
+                         max_requests=CONF.api.max_requests_per_worker,
+                         ssl_files=ssl_files)
+    launcher = service.ProcessLauncher(CONF, restart_method='reload')
+    launcher.launch_service(server, workers=workers)
+    launcher.wait()
@@ -0,0 +1,176 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Pool of RSA private keys generated ahead of time.
+
+Generating an RSA key takes from tens of milliseconds to seconds of CPU
+depending on its size, and a cluster needs several of them. The pool keeps
+``[x509]/rsa_key_pool_size`` keys of every size listed in
+``[x509]/rsa_key_pool_key_sizes`` ready, refilled by a native thread so that
+the eventlet hub keeps serving requests meanwhile.
+"""
+
+import collections
+import os
+import time
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from eventlet import patcher
+from oslo_log import log as logging
+
+import magnum.conf
+
+# The refill thread must be a real OS thread, not a greenthread.
+threading = patcher.original('threading')
+
+CONF = magnum.conf.CONF
+LOG = logging.getLogger(__name__)
+
+PUBLIC_EXPONENT = 65537
+
+
+def _generate(key_size):
+    return rsa.generate_private_key(public_exponent=PUBLIC_EXPONENT,
+                                    key_size=key_size)
+
+
+class KeyPool(object):
+    """RSA private keys of the configured sizes, refilled in background."""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # Also run in the child after a fork: the refill thread does not
+        # survive it, the condition may have been held by that thread, and
+        # the keys of the parent must not be handed out by its children.
+        self._cond = threading.Condition()
+        self._keys = collections.defaultdict(collections.deque)
+        self._thread = None
+        self._token = None
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_time = 0.0
+        self.last_refill_time = 0.0
+
+    @staticmethod
+    def _capacity():
+        return CONF.x509.rsa_key_pool_size
+
+    @staticmethod
+    def _key_sizes():
+        return (CONF.x509.rsa_key_pool_key_sizes or
+                [CONF.x509.rsa_key_size])
+
+    def start(self):
+        """Start filling the pool, unless it is disabled."""
+        if not self._capacity():
+            return
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._token = token = object()
+            self._thread = threading.Thread(target=self._refill,
+                                            args=(self._cond, token),
+                                            name='rsa-key-pool', daemon=True)
+            self._thread.start()
+
+    def _next_size(self):
+        for key_size in self._key_sizes():
+            if len(self._keys[key_size]) < self._capacity():
+                return key_size
+        return None
+
+    def _refill(self, cond, token):
+        while True:
+            with cond:
+                key_size = self._next_size()
+                while key_size is None:
+                    cond.wait()
+                    if self._token is not token:
+                        return
+                    key_size = self._next_size()
+            start = time.monotonic()
+            try:
+                key = _generate(key_size)
+            except Exception:
+                LOG.exception('Failed to generate a %d bits RSA key for the '
+                              'key pool', key_size)
+                with cond:
+                    cond.wait(1)
+                continue
+            elapsed = time.monotonic() - start
+            with cond:
+                if self._token is not token:
+                    return
+                self._keys[key_size].append(key)
+                self.refills += 1
+                self.refill_time += elapsed
+                self.last_refill_time = elapsed
+
+    def get(self, key_size):
+        """Return a new RSA private key of the given size.
+
+        Keys are taken from the pool when it has one of this size, and
+        generated on the spot otherwise.
+        """
+        with self._cond:
+            keys = self._keys.get(key_size)
+            key = keys.popleft() if keys else None
+            if key is not None:
+                self.hits += 1
+                self._cond.notify()
+            else:
+                self.misses += 1
+        if key is None:
+            key = _generate(key_size)
+        return key
+
+    def stats(self):
+        with self._cond:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'refills': self.refills,
+                'average_refill_time': (self.refill_time / self.refills
+                                        if self.refills else 0.0),
+                'last_refill_time': self.last_refill_time,
+                'available': {key_size: len(self._keys[key_size])
+                              for key_size in self._key_sizes()},
+            }
+
+    def stop(self):
+        with self._cond:
+            self._token = None
+            self._thread = None
+            self._keys.clear()
+            self._cond.notify_all()
+
+
+POOL = KeyPool()
+os.register_at_fork(after_in_child=POOL._reset)
+
+
+def get_private_key(key_size):
+    """Return a new RSA private key of the given size."""
+    return POOL.get(key_size)
+
+
+def start():
+    """Start pre-generating keys in the background."""
+    POOL.start()
+
+
+def stats():
+    """Return the hit, miss and refill counters of the key pool."""
+    return POOL.stats()
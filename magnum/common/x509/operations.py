@@ -23,6 +23,7 @@ from cryptography import x509
 from oslo_log import log as logging
 
 from magnum.common import exception
+from magnum.common.x509 import key_pool
 from magnum.common.x509 import validator
 import magnum.conf
 
@@ -109,10 +110,7 @@ def _generate_certificate(issuer_name, subject_name, extensions,
     if organization_name and not isinstance(organization_name, six.text_type):
         organization_name = six.text_type(organization_name.decode('utf-8'))
 
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=CONF.x509.rsa_key_size
-    )
+    private_key = key_pool.get_private_key(CONF.x509.rsa_key_size)
 
     # subject name is set as common name
     csr = x509.CertificateSigningRequestBuilder()
@@ -233,10 +231,7 @@ def sign(csr, issuer_name, ca_key, ca_key_password=None,
 
 def generate_csr_and_key(common_name):
     """Return a dict with a new csr, public key and private key."""
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048
-    )
+    private_key = key_pool.get_private_key(2048)
 
     public_key = private_key.public_key()
 
@@ -25,8 +25,10 @@ CONF = magnum.conf.CONF
 
 @profiler.trace_cls("rpc")
 class API(rpc_service.API):
-    def __init__(self, context=None, topic=CONF.conductor.topic):
-        super(API, self).__init__(context=context, topic=topic)
+    def __init__(self, context=None, topic=CONF.conductor.topic,
+                 async_casts=False):
+        super(API, self).__init__(context=context, topic=topic,
+                                  async_casts=async_casts)
 
     # Cluster Operations
 
@@ -138,19 +140,26 @@ class API(rpc_service.API):
     def object_class_action(self, context, objname, objmethod, objver,
                             args, kwargs):
         "Indirection API callback"
-        return self._client.call(context, 'object_class_action',
-                                 objname=objname, objmethod=objmethod,
-                                 objver=objver, args=args, kwargs=kwargs)
+        return self._call_with_context(
+            context, 'object_class_action', objname=objname,
+            objmethod=objmethod, objver=objver, args=args, kwargs=kwargs)
+
+    def object_class_actions(self, context, actions):
+        "Indirection API callback"
+        return self._call_with_context(context, 'object_class_actions',
+                                       actions=actions)
 
     def object_action(self, context, objinst, objmethod, args, kwargs):
         "Indirection API callback"
-        return self._client.call(context, 'object_action', objinst=objinst,
-                                 objmethod=objmethod, args=args, kwargs=kwargs)
+        return self._call_with_context(
+            context, 'object_action', objinst=objinst, objmethod=objmethod,
+            args=args, kwargs=kwargs)
 
     def object_backport(self, context, objinst, target_version):
         "Indirection API callback"
-        return self._client.call(context, 'object_backport', objinst=objinst,
-                                 target_version=target_version)
+        return self._call_with_context(context, 'object_backport',
+                                       objinst=objinst,
+                                       target_version=target_version)
 
     # NodeGroup Operations
 
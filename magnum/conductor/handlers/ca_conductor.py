@@ -19,6 +19,7 @@ from pycadf import cadftaxonomy as taxonomy
 from magnum.common import exception
 from magnum.common import profiler
 from magnum.conductor.handlers.common import cert_manager
+from magnum.conductor import k8s_api
 from magnum.conductor import utils as conductor_utils
 from magnum.drivers.common import driver
 from magnum.i18n import _
@@ -94,6 +95,10 @@ class Handler(object):
             # re-generate the ca certs
             cert_manager.generate_certificates_to_cluster(cluster,
                                                           context=context)
+            # Drop the client certificates and connections made with the
+            # previous CA.
+            cert_manager.delete_client_files(cluster, context=context)
+            k8s_api.invalidate_session(cluster)
             cluster_driver = driver.Driver.get_driver_for_cluster(context,
                                                                   cluster)
             cluster_driver.rotate_ca_certificate(context, cluster)
@@ -12,8 +12,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import futurist
 from heatclient import exc
 from oslo_log import log as logging
+from oslo_utils import timeutils
 from pycadf import cadftaxonomy as taxonomy
 import six
 
@@ -35,11 +37,22 @@ CONF = magnum.conf.CONF
 LOG = logging.getLogger(__name__)
 
 
+def _timed(timings, step, func, *args, **kwargs):
+    watch = timeutils.StopWatch()
+    watch.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[step] = round(watch.elapsed(), 3)
+
+
 @profiler.trace_cls("rpc")
 class Handler(object):
 
     def __init__(self):
         super(Handler, self).__init__()
+        self._setup_executor = futurist.GreenThreadPoolExecutor(
+            max_workers=CONF.conductor.create_setup_workers)
 
     # Cluster Operations
 
@@ -62,15 +75,31 @@ class Handler(object):
             context, cluster, node_count, is_master=False)
         minion_ng.create()
 
+        timings = {}
+        setup = timeutils.StopWatch()
+        setup.start()
         try:
-            # Create trustee/trust and set them to cluster
-            trust_manager.create_trustee_and_trust(osc, cluster)
-            # Generate certificate and set the cert reference to cluster
-            cert_manager.generate_certificates_to_cluster(cluster,
-                                                          context=context)
+            # Create trustee/trust and set them to cluster, while the
+            # certificates are generated.
+            trust_future = self._setup_executor.submit(
+                _timed, timings, 'trust',
+                trust_manager.create_trustee_and_trust, osc, cluster)
+            try:
+                # Generate certificate and set the cert reference to cluster
+                _timed(timings, 'certificates',
+                       cert_manager.generate_certificates_to_cluster,
+                       cluster, context=context,
+                       executor=self._setup_executor)
+            finally:
+                # Both steps are done before the cluster is saved, and a
+                # trust failure is reported first as it used to be.
+                trust_future.result()
+            timings['setup'] = round(setup.elapsed(), 3)
+            LOG.debug('Cluster %(cluster)s setup steps took %(timings)s',
+                      {'cluster': cluster.uuid, 'timings': timings})
             conductor_utils.notify_about_cluster_operation(
                 context, taxonomy.ACTION_CREATE, taxonomy.OUTCOME_PENDING,
-                cluster)
+                cluster, timings=timings)
             # Get driver
             cluster_driver = driver.Driver.get_driver_for_cluster(context,
                                                                   cluster)
@@ -87,7 +116,7 @@ class Handler(object):
             cluster.save()
             conductor_utils.notify_about_cluster_operation(
                 context, taxonomy.ACTION_CREATE, taxonomy.OUTCOME_FAILURE,
-                cluster)
+                cluster, timings=timings)
 
             if isinstance(e, exc.HTTPBadRequest):
                 e = exception.InvalidParameterValue(message=six.text_type(e))
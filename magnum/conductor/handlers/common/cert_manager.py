@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import futurist
+from futurist import waiters
 from oslo_log import log as logging
 from oslo_utils import encodeutils
 import six
@@ -24,7 +26,10 @@ from magnum.common.x509 import operations as x509
 import magnum.conf
 import os
 import shutil
+import ssl
 import tempfile
+import threading
+import time
 
 CONDUCTOR_CLIENT_NAME = six.u('Magnum-Conductor')
 
@@ -97,27 +102,37 @@ def _get_issuer_name(cluster):
     return issuer_name
 
 
-def generate_certificates_to_cluster(cluster, context=None):
+def generate_certificates_to_cluster(cluster, context=None, executor=None):
     """Generate ca_cert and magnum client cert and set to cluster
 
     :param cluster: The cluster to set CA cert and magnum client cert
+    :param executor: futurist executor the etcd and front-proxy CA certs are
+                     generated on, while the cluster CA and the client cert
+                     are generated in the calling thread
     :returns: CA cert uuid and magnum client cert uuid
     """
+    if executor is None:
+        executor = futurist.SynchronousExecutor()
     try:
         issuer_name = _get_issuer_name(cluster)
 
         LOG.debug('Start to generate certificates: %s', issuer_name)
 
-        ca_cert_ref, ca_cert, ca_password = _generate_ca_cert(issuer_name,
-                                                              context=context)
-        etcd_ca_cert_ref, _, _ = _generate_ca_cert(issuer_name,
-                                                   context=context)
-        fp_ca_cert_ref, _, _ = _generate_ca_cert(issuer_name,
-                                                 context=context)
-        magnum_cert_ref = _generate_client_cert(issuer_name,
-                                                ca_cert,
-                                                ca_password,
-                                                context=context)
+        etcd_ca_future = executor.submit(_generate_ca_cert, issuer_name,
+                                         context=context)
+        fp_ca_future = executor.submit(_generate_ca_cert, issuer_name,
+                                       context=context)
+        try:
+            ca_cert_ref, ca_cert, ca_password = _generate_ca_cert(
+                issuer_name, context=context)
+            magnum_cert_ref = _generate_client_cert(issuer_name,
+                                                    ca_cert,
+                                                    ca_password,
+                                                    context=context)
+        finally:
+            waiters.wait_for_all([etcd_ca_future, fp_ca_future])
+        etcd_ca_cert_ref, _, _ = etcd_ca_future.result()
+        fp_ca_cert_ref, _, _ = fp_ca_future.result()
 
         cluster.ca_cert_ref = ca_cert_ref
         cluster.magnum_cert_ref = magnum_cert_ref
@@ -155,24 +170,134 @@ def get_cluster_magnum_cert(cluster, context=None):
     return magnum_cert
 
 
+def _load_cert_chain(ssl_context, certificate, private_key):
+    # SSLContext only loads client certificates from a file, so hand it an
+    # anonymous in-memory one where the platform allows it.
+    chain = encodeutils.safe_encode(private_key + certificate)
+    if hasattr(os, 'memfd_create'):
+        fd = os.memfd_create('magnum-client-cert')
+        try:
+            os.write(fd, chain)
+            ssl_context.load_cert_chain('/proc/self/fd/%d' % fd)
+        finally:
+            os.close(fd)
+    else:
+        with tempfile.NamedTemporaryFile() as chain_file:
+            chain_file.write(chain)
+            chain_file.flush()
+            ssl_context.load_cert_chain(chain_file.name)
+
+
+class ClientCredentials(object):
+    """The CA and the Magnum client certificate of a cluster."""
+
+    def __init__(self, ca_cert, certificate, private_key):
+        self.ca_cert = ca_cert
+        self.certificate = certificate
+        self.private_key = private_key
+        self._ssl_context = None
+        self._lock = threading.Lock()
+
+    @property
+    def ssl_context(self):
+        """An SSL context trusting the cluster CA with the client cert."""
+        with self._lock:
+            if self._ssl_context is None:
+                ssl_context = ssl.create_default_context(cadata=self.ca_cert)
+                _load_cert_chain(ssl_context, self.certificate,
+                                 self.private_key)
+                self._ssl_context = ssl_context
+            return self._ssl_context
+
+
+class ClientCredentialsCache(object):
+    """In-memory cache of the client credentials of the clusters.
+
+    Credentials are looked up by cluster and certificate references, so
+    that a CA rotated on another conductor is fetched again, and expire
+    after ``[cluster]/client_credentials_cache_ttl`` seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cluster, context=None):
+        key = (cluster.ca_cert_ref, cluster.magnum_cert_ref)
+        ttl = CONF.cluster.client_credentials_cache_ttl
+        now = time.monotonic()
+        with self._lock:
+            entry = self._credentials.get(cluster.uuid)
+            if entry is not None and entry[0] == key and now < entry[1]:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        ca_cert = get_cluster_ca_certificate(cluster, context)
+        magnum_cert = get_cluster_magnum_cert(cluster, context)
+        credentials = ClientCredentials(
+            encodeutils.safe_decode(ca_cert.get_certificate()),
+            encodeutils.safe_decode(magnum_cert.get_certificate()),
+            encodeutils.safe_decode(magnum_cert.get_decrypted_private_key()))
+        if ttl:
+            with self._lock:
+                self._credentials = {
+                    uuid: entry for uuid, entry in self._credentials.items()
+                    if now < entry[1]}
+                self._credentials[cluster.uuid] = (key, now + ttl,
+                                                   credentials)
+        return credentials
+
+    def invalidate(self, cluster_uuid):
+        with self._lock:
+            self._credentials.pop(cluster_uuid, None)
+
+    def clear(self):
+        with self._lock:
+            self._credentials.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._credentials)}
+
+
+CLIENT_CREDENTIALS = ClientCredentialsCache()
+
+
+def get_client_credentials(cluster, context=None):
+    """Return the cached client credentials of a cluster."""
+    return CLIENT_CREDENTIALS.get(cluster, context)
+
+
+def create_client_ssl_context(cluster, context=None):
+    """Return an SSL context to connect to the API of a cluster.
+
+    The context is built in memory, no key material is written to disk.
+    """
+    return get_client_credentials(cluster, context).ssl_context
+
+
 def create_client_files(cluster, context=None):
     if not os.path.isdir(CONF.cluster.temp_cache_dir):
         LOG.debug("Certificates will not be cached in the filesystem: they "
                   "will be created as tempfiles.")
-        ca_cert = get_cluster_ca_certificate(cluster, context)
-        magnum_cert = get_cluster_magnum_cert(cluster, context)
+        credentials = get_client_credentials(cluster, context)
 
         ca_file = tempfile.NamedTemporaryFile(mode="w+")
-        ca_file.write(encodeutils.safe_decode(ca_cert.get_certificate()))
+        ca_file.write(credentials.ca_cert)
         ca_file.flush()
 
         key_file = tempfile.NamedTemporaryFile(mode="w+")
-        key_file.write(encodeutils.safe_decode(
-            magnum_cert.get_decrypted_private_key()))
+        key_file.write(credentials.private_key)
         key_file.flush()
 
         cert_file = tempfile.NamedTemporaryFile(mode="w+")
-        cert_file.write(encodeutils.safe_decode(magnum_cert.get_certificate()))
+        cert_file.write(credentials.certificate)
         cert_file.flush()
 
     else:
@@ -185,21 +310,18 @@ def create_client_files(cluster, context=None):
         if not os.path.isdir(cached_cert_dir):
             os.mkdir(cached_cert_dir)
 
-            ca_cert = get_cluster_ca_certificate(cluster, context)
-            magnum_cert = get_cluster_magnum_cert(cluster, context)
+            credentials = get_client_credentials(cluster, context)
 
             ca_file = open(cached_ca_file, "w+")
-            ca_file.write(encodeutils.safe_decode(ca_cert.get_certificate()))
+            ca_file.write(credentials.ca_cert)
             ca_file.flush()
 
             key_file = open(cached_key_file, "w+")
-            key_file.write(encodeutils.safe_decode(
-                magnum_cert.get_decrypted_private_key()))
+            key_file.write(credentials.private_key)
             key_file.flush()
 
             cert_file = open(cached_cert_file, "w+")
-            cert_file.write(
-                encodeutils.safe_decode(magnum_cert.get_certificate()))
+            cert_file.write(credentials.certificate)
             cert_file.flush()
 
             os.chmod(cached_ca_file, 0o600)
@@ -251,6 +373,7 @@ def delete_certificates_from_cluster(cluster, context=None):
 
 
 def delete_client_files(cluster, context=None):
+    CLIENT_CREDENTIALS.invalidate(cluster.uuid)
     cached_cert_dir = os.path.join(CONF.cluster.temp_cache_dir,
                                    cluster.uuid)
     try:
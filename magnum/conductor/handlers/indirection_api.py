@@ -10,6 +10,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import copy
+
 import oslo_messaging as messaging
 
 from magnum.common import profiler
@@ -46,23 +48,41 @@ class Handler(object):
         return (result.obj_to_primitive(target_version=objver)
                 if isinstance(result, base.MagnumObject) else result)
 
+    def object_class_actions(self, context, actions):
+        """Perform several classmethod actions, in order.
+
+        Each action is an (objname, objmethod, objver, args, kwargs) list,
+        the first one failing fails the others.
+        """
+        return [self.object_class_action(context, *action)
+                for action in actions]
+
     def object_action(self, context, objinst, objmethod, args, kwargs):
         """Perform an action on an object."""
-        old_objinst = objinst.obj_clone()
+        # NOTE: Rather than cloning the whole object to diff it afterwards,
+        # remember the values set, copying only the containers an action
+        # could modify in place. The changed fields are forwarded, as well
+        # as those an action saved, which no longer show as changed.
+        old_values = {}
+        for name in objinst.fields:
+            if objinst.obj_attr_is_set(name):
+                value = getattr(objinst, name)
+                if isinstance(value, (dict, list)):
+                    value = copy.copy(value)
+                old_values[name] = value
         result = self._object_dispatch(objinst, objmethod, context,
                                        args, kwargs)
+        changes = objinst.obj_what_changed()
         updates = dict()
-        # NOTE(danms): Diff the object with the one passed to us and
-        # generate a list of changes to forward back
         for name, field in objinst.fields.items():
             if not objinst.obj_attr_is_set(name):
                 # Avoid demand-loading anything
                 continue
-            if (not old_objinst.obj_attr_is_set(name) or
-                    getattr(old_objinst, name) != getattr(objinst, name)):
-                updates[name] = field.to_primitive(objinst, name,
-                                                   getattr(objinst, name))
-        updates['obj_what_changed'] = objinst.obj_what_changed()
+            value = getattr(objinst, name)
+            if (name in changes or name not in old_values or
+                    old_values[name] != value):
+                updates[name] = field.to_primitive(objinst, name, value)
+        updates['obj_what_changed'] = changes
         return updates, result
 
     def object_backport(self, context, objinst, target_version):
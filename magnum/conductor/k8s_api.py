@@ -12,9 +12,115 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import threading
+
+from oslo_log import log as logging
 import requests
+from requests import adapters
+
+from magnum.conductor.handlers.common import cert_manager
+import magnum.conf
+
+CONF = magnum.conf.CONF
+LOG = logging.getLogger(__name__)
+
+
+class _SSLContextAdapter(adapters.HTTPAdapter):
+    """An HTTP adapter connecting with a prebuilt SSL context."""
+
+    def __init__(self, ssl_context, **kwargs):
+        self.ssl_context = ssl_context
+        super(_SSLContextAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super(_SSLContextAdapter, self).init_poolmanager(
+            *args, **kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        # The CA and the client certificate are part of the SSL context,
+        # there are no files for requests to point the connection at.
+        if url.lower().startswith('https'):
+            conn.cert_reqs = 'CERT_REQUIRED'
+
+
+class _ClusterSession(object):
+    """A requests session holding the client certificates of a cluster."""
+
+    def __init__(self, cluster, context):
+        ssl_context = cert_manager.create_client_ssl_context(cluster, context)
+        self.session = requests.Session()
+        adapter = _SSLContextAdapter(ssl_context, pool_connections=1,
+                                     pool_maxsize=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        self.session.close()
 
-from magnum.conductor.handlers.common.cert_manager import create_client_files
+
+class SessionCache(object):
+    """Pooled sessions to the Kubernetes API of the clusters.
+
+    Sessions are kept per cluster and certificate references, so a cluster
+    whose CA was rotated gets a new session even when the rotation happened
+    on another conductor. The least recently used sessions are closed once
+    there are more than ``api_session_cache_size`` of them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = collections.OrderedDict()
+
+    def get(self, cluster, context):
+        key = (cluster.ca_cert_ref, cluster.magnum_cert_ref)
+        with self._lock:
+            entry = self._sessions.get(cluster.uuid)
+            if entry is not None:
+                cached_key, cluster_session = entry
+                if cached_key == key:
+                    self._sessions.move_to_end(cluster.uuid)
+                    return cluster_session.session
+                del self._sessions[cluster.uuid]
+                cluster_session.close()
+
+        cluster_session = _ClusterSession(cluster, context)
+        evicted = []
+        with self._lock:
+            previous = self._sessions.pop(cluster.uuid, None)
+            if previous is not None:
+                evicted.append(previous[1])
+            self._sessions[cluster.uuid] = (key, cluster_session)
+            while (len(self._sessions) >
+                   CONF.kubernetes.api_session_cache_size):
+                evicted.append(self._sessions.popitem(last=False)[1][1])
+        for stale in evicted:
+            stale.close()
+        return cluster_session.session
+
+    def invalidate(self, cluster_uuid):
+        with self._lock:
+            entry = self._sessions.pop(cluster_uuid, None)
+        if entry is not None:
+            LOG.debug('Closing the Kubernetes API session of cluster %s',
+                      cluster_uuid)
+            entry[1].close()
+
+    def clear(self):
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+        for _key, cluster_session in entries:
+            cluster_session.close()
+
+
+SESSION_CACHE = SessionCache()
+
+
+def invalidate_session(cluster):
+    """Drop the cached session of a cluster whose certificates changed."""
+    SESSION_CACHE.invalidate(cluster.uuid)
 
 
 class KubernetesAPI:
@@ -25,28 +131,18 @@ class KubernetesAPI:
     reason behind it is that the native `kubernetes` library does not
     seem to be quite thread-safe at the moment.
 
-    Also, our interactions with the Kubernetes API are happening inside
-    Greenthreads so we don't need to use connection pooling on top of it,
-    in addition to pools not being something that you can disable with
-    the native Kubernetes API.
+    The underlying session of each cluster is shared by every instance,
+    so that the periodic health polling keeps its connections alive
+    instead of doing a TLS handshake with client certificates every time.
     """
 
     def __init__(self, context, cluster):
         self.context = context
         self.cluster = cluster
-
-        # Load certificates for cluster
-        (self.ca_file, self.key_file, self.cert_file) = create_client_files(
-            self.cluster, self.context
-        )
+        self.session = SESSION_CACHE.get(cluster, context)
 
     def _request(self, method, url, json=True):
-        response = requests.request(
-            method,
-            url,
-            verify=self.ca_file.name,
-            cert=(self.cert_file.name, self.key_file.name)
-        )
+        response = self.session.request(method, url)
         response.raise_for_status()
         if json:
             return response.json()
@@ -81,17 +177,3 @@ class KubernetesAPI:
             'GET',
             f"{self.cluster.api_address}/api/v1/namespaces/{namespace}/pods"
         )
-
-    def __del__(self):
-        """Close all of the file descriptions for the certificates
-
-        They are left open by `create_client_files`.
-
-        TODO(mnaser): Use a context manager and avoid having these here.
-        """
-        if hasattr(self, 'ca_file'):
-            self.ca_file.close()
-        if hasattr(self, 'cert_file'):
-            self.cert_file.close()
-        if hasattr(self, 'key_file'):
-            self.key_file.close()
@@ -36,7 +36,7 @@ def retrieve_cluster(context, cluster_ident):
 
 
 def retrieve_cluster_template(context, cluster):
-    return cluster_template.ClusterTemplate.get_by_uuid(
+    return cluster_template.ClusterTemplate.get_cached(
         context, cluster.cluster_template_id)
 
 
@@ -138,12 +138,15 @@ def _get_event_target(cluster_obj=None):
     return resource.Resource(typeURI='service/magnum/cluster')
 
 
-def notify_about_cluster_operation(context, action, outcome, cluster_obj=None):
+def notify_about_cluster_operation(context, action, outcome, cluster_obj=None,
+                                   timings=None):
     """Send a notification about cluster operation.
 
     :param action: CADF action being audited
     :param outcome: CADF outcome
     :param cluster_obj: the cluster the notification is related to
+    :param timings: optional dict of the seconds spent in each step of the
+                    operation, attached to the event
     """
     notifier = rpc.get_notifier()
 
@@ -154,6 +157,11 @@ def notify_about_cluster_operation(context, action, outcome, cluster_obj=None):
         initiator=_get_request_audit_info(context),
         target=_get_event_target(cluster_obj=cluster_obj),
         observer=resource.Resource(typeURI='service/magnum/cluster'))
+    if timings is not None:
+        event.add_attachment(attachment.Attachment(
+            typeURI='mime:application/json',
+            content=timings,
+            name='timings'))
     service = 'magnum'
     event_type = '%(service)s.cluster.%(action)s' % {
         'service': service, 'action': action}
@@ -167,6 +175,35 @@ def notify_about_cluster_operation(context, action, outcome, cluster_obj=None):
     method(context, event_type, payload)
 
 
+def notify_about_cluster_health_status(context, cluster_obj,
+                                       previous_health_status):
+    """Send a notification about a cluster health status change.
+
+    :param cluster_obj: the cluster, with its new health status
+    :param previous_health_status: the health status it changed from
+    """
+    notifier = rpc.get_notifier()
+
+    event = eventfactory.EventFactory().new_event(
+        eventType=cadftype.EVENTTYPE_ACTIVITY,
+        outcome=taxonomy.OUTCOME_SUCCESS,
+        action=taxonomy.ACTION_UPDATE,
+        initiator=_get_request_audit_info(context),
+        target=_get_event_target(cluster_obj=cluster_obj),
+        observer=resource.Resource(typeURI='service/magnum/cluster'))
+    event.add_attachment(attachment.Attachment(
+        typeURI='mime:application/json',
+        content={
+            'previous_health_status': previous_health_status,
+            'health_status': cluster_obj.health_status,
+            'health_status_reason': cluster_obj.health_status_reason,
+        },
+        name='health_status'))
+
+    notifier.info(context, 'magnum.cluster.health_status.update',
+                  event.as_dict())
+
+
 def _get_nodegroup_object(context, cluster, node_count, is_master=False):
     """Returns a nodegroup object based on the given cluster object."""
     ng = nodegroup.NodeGroup(context)
@@ -42,7 +42,48 @@ api_service_opts = [
                 help='Enable SSL Magnum API service'),
     cfg.IntOpt('workers',
                help='The maximum number of magnum-api processes to '
-                    'fork and run. Default to number of CPUs on the host.')
+                    'fork and run. Default to number of CPUs on the host.'),
+    cfg.StrOpt('server_mode',
+               default='werkzeug',
+               choices=[('werkzeug', 'Fork a new process for every request, '
+                                     'up to the number of workers.'),
+                        ('prefork', 'Fork the workers once at startup and '
+                                    'serve requests from a pool of green '
+                                    'threads in each of them.')],
+               help='How magnum-api serves requests.'),
+    cfg.IntOpt('worker_pool_size',
+               default=100,
+               min=1,
+               help='Number of requests each magnum-api worker handles '
+                    'concurrently when server_mode is "prefork".'),
+    cfg.IntOpt('max_requests_per_worker',
+               default=0,
+               min=0,
+               help='Number of requests after which a magnum-api worker '
+                    'finishes its in-flight requests and is replaced by a '
+                    'new one, when server_mode is "prefork". 0 means that '
+                    'workers are never recycled.'),
+    cfg.BoolOpt('direct_db_reads',
+                default=False,
+                help='Run the object methods that only read from the '
+                     'database, such as the ones listing and showing '
+                     'resources, in magnum-api rather than through an RPC '
+                     'call to a conductor. Changes to objects still go '
+                     'through the conductors. magnum-api needs access to '
+                     'the database to enable this.'),
+    cfg.BoolOpt('async_rpc_casts',
+                default=False,
+                help='Send the RPC casts of the asynchronous operations, '
+                     'such as creating or deleting a cluster, from a pool of '
+                     'green threads, so that requests do not wait for the '
+                     'message broker. A cast failing is then logged rather '
+                     'than returned to the client. Only used when '
+                     'server_mode is "prefork".'),
+    cfg.IntOpt('async_rpc_cast_workers',
+               default=16,
+               min=1,
+               help='Number of green threads of each magnum-api worker '
+                    'sending RPC casts when async_rpc_casts is enabled.'),
 ]
 
 
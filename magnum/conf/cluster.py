@@ -32,10 +32,24 @@ cluster_def_opts = [
                default="/var/lib/magnum/certificate-cache",
                help='Explicitly specify the temporary directory to hold '
                     'cached TLS certs.'),
+    cfg.IntOpt('client_credentials_cache_ttl',
+               default=3600,
+               min=0,
+               help=_('Time in seconds the conductor keeps the CA and client '
+                      'certificate of a cluster in memory after fetching '
+                      'them from the certificate backend. Rotating the CA '
+                      'or deleting the cluster drops them immediately. '
+                      'Set to 0 to fetch them every time.')),
     cfg.IntOpt('pre_delete_lb_timeout',
                default=60,
                help=_('The timeout in seconds to wait for the load balancers '
                       'to be deleted.')),
+    cfg.IntOpt('pre_delete_lb_workers',
+               default=8,
+               min=1,
+               help=_('The maximum number of load balancers of a cluster '
+                      'deleted at the same time before deleting the '
+                      'cluster.')),
 ]
 
 
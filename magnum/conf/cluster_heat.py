@@ -36,7 +36,27 @@ cluster_heat_opts = [
                help=('The length of time to let cluster creation continue. '
                      'This interval is in minutes. The default is 60 minutes.'
                      ),
-               )
+               ),
+    cfg.BoolOpt('stack_notifications_enabled',
+                default=False,
+                help=('Listen for orchestration.stack.* notifications '
+                      'emitted by Heat and sync the status of the affected '
+                      'nodegroup as soon as its stack changes. The periodic '
+                      'status sync keeps running as a reconciliation '
+                      'fallback. Heat must be configured to emit '
+                      'notifications on the same message bus.')),
+    cfg.ListOpt('stack_notifications_topics',
+                default=['notifications'],
+                help=('Topics on which Heat stack notifications are '
+                      'consumed.')),
+    cfg.StrOpt('stack_notifications_exchange',
+               default='heat',
+               help=('Exchange on which Heat publishes its notifications.')),
+    cfg.StrOpt('stack_notifications_pool',
+               default='magnum-conductor',
+               help=('Listener pool name. All the conductors share a pool '
+                     'so each notification is handled once, without taking '
+                     'it away from other consumers of the topic.')),
 ]
 
 
@@ -43,6 +43,15 @@ cluster_template_opts = [
                help=_("Default network driver for docker swarm "
                       "cluster-templates."),
                deprecated_group='baymodel'),
+    cfg.IntOpt('cache_ttl',
+               default=10,
+               min=0,
+               help=_("Time in seconds for which the cluster templates "
+                      "looked up by the conductor and the API are cached "
+                      "in memory. Templates updated or deleted through "
+                      "another process are seen by this one once their "
+                      "cache entry expires. Set to 0 to disable the "
+                      "cache.")),
 ]
 
 
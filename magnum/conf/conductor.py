@@ -26,7 +26,37 @@ conductor_service_opts = [
                      'used for cluster locking.')),
     cfg.IntOpt('workers',
                help='Number of magnum-conductor processes to fork and run. '
-                    'Default to number of CPUs on the host.')
+                    'Default to number of CPUs on the host.'),
+    cfg.IntOpt('sync_workers',
+               default=16,
+               min=1,
+               help=('Maximum number of clusters synchronized concurrently '
+                     'by each of the periodic status and health sync tasks. '
+                     'Clusters beyond this limit wait in a queue.')),
+    cfg.IntOpt('create_setup_workers',
+               default=16,
+               min=1,
+               help=('Maximum number of cluster creation setup steps, such '
+                     'as creating the trust or storing a CA certificate, '
+                     'run concurrently by each magnum-conductor process. '
+                     'Steps beyond this limit wait in a queue.')),
+    cfg.IntOpt('sync_pass_timeout',
+               default=60,
+               min=1,
+               help=('Deadline in seconds for a single periodic sync pass. '
+                     'Clusters whose sync has not started when the deadline '
+                     'expires are skipped and picked up by a later pass.')),
+    cfg.BoolOpt('shard_periodic_sync',
+                default=True,
+                help=('Split the periodic cluster status and health sync '
+                      'between all live magnum-conductor hosts using a '
+                      'consistent hash ring over the cluster UUIDs. '
+                      'Membership is taken from the magnum_service '
+                      'heartbeats, so the clusters of a conductor that '
+                      'stops reporting are taken over once it is '
+                      'considered down after service_down_time seconds. '
+                      'When disabled, every conductor host syncs every '
+                      'cluster.')),
 ]
 
 
@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from oslo_config import cfg
+from oslo_config import types
 
 drivers_group = cfg.OptGroup(name='drivers',
                              title='Options for the Drivers')
@@ -36,6 +37,23 @@ drivers_opts = [
                      ' Means if not specified, then all available drivers '
                      'are enabled.'
                 ),
+    cfg.Opt('lookup_cache_ttl',
+            type=types.Dict(value_type=types.Integer(min=0)),
+            default={'keypair': 60, 'network': 300, 'subnet': 300,
+                     'endpoint': 600, 'region': 600, 'flavor': 300,
+                     'image': 60},
+            help='Time in seconds for which the OpenStack resources looked '
+                 'up to validate clusters and cluster templates and to '
+                 'build their Heat parameters are cached, per resource '
+                 'type. Resource types are keypair, network, subnet, '
+                 'endpoint, region, flavor and image. A resource type not '
+                 'listed or set to 0 is not cached.'),
+    cfg.IntOpt('lookup_negative_cache_ttl',
+               default=30,
+               min=0,
+               help='Time in seconds for which the lookups of OpenStack '
+                    'resources that were not found are cached. Set to 0 to '
+                    'disable the caching of missing resources.'),
 ]
 
 
@@ -27,6 +27,33 @@ legacy_session_opts = {
 keystone_auth_group = cfg.OptGroup(name=CFG_GROUP,
                                    title='Options for Keystone in Magnum')
 
+keystone_session_cache_opts = [
+    cfg.IntOpt('session_cache_size',
+               default=256,
+               min=0,
+               help='Maximum number of authenticated Keystone sessions kept '
+                    'by each Magnum process, so that the service user, '
+                    'cluster trustees and repeated tokens do not '
+                    'authenticate again for every request or periodic job. '
+                    'The least recently used sessions are evicted first. '
+                    'Set to 0 to disable the cache.'),
+    cfg.IntOpt('session_cache_ttl',
+               default=3600,
+               min=1,
+               help='Maximum time in seconds a cached Keystone session is '
+                    'reused. Sessions are also evicted as soon as their '
+                    'token is about to expire.'),
+    cfg.IntOpt('token_info_cache_size',
+               default=1024,
+               min=0,
+               help='Maximum number of Keystone token bodies, with their '
+                    'service catalog, kept by each Magnum process for the '
+                    'request contexts received over RPC without them. The '
+                    'least recently used ones are evicted first. Set to 0 '
+                    'to validate the token with Keystone every time the '
+                    'token body is needed.'),
+]
+
 
 def register_opts(conf):
     # FIXME(pauloewerton): remove import of authtoken group and legacy options
@@ -36,11 +63,13 @@ def register_opts(conf):
     ka_loading.register_session_conf_options(
         conf, CFG_GROUP, deprecated_opts=legacy_session_opts)
     conf.set_default('auth_type', default='password', group=CFG_GROUP)
+    conf.register_opts(keystone_session_cache_opts, group=CFG_GROUP)
 
 
 def list_opts():
     keystone_auth_opts = (ka_loading.get_auth_common_conf_options() +
-                          ka_loading.get_auth_plugin_conf_options('password'))
+                          ka_loading.get_auth_plugin_conf_options('password') +
+                          keystone_session_cache_opts)
     return {
         keystone_auth_group: keystone_auth_opts
     }
@@ -33,6 +33,16 @@ kubernetes_opts = [
                help=('The default polling interval for Kubernetes cluster '
                      'health. If this number is negative the periodic task '
                      'will be disabled.')),
+    cfg.IntOpt('api_session_cache_size',
+               default=500,
+               min=1,
+               help=('Maximum number of clusters for which the conductor '
+                     'keeps a pooled HTTPS session to the Kubernetes API, '
+                     'so that health polling reuses its connections '
+                     'instead of doing a TLS handshake for every request. '
+                     'The least recently used sessions are closed first. '
+                     'Every session keeps its client certificate files and '
+                     'a connection open.')),
 ]
 
 
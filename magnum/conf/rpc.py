@@ -23,12 +23,31 @@ periodic_opts = [
                     'seconds.'),
 ]
 
+rpc_opts = [
+    cfg.BoolOpt('rpc_compact_context',
+                default=True,
+                help='Send request contexts over RPC without the body of '
+                     'their Keystone token, which holds the whole service '
+                     'catalog. The services receiving them get it from a '
+                     'cache keyed by the token, validating the token with '
+                     'Keystone when it is missing. Disable it during '
+                     'rolling upgrades, while services that do not know '
+                     'about compact contexts still run.'),
+    cfg.BoolOpt('rpc_context_size_metrics',
+                default=False,
+                help='Measure the size of every request context sent over '
+                     'RPC, and of the token body left out of it, for the '
+                     'context metrics. Measuring serializes each context '
+                     'once more, so it is meant for troubleshooting only.'),
+]
+
 
 def register_opts(conf):
     conf.register_opts(periodic_opts)
+    conf.register_opts(rpc_opts)
 
 
 def list_opts():
     return {
-        "DEFAULT": periodic_opts
+        "DEFAULT": periodic_opts + rpc_opts
     }
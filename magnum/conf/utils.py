@@ -47,10 +47,22 @@ urlfetch_opts = [
                help=_('Maximum raw byte size of any manifest.'))
 ]
 
+policy_opts = [
+    cfg.IntOpt('policy_decision_cache_size',
+               default=4096,
+               min=0,
+               help='Maximum number of policy decisions kept by each Magnum '
+                    'process, per rule, credentials and target attributes '
+                    'the rule reads. The least recently used decisions are '
+                    'evicted first, and all of them when the policy file is '
+                    'reloaded. Set to 0 to evaluate every policy check.'),
+]
+
 ALL_OPTS = list(itertools.chain(
     utils_opts,
     periodic_opts,
-    urlfetch_opts
+    urlfetch_opts,
+    policy_opts
 ))
 
 
@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from oslo_config import cfg
+from oslo_config import types
 
 from magnum.common.x509 import extensions
 from magnum.i18n import _
@@ -48,7 +49,21 @@ x509_opts = [
                default=365 * 5,
                help=_('Number of days for which a certificate is valid.')),
     cfg.IntOpt('rsa_key_size',
-               default=2048, help=_('Size of generated private key. '))]
+               default=2048, help=_('Size of generated private key. ')),
+    cfg.IntOpt('rsa_key_pool_size',
+               default=8,
+               min=0,
+               help=_('Number of RSA private keys of each size in '
+                      'rsa_key_pool_key_sizes that the conductor generates '
+                      'ahead of time in a background thread, so that '
+                      'issuing cluster certificates does not wait for key '
+                      'generation. Set to 0 to generate every key on '
+                      'demand.')),
+    cfg.ListOpt('rsa_key_pool_key_sizes',
+                item_type=types.Integer(min=1024),
+                default=[],
+                help=_('Sizes of the RSA private keys kept in the key pool. '
+                       'Defaults to rsa_key_size.'))]
 
 
 def register_opts(conf):
@@ -45,7 +45,8 @@ class Connection(object):
 
     @abc.abstractmethod
     def get_cluster_list(self, context, filters=None, limit=None,
-                         marker=None, sort_key=None, sort_dir=None):
+                         marker=None, sort_key=None, sort_dir=None,
+                         cursor=None):
         """Get matching clusters.
 
         Return a list of the specified columns for all clusters that match the
@@ -60,7 +61,11 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
-        :returns: A list of tuples of the specified columns.
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
+        :returns: A list of tuples of the specified columns. The nodegroups
+                  of every cluster are loaded along with it and are
+                  available as its ``nodegroups`` attribute.
         """
 
     @abc.abstractmethod
@@ -143,10 +148,19 @@ class Connection(object):
         :raises: ClusterNotFound
         """
 
+    @abc.abstractmethod
+    def update_clusters_health_status(self, health_statuses):
+        """Update the health status of several clusters at once.
+
+        :param health_statuses: A dict mapping the uuid of each cluster to
+                                its (health_status, health_status_reason).
+        :returns: The number of clusters updated.
+        """
+
     @abc.abstractmethod
     def get_cluster_template_list(self, context, filters=None,
                                   limit=None, marker=None, sort_key=None,
-                                  sort_dir=None):
+                                  sort_dir=None, cursor=None):
         """Get matching ClusterTemplates.
 
         Return a list of the specified columns for all ClusterTemplates that
@@ -161,6 +175,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -408,7 +424,8 @@ class Connection(object):
 
     @abc.abstractmethod
     def get_quota_list(self, context, filters=None, limit=None,
-                       marker=None, sort_key=None, sort_dir=None):
+                       marker=None, sort_key=None, sort_dir=None,
+                       cursor=None):
         """Get quota list.
 
         Return a list of the specified columns for all quotas that match the
@@ -423,6 +440,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -629,7 +648,7 @@ class Connection(object):
     @abc.abstractmethod
     def list_cluster_nodegroups(self, context, cluster_id, filters=None,
                                 limit=None, marker=None, sort_key=None,
-                                sort_dir=None):
+                                sort_dir=None, cursor=None):
         """Get matching nodegroups in a given cluster.
 
         :param context: The security context
@@ -643,10 +662,21 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
 
         :returns: A list of nodegroup records.
         """
 
+    @abc.abstractmethod
+    def list_nodegroups_by_stack_id(self, context, stack_id):
+        """Get the nodegroups backed by a given Heat stack.
+
+        :param context: The security context
+        :param stack_id: The id of the Heat stack.
+        :returns: A list of nodegroup records.
+        """
+
     @abc.abstractmethod
     def get_cluster_nodegroup_count(self, context, cluster_id):
         """Get count of nodegroups in a given cluster.
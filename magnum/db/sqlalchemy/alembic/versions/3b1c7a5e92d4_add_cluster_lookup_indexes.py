@@ -0,0 +1,36 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""add indexes for cluster, nodegroup and cluster_template lookups
+
+Revision ID: 3b1c7a5e92d4
+Revises: 7da8489d6a68
+Create Date: 2026-10-18 10:12:45.118262
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '3b1c7a5e92d4'
+down_revision = '7da8489d6a68'
+
+from alembic import op  # noqa: E402
+
+
+def upgrade():
+    op.create_index('cluster_status_idx', 'cluster', ['status'])
+    op.create_index('cluster_project_id_idx', 'cluster', ['project_id'])
+    op.create_index('cluster_cluster_template_id_idx', 'cluster',
+                    ['cluster_template_id'])
+    op.create_index('nodegroup_cluster_id_role_is_default_idx', 'nodegroup',
+                    ['cluster_id', 'role', 'is_default'])
+    op.create_index('cluster_template_project_id_public_idx',
+                    'cluster_template', ['project_id', 'public'])
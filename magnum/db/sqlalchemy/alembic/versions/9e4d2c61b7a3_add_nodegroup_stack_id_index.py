@@ -0,0 +1,29 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""add an index for nodegroup stack_id lookups
+
+Revision ID: 9e4d2c61b7a3
+Revises: 3b1c7a5e92d4
+Create Date: 2026-10-18 16:40:12.530417
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '9e4d2c61b7a3'
+down_revision = '3b1c7a5e92d4'
+
+from alembic import op  # noqa: E402
+
+
+def upgrade():
+    op.create_index('nodegroup_stack_id_idx', 'nodegroup', ['stack_id'])
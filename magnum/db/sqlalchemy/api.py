@@ -102,20 +102,94 @@ def add_identity_filter(query, value):
         raise exception.InvalidIdentity(identity=value)
 
 
+def _nulls_sort_first():
+    """Whether the database sorts NULL values before the other values.
+
+    MySQL and SQLite order NULL values as the lowest values, PostgreSQL
+    as the highest ones.
+    """
+    return get_engine().dialect.name != 'postgresql'
+
+
+def _seek_criteria(model, sort_keys, sort_dir, cursor):
+    """Return the predicate selecting the rows after a cursor.
+
+    The cursor holds the values of the sort keys of the last row of the
+    previous page. When none of the sort keys is nullable they are compared
+    as a single row value, which the database serves with a seek on an
+    index over the sort keys. Otherwise the rows after the cursor are
+    selected key by key, placing NULL values where the database sorts them.
+    """
+    if len(cursor) != len(sort_keys):
+        raise exception.InvalidParameterValue(_('Invalid pagination cursor'))
+    # NULL values come after the others when the database sorts them as the
+    # highest values in ascending order, or the lowest in descending order.
+    nulls_after = (sort_dir == 'desc') == _nulls_sort_first()
+    columns = []
+    values = []
+    nullable = False
+    for key, value in zip(sort_keys, cursor):
+        column = getattr(model, key)
+        table_column = model.__table__.columns.get(key)
+        nullable = nullable or table_column is None or table_column.nullable
+        if value is not None:
+            try:
+                if isinstance(column.type, sa.DateTime):
+                    value = timeutils.parse_strtime(value)
+                elif isinstance(column.type, sa.Boolean):
+                    value = int(value)
+                    column = sa.cast(column, sa.Integer)
+                elif isinstance(column.type, sa.Integer):
+                    value = int(value)
+            except (TypeError, ValueError):
+                raise exception.InvalidParameterValue(
+                    _('Invalid pagination cursor'))
+        columns.append(column)
+        values.append(value)
+
+    if not nullable and None not in values:
+        if sort_dir == 'desc':
+            return sa.tuple_(*columns) < sa.tuple_(*values)
+        return sa.tuple_(*columns) > sa.tuple_(*values)
+
+    criteria = []
+    equal = []
+    for column, value in zip(columns, values):
+        if value is None:
+            after = sa.false() if nulls_after else column.isnot(None)
+        else:
+            after = column < value if sort_dir == 'desc' else column > value
+            if nulls_after:
+                after = sa.or_(after, column.is_(None))
+        criteria.append(sa.and_(*(equal + [after])))
+        equal.append(column.is_(None) if value is None else column == value)
+    return sa.or_(*criteria)
+
+
 def _paginate_query(model, limit=None, marker=None, sort_key=None,
-                    sort_dir=None, query=None):
+                    sort_dir=None, query=None, cursor=None):
+    """Return a page of the results of a query.
+
+    The page starts after either a marker, the last model instance of the
+    previous page, or a cursor, the values of its sort keys.
+    """
     if not query:
         query = model_query(model)
     sort_keys = ['id']
     if sort_key and sort_key not in sort_keys:
         sort_keys.insert(0, sort_key)
     try:
-        query = db_utils.paginate_query(query, model, limit, sort_keys,
+        query = db_utils.paginate_query(query, model, None, sort_keys,
                                         marker=marker, sort_dir=sort_dir)
     except db_exc.InvalidSortKey:
         raise exception.InvalidParameterValue(
             _('The sort_key value "%(key)s" is an invalid field for sorting')
             % {'key': sort_key})
+    if cursor is not None:
+        query = query.filter(
+            _seek_criteria(model, sort_keys, sort_dir, cursor))
+    if limit is not None:
+        query = query.limit(limit)
     return query.all()
 
 
@@ -125,9 +199,13 @@ class Connection(api.Connection):
     def __init__(self):
         pass
 
-    def _add_tenant_filters(self, context, query):
+    def _get_tenant_filter(self, context, model):
+        """Return the predicate limiting a model to the context's tenant.
+
+        Returns None when the context sees every tenant.
+        """
         if context.is_admin and context.all_tenants:
-            return query
+            return None
 
         admin_context = request_context.make_admin_context(all_tenants=True)
         osc = clients.OpenStackClients(admin_context)
@@ -135,7 +213,7 @@ class Connection(api.Connection):
 
         # User in a regular project (not in the trustee domain)
         if context.project_id and context.domain_id != kst.trustee_domain_id:
-            query = query.filter_by(project_id=context.project_id)
+            return model.project_id == context.project_id
         # Match project ID component in trustee user's user name against
         # cluster's project_id to associate per-cluster trustee users who have
         # no project information with the project their clusters/cluster models
@@ -143,10 +221,15 @@ class Connection(api.Connection):
         elif context.domain_id == kst.trustee_domain_id:
             user_name = kst.client.users.get(context.user_id).name
             user_project = user_name.split('_', 2)[1]
-            query = query.filter_by(project_id=user_project)
+            return model.project_id == user_project
         else:
-            query = query.filter_by(user_id=context.user_id)
+            return model.user_id == context.user_id
 
+    def _add_tenant_filters(self, context, query):
+        tenant_filter = self._get_tenant_filter(
+            context, query.column_descriptions[0]['entity'])
+        if tenant_filter is not None:
+            query = query.filter(tenant_filter)
         return query
 
     def _add_clusters_filters(self, query, filters):
@@ -189,12 +272,29 @@ class Connection(api.Connection):
         return query
 
     def get_cluster_list(self, context, filters=None, limit=None, marker=None,
-                         sort_key=None, sort_dir=None):
+                         sort_key=None, sort_dir=None, cursor=None):
         query = model_query(models.Cluster)
         query = self._add_tenant_filters(context, query)
         query = self._add_clusters_filters(query, filters)
-        return _paginate_query(models.Cluster, limit, marker,
-                               sort_key, sort_dir, query)
+        clusters = _paginate_query(models.Cluster, limit, marker,
+                                   sort_key, sort_dir, query, cursor)
+        self._attach_nodegroups(context, clusters)
+        return clusters
+
+    def _attach_nodegroups(self, context, clusters):
+        # Load the nodegroups of the whole page with a single query, so
+        # that listing clusters does not issue one query per cluster.
+        nodegroups = {cluster.uuid: [] for cluster in clusters}
+        if nodegroups:
+            query = model_query(models.NodeGroup)
+            if not context.is_admin:
+                query = query.filter_by(project_id=context.project_id)
+            query = query.filter(
+                models.NodeGroup.cluster_id.in_(list(nodegroups)))
+            for nodegroup in query.order_by(models.NodeGroup.id):
+                nodegroups[nodegroup.cluster_id].append(nodegroup)
+        for cluster in clusters:
+            cluster.nodegroups = nodegroups[cluster.uuid]
 
     def create_cluster(self, values):
         # ensure defaults are present for new clusters
@@ -295,6 +395,31 @@ class Connection(api.Connection):
             ref.update(values)
         return ref
 
+    def update_clusters_health_status(self, health_statuses):
+        if not health_statuses:
+            return 0
+
+        # A single UPDATE for all the clusters, picking the values of each
+        # one by its uuid.
+        health_status = sa.case(
+            {uuid: status
+             for uuid, (status, reason) in health_statuses.items()},
+            value=models.Cluster.uuid)
+        health_status_reason = sa.case(
+            {uuid: sa.literal(reason, type_=models.JSONEncodedDict)
+             for uuid, (status, reason) in health_statuses.items()},
+            value=models.Cluster.uuid)
+
+        session = get_session()
+        with session.begin():
+            query = model_query(models.Cluster, session=session)
+            query = query.filter(
+                models.Cluster.uuid.in_(list(health_statuses)))
+            return query.update(
+                {models.Cluster.health_status: health_status,
+                 models.Cluster.health_status_reason: health_status_reason},
+                synchronize_session=False)
+
     def _add_cluster_template_filters(self, query, filters):
         if filters is None:
             filters = {}
@@ -311,7 +436,8 @@ class Connection(api.Connection):
         return query.filter_by(**filter_dict)
 
     def get_cluster_template_list(self, context, filters=None, limit=None,
-                                  marker=None, sort_key=None, sort_dir=None):
+                                  marker=None, sort_key=None, sort_dir=None,
+                                  cursor=None):
         query = model_query(models.ClusterTemplate)
         query = self._add_tenant_filters(context, query)
         query = self._add_cluster_template_filters(query, filters)
@@ -326,7 +452,7 @@ class Connection(api.Connection):
             query = query.union(hidden_q)
 
         return _paginate_query(models.ClusterTemplate, limit, marker,
-                               sort_key, sort_dir, query)
+                               sort_key, sort_dir, query, cursor)
 
     def create_cluster_template(self, values):
         # ensure defaults are present for new ClusterTemplates
@@ -341,11 +467,19 @@ class Connection(api.Connection):
             raise exception.ClusterTemplateAlreadyExists(uuid=values['uuid'])
         return cluster_template
 
-    def get_cluster_template_by_id(self, context, cluster_template_id):
+    def _cluster_template_visible_query(self, context):
+        # The ClusterTemplates of the tenant and the public ones, in a single
+        # query rather than a union of two.
         query = model_query(models.ClusterTemplate)
-        query = self._add_tenant_filters(context, query)
-        public_q = model_query(models.ClusterTemplate).filter_by(public=True)
-        query = query.union(public_q)
+        tenant_filter = self._get_tenant_filter(context,
+                                                models.ClusterTemplate)
+        if tenant_filter is not None:
+            query = query.filter(sa.or_(
+                tenant_filter, models.ClusterTemplate.public == sa.true()))
+        return query
+
+    def get_cluster_template_by_id(self, context, cluster_template_id):
+        query = self._cluster_template_visible_query(context)
         query = query.filter(models.ClusterTemplate.id == cluster_template_id)
         try:
             return query.one()
@@ -354,12 +488,9 @@ class Connection(api.Connection):
                 clustertemplate=cluster_template_id)
 
     def get_cluster_template_by_uuid(self, context, cluster_template_uuid):
-        query = model_query(models.ClusterTemplate)
-        query = self._add_tenant_filters(context, query)
-        public_q = model_query(models.ClusterTemplate).filter_by(public=True)
-        query = query.union(public_q)
+        query = self._cluster_template_visible_query(context)
         query = query.filter(
-                models.ClusterTemplate.uuid == cluster_template_uuid)
+            models.ClusterTemplate.uuid == cluster_template_uuid)
         try:
             return query.one()
         except NoResultFound:
@@ -367,12 +498,9 @@ class Connection(api.Connection):
                 clustertemplate=cluster_template_uuid)
 
     def get_cluster_template_by_name(self, context, cluster_template_name):
-        query = model_query(models.ClusterTemplate)
-        query = self._add_tenant_filters(context, query)
-        public_q = model_query(models.ClusterTemplate).filter_by(public=True)
-        query = query.union(public_q)
+        query = self._cluster_template_visible_query(context)
         query = query.filter(
-                models.ClusterTemplate.name == cluster_template_name)
+            models.ClusterTemplate.name == cluster_template_name)
         try:
             return query.one()
         except MultipleResultsFound:
@@ -613,11 +741,11 @@ class Connection(api.Connection):
         return query
 
     def get_quota_list(self, context, filters=None, limit=None, marker=None,
-                       sort_key=None, sort_dir=None):
+                       sort_key=None, sort_dir=None, cursor=None):
         query = model_query(models.Quota)
         query = self._add_quota_filters(query, filters)
         return _paginate_query(models.Quota, limit, marker,
-                               sort_key, sort_dir, query)
+                               sort_key, sort_dir, query, cursor)
 
     def update_quota(self, project_id, values):
         session = get_session()
@@ -888,14 +1016,21 @@ class Connection(api.Connection):
 
     def list_cluster_nodegroups(self, context, cluster_id, filters=None,
                                 limit=None, marker=None, sort_key=None,
-                                sort_dir=None):
+                                sort_dir=None, cursor=None):
         query = model_query(models.NodeGroup)
         if not context.is_admin:
             query = query.filter_by(project_id=context.project_id)
         query = query.filter_by(cluster_id=cluster_id)
         query = self._add_nodegoup_filters(query, filters)
         return _paginate_query(models.NodeGroup, limit, marker,
-                               sort_key, sort_dir, query)
+                               sort_key, sort_dir, query, cursor)
+
+    def list_nodegroups_by_stack_id(self, context, stack_id):
+        query = model_query(models.NodeGroup)
+        if not context.is_admin:
+            query = query.filter_by(project_id=context.project_id)
+        query = query.filter_by(stack_id=stack_id)
+        return query.all()
 
     def get_cluster_nodegroup_count(self, context, cluster_id):
         query = model_query(models.NodeGroup)
@@ -108,6 +108,10 @@ class Cluster(Base):
     __tablename__ = 'cluster'
     __table_args__ = (
         schema.UniqueConstraint('uuid'),
+        schema.Index('cluster_status_idx', 'status'),
+        schema.Index('cluster_project_id_idx', 'project_id'),
+        schema.Index('cluster_cluster_template_id_idx',
+                     'cluster_template_id'),
         table_args()
     )
     id = Column(Integer, primary_key=True)
@@ -159,6 +163,8 @@ class ClusterTemplate(Base):
     __tablename__ = 'cluster_template'
     __table_args__ = (
         schema.UniqueConstraint('uuid'),
+        schema.Index('cluster_template_project_id_public_idx',
+                     'project_id', 'public'),
         table_args()
     )
     id = Column(Integer, primary_key=True)
@@ -275,6 +281,9 @@ class NodeGroup(Base):
         schema.UniqueConstraint(
             'cluster_id', 'name',
             name='uniq_nodegroup0cluster_id0name'),
+        schema.Index('nodegroup_cluster_id_role_is_default_idx',
+                     'cluster_id', 'role', 'is_default'),
+        schema.Index('nodegroup_stack_id_idx', 'stack_id'),
         table_args()
     )
     id = Column(Integer, primary_key=True)
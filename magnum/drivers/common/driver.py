@@ -14,6 +14,7 @@
 
 import abc
 import six
+import threading
 
 from oslo_config import cfg
 from pkg_resources import iter_entry_points
@@ -31,6 +32,11 @@ class Driver(object):
 
     definitions = None
 
+    # Driver instances by cluster type, shared by every caller as drivers
+    # keep no per-cluster state.
+    _instances = {}
+    _instances_lock = threading.Lock()
+
     @classmethod
     def load_entry_points(cls):
         for entry_point in iter_entry_points('magnum.drivers'):
@@ -120,10 +126,29 @@ class Driver(object):
         :return: class
         """
 
-        definition_map = cls.get_drivers()
         cluster_type = (server_type, os, coe)
+        cached = Driver._instances.get(cluster_type)
+        if cached is None:
+            with Driver._instances_lock:
+                cached = Driver._instances.get(cluster_type)
+                if cached is None:
+                    cached = cls._load_driver(cluster_type)
+                    Driver._instances[cluster_type] = cached
+
+        entry_point_name, instance = cached
+        if entry_point_name in CONF.drivers.disabled_drivers:
+            raise exception.ClusterTypeNotSupported(
+                server_type=server_type,
+                os=os,
+                coe=coe)
+        return instance
+
+    @classmethod
+    def _load_driver(cls, cluster_type):
+        definition_map = cls.get_drivers()
 
         if cluster_type not in definition_map:
+            server_type, os, coe = cluster_type
             raise exception.ClusterTypeNotSupported(
                 server_type=server_type,
                 os=os,
@@ -132,21 +157,32 @@ class Driver(object):
         # TODO(muralia): once --drivername is supported as an input during
         # cluster create, change the following line to use driver name for
         # loading.
-        return driver.DriverManager("magnum.drivers",
-                                    driver_info['entry_point_name']).driver()
+        entry_point_name = driver_info['entry_point_name']
+        return (entry_point_name,
+                driver.DriverManager("magnum.drivers",
+                                     entry_point_name).driver())
 
     @classmethod
     def get_driver_for_cluster(cls, context, cluster):
-        ct = cluster_template.ClusterTemplate.get_by_uuid(
-            context, cluster.cluster_template_id)
+        # The template is loaded once per cluster object and shared with
+        # the other users of cluster.cluster_template.
+        ct = cluster.cluster_template
+        if ct.uuid != cluster.cluster_template_id:
+            # The cluster was moved to another template since.
+            ct = cluster_template.ClusterTemplate.get_cached(
+                context, cluster.cluster_template_id)
         return cls.get_driver(ct.server_type, ct.cluster_distro, ct.coe)
 
-    def update_cluster_status(self, context, cluster, use_admin_ctx=False):
+    def update_cluster_status(self, context, cluster, use_admin_ctx=False,
+                              stack_ids=None):
         """Update the cluster status based on underlying orchestration
 
            This is an optional method if your implementation does not need
            to poll the orchestration for status updates (for example, your
            driver uses some notification-based mechanism instead).
+
+           :param stack_ids: when set, only the nodegroups backed by these
+                             orchestration stacks need to be refreshed.
         """
         return
 
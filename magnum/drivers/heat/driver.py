@@ -23,7 +23,6 @@ from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import importutils
 
-from heatclient.common import template_utils
 from heatclient import exc as heatexc
 
 from magnum.common import clients
@@ -35,9 +34,11 @@ from magnum.common import short_id
 from magnum.common.x509 import operations as x509
 from magnum.conductor.handlers.common import cert_manager
 from magnum.conductor.handlers.common import trust_manager
+from magnum.conductor import k8s_api
 from magnum.conductor import utils as conductor_utils
 from magnum.drivers.common import driver
 from magnum.drivers.common import k8s_monitor
+from magnum.drivers.heat import template_cache
 from magnum.i18n import _
 from magnum.objects import fields
 
@@ -81,11 +82,7 @@ class HeatDriver(driver.Driver):
     def _get_env_files(self, template_path, env_rel_paths):
         template_dir = os.path.dirname(template_path)
         env_abs_paths = [os.path.join(template_dir, f) for f in env_rel_paths]
-        environment_files = []
-        env_map, merged_env = (
-            template_utils.process_multiple_environments_and_files(
-                env_paths=env_abs_paths, env_list_tracker=environment_files))
-        return environment_files, env_map
+        return template_cache.TEMPLATES.get_env_files(env_abs_paths)
 
     @abc.abstractmethod
     def get_template_definition(self):
@@ -120,7 +117,8 @@ class HeatDriver(driver.Driver):
             osc = clients.OpenStackClients(context)
             self._delete_stack(context, osc, nodegroup.stack_id)
 
-    def update_cluster_status(self, context, cluster, use_admin_ctx=False):
+    def update_cluster_status(self, context, cluster, use_admin_ctx=False,
+                              stack_ids=None):
         if cluster.stack_id is None:
             # NOTE(mgoddard): During cluster creation it is possible to poll
             # the cluster before its heat stack has been created. See bug
@@ -132,7 +130,7 @@ class HeatDriver(driver.Driver):
             stack_ctx = mag_ctx.make_cluster_context(cluster)
         poller = HeatPoller(clients.OpenStackClients(stack_ctx), context,
                             cluster, self)
-        poller.poll_and_check()
+        poller.poll_and_check(stack_ids=stack_ids)
 
     def create_cluster(self, context, cluster, cluster_create_timeout):
         stack = self._create_stack(context, clients.OpenStackClients(context),
@@ -190,7 +188,7 @@ class HeatDriver(driver.Driver):
             self._extract_template_definition(context, cluster,
                                               nodegroups=nodegroups))
 
-        tpl_files, template = template_utils.get_template_contents(
+        tpl_files, template = template_cache.TEMPLATES.get_template_contents(
             template_path)
 
         environment_files, env_map = self._get_env_files(template_path,
@@ -489,17 +487,65 @@ class HeatPoller(object):
         self.cluster_template = conductor_utils.retrieve_cluster_template(
             self.context, cluster)
         self.template_def = cluster_driver.get_template_definition()
-
-    def poll_and_check(self):
+        self._stacks = dict()
+        self._stack_details = dict()
+
+    def _list_stacks(self, nodegroups):
+        # NOTE: Fetch the summary of every nodegroup stack of the cluster
+        # with a single call instead of one get per nodegroup. Deleted
+        # stacks are included so that a DELETE_COMPLETE status can still
+        # be observed.
+        stack_ids = list()
+        for ng in nodegroups:
+            if ng.stack_id and ng.stack_id not in stack_ids:
+                stack_ids.append(ng.stack_id)
+        if not stack_ids:
+            return dict()
+        stacks = self.openstack_client.heat().stacks.list(
+            filters={'id': stack_ids}, show_deleted=True)
+        return {stack.id: stack for stack in stacks
+                if stack.id in stack_ids}
+
+    def _get_stack(self, stack_id, resolve_outputs=False):
+        # NOTE: The default nodegroups share a stack, remember the details
+        # fetched during this pass to avoid asking Heat twice.
+        key = (stack_id, resolve_outputs)
+        if key not in self._stack_details:
+            try:
+                self._stack_details[key] = (
+                    self.openstack_client.heat().stacks.get(
+                        stack_id, resolve_outputs=resolve_outputs))
+            except heatexc.NotFound as e:
+                self._stack_details[key] = e
+        stack = self._stack_details[key]
+        if isinstance(stack, heatexc.NotFound):
+            raise stack
+        return stack
+
+    def poll_and_check(self, stack_ids=None):
         # TODO(yuanying): temporary implementation to update api_address,
         # node_addresses and cluster status
         ng_statuses = list()
         self.default_ngs = list()
-        for nodegroup in self.cluster.nodegroups:
+        nodegroups = self.cluster.nodegroups
+        # NOTE: When stack_ids is given, e.g. after a Heat notification,
+        # only those stacks are queried and the other nodegroups keep the
+        # status recorded by the previous sync.
+        polled = [ng for ng in nodegroups
+                  if stack_ids is None or ng.stack_id in stack_ids]
+        self._stacks = self._list_stacks(polled)
+        self._stack_details = dict()
+        for nodegroup in nodegroups:
             self.nodegroup = nodegroup
             if self.nodegroup.is_default:
                 self.default_ngs.append(self.nodegroup)
-            status = self.extract_nodegroup_status()
+            if nodegroup in polled:
+                status = self.extract_nodegroup_status()
+            else:
+                status = NodeGroupStatus(name=nodegroup.name,
+                                         status=nodegroup.status,
+                                         is_default=nodegroup.is_default,
+                                         reason=nodegroup.status_reason)
             # In case a non-default nodegroup is deleted, None
             # is returned. We shouldn't add None in the list
             if status is not None:
@@ -522,19 +568,34 @@ class HeatPoller(object):
                                    reason=self.nodegroup.status_reason)
 
         try:
-            # Do not resolve outputs by default. Resolving all
-            # node IPs is expensive on heat.
-            stack = self.openstack_client.heat().stacks.get(
-                self.nodegroup.stack_id, resolve_outputs=False)
+            stack = self._stacks.get(self.nodegroup.stack_id)
+            if stack is None:
+                # The stack was not returned by the batched list, ask for
+                # it directly so that a missing stack raises NotFound.
+                stack = self._get_stack(self.nodegroup.stack_id)
+
+            if (stack.stack_status == self.nodegroup.status and
+                    stack.stack_status.endswith('_IN_PROGRESS')):
+                # The operation seen by the last pass is still running, so
+                # there is no need to fetch the stack details again. A
+                # finished stack is always synced, since another operation
+                # may have run on it since the last pass.
+                return NodeGroupStatus(name=self.nodegroup.name,
+                                       status=self.nodegroup.status,
+                                       is_default=self.nodegroup.is_default,
+                                       reason=self.nodegroup.status_reason)
 
             if stack.stack_status in (fields.ClusterStatus.CREATE_COMPLETE,
                                       fields.ClusterStatus.UPDATE_COMPLETE):
                 # Resolve all outputs if the stack is COMPLETE
-                stack = self.openstack_client.heat().stacks.get(
-                    self.nodegroup.stack_id, resolve_outputs=True)
+                stack = self._get_stack(self.nodegroup.stack_id,
+                                        resolve_outputs=True)
 
                 self._sync_cluster_and_template_status(stack)
             elif stack.stack_status != self.nodegroup.status:
+                # Do not resolve outputs by default. Resolving all
+                # node IPs is expensive on heat.
+                stack = self._get_stack(self.nodegroup.stack_id)
                 self.template_def.nodegroup_output_mappings = list()
                 self.template_def.update_outputs(
                     stack, self.cluster_template, self.cluster,
@@ -627,6 +688,7 @@ class HeatPoller(object):
                                                           context=self.context)
             cert_manager.delete_client_files(self.cluster,
                                              context=self.context)
+            k8s_api.invalidate_session(self.cluster)
 
         except exception.ClusterNotFound:
             LOG.info('The cluster %s has been deleted by others.',
@@ -0,0 +1,145 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide cache of the Heat templates of the drivers.
+
+Resolving a driver template reads and parses every nested template and
+script it references, which is the same work for every stack created from
+it. The resolved template and environments are kept in memory along with
+the modification time of every file they were read from, and read again
+from disk as soon as one of these files changes.
+"""
+
+import collections
+import os
+import threading
+
+from heatclient.common import template_utils
+from oslo_log import log as logging
+from six.moves.urllib import parse
+from six.moves.urllib import request
+
+LOG = logging.getLogger(__name__)
+
+_Entry = collections.namedtuple('_Entry', 'mtimes value')
+
+
+def _local_path(url):
+    split = parse.urlsplit(url)
+    if split.scheme != 'file':
+        return None
+    return request.url2pathname(split.path)
+
+
+def _mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _file_paths(files):
+    return {path for path in map(_local_path, files) if path}
+
+
+class TemplateCache(object):
+    """Resolved Heat templates and environments, keyed by their paths."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, load):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and _mtimes(entry.mtimes) == entry.mtimes:
+            with self._lock:
+                self.hits += 1
+            return entry.value
+
+        value, paths = load()
+        entry = _Entry(_mtimes(paths), value)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+        return value
+
+    def get_template_contents(self, template_path):
+        """Return the files map and the parsed template of a template.
+
+        The returned template is shared and must not be modified.
+        """
+        def load():
+            tpl_files, template = template_utils.get_template_contents(
+                template_path)
+            paths = _file_paths(tpl_files)
+            paths.add(template_path)
+            return (tpl_files, template), paths
+
+        tpl_files, template = self._get(('template', template_path), load)
+        return dict(tpl_files), template
+
+    def get_env_files(self, env_paths):
+        """Return the environment files list and map of environments."""
+        env_paths = tuple(env_paths)
+
+        def load():
+            environment_files = []
+            env_map, merged_env = (
+                template_utils.process_multiple_environments_and_files(
+                    env_paths=list(env_paths),
+                    env_list_tracker=environment_files))
+            paths = _file_paths(env_map)
+            paths.update(env_paths)
+            return (environment_files, env_map), paths
+
+        environment_files, env_map = self._get(('environment', env_paths),
+                                               load)
+        return list(environment_files), dict(env_map)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries)}
+
+
+TEMPLATES = TemplateCache()
+
+
+def prewarm():
+    """Resolve the templates of every enabled Heat driver ahead of use."""
+    # Imported here as the drivers import this module.
+    from magnum.drivers.common import driver
+    from magnum.drivers.heat import driver as heat_driver
+
+    driver_classes = {info['class']
+                      for info in driver.Driver.get_drivers().values()}
+    for driver_class in driver_classes:
+        if not issubclass(driver_class, heat_driver.HeatDriver):
+            continue
+        try:
+            definition = driver_class().get_template_definition()
+            TEMPLATES.get_template_contents(definition.template_path)
+        except Exception as e:
+            LOG.warning('Failed to load the templates of driver %(driver)s: '
+                        '%(e)s', {'driver': driver_class.__name__, 'e': e})
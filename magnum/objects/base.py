@@ -14,14 +14,30 @@
 
 """Magnum common internal object model"""
 
+import functools
+
+import oslo_messaging as messaging
 from oslo_versionedobjects import base as ovoo_base
 from oslo_versionedobjects import fields as ovoo_fields
 
+import magnum.conf
+
+CONF = magnum.conf.CONF
 
 remotable_classmethod = ovoo_base.remotable_classmethod
 remotable = ovoo_base.remotable
 
 
+def read_only(fn):
+    """Mark a remotable classmethod as only reading from the database.
+
+    With [api]/direct_db_reads set, magnum-api runs such methods itself
+    instead of calling a conductor. Goes below remotable_classmethod.
+    """
+    fn.read_only = True
+    return fn
+
+
 class MagnumObjectRegistry(ovoo_base.VersionedObjectRegistry):
     pass
 
@@ -60,6 +76,26 @@ class MagnumPersistentObject(object):
     }
 
 
+def class_actions(context, calls):
+    """Call several remotable classmethods, in a single RPC call if remoted.
+
+    The calls fail together: the first exception raised by one of them is
+    raised again.
+
+    :param context: security context.
+    :param calls: a list of (object class, method name, args, kwargs)
+                  tuples.
+    :returns: the list of the results of the calls.
+    """
+    indirection_api = MagnumObject.indirection_api
+    if not indirection_api:
+        return [getattr(cls, method)(context, *args, **kwargs)
+                for cls, method, args, kwargs in calls]
+    return indirection_api.object_class_actions(
+        context, [(cls.obj_name(), method, cls.VERSION, args, kwargs)
+                  for cls, method, args, kwargs in calls])
+
+
 class MagnumObjectIndirectionAPI(ovoo_base.VersionedObjectIndirectionAPI):
     def __init__(self):
         super(MagnumObjectIndirectionAPI, self).__init__()
@@ -70,11 +106,59 @@ class MagnumObjectIndirectionAPI(ovoo_base.VersionedObjectIndirectionAPI):
         return self._conductor.object_action(context, objinst, objmethod,
                                              args, kwargs)
 
+    def _direct_method(self, objname, objmethod, objver):
+        """Return the method to run in process, None to call a conductor."""
+        if not CONF.api.direct_db_reads:
+            return None
+        objclass = MagnumObject.obj_class_from_name(objname, objver)
+        method = getattr(objclass, objmethod)
+        if not getattr(method, 'read_only', False):
+            return None
+        # The undecorated method, the decorated one would come back here.
+        return functools.partial(method.original_fn, objclass)
+
     def object_class_action(self, context, objname, objmethod, objver,
                             args, kwargs):
+        method = self._direct_method(objname, objmethod, objver)
+        if method is not None:
+            return method(context, *args, **kwargs)
         return self._conductor.object_class_action(context, objname, objmethod,
                                                    objver, args, kwargs)
 
+    def object_class_actions(self, context, actions):
+        """Perform several classmethod actions with a single RPC call.
+
+        :param actions: a list of (objname, objmethod, objver, args, kwargs)
+                        tuples.
+        :returns: the list of the results of the actions.
+        """
+        results = [None] * len(actions)
+        remote = []
+        for i, (objname, objmethod, objver, args, kwargs) in enumerate(
+                actions):
+            method = self._direct_method(objname, objmethod, objver)
+            if method is not None:
+                results[i] = method(context, *args, **kwargs)
+            else:
+                remote.append(i)
+        if len(remote) == 1:
+            results[remote[0]] = self._conductor.object_class_action(
+                context, *actions[remote[0]])
+        elif remote:
+            try:
+                remote_results = self._conductor.object_class_actions(
+                    context, [actions[i] for i in remote])
+            except messaging.RemoteError as e:
+                # A conductor older than the batched call.
+                if e.exc_type != 'NoSuchMethod':
+                    raise
+                remote_results = [
+                    self._conductor.object_class_action(context, *actions[i])
+                    for i in remote]
+            for i, result in zip(remote, remote_results):
+                results[i] = result
+        return results
+
     def object_backport(self, context, objinst, target_version):
         return self._conductor.object_backport(context, objinst,
                                                target_version)
@@ -24,6 +24,11 @@ from magnum.objects.nodegroup import NodeGroup
 
 LAZY_LOADED_ATTRS = ['cluster_template']
 
+# Fields of the object that are not columns of the cluster table.
+NON_PERSISTENT_FIELDS = ['loaded_nodegroups']
+
+HEALTH_STATUS_FIELDS = ['health_status', 'health_status_reason']
+
 
 @base.MagnumObjectRegistry.register
 class Cluster(base.MagnumPersistentObject, base.MagnumObject,
@@ -57,11 +62,18 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
     # Version 1.21  Added fixed_network, fixed_subnet, floating_ip_enabled
     # Version 1.22  Added master_lb_enabled
     # Version 1.23  Added etcd_ca_cert_ref and front_proxy_ca_cert_ref
+    # Version 1.24  Added cursor to list
+    # Version 1.25  Added loaded_nodegroups
 
-    VERSION = '1.23'
+    VERSION = '1.25'
 
     dbapi = dbapi.get_instance()
 
+    # Older services do not get the loaded nodegroups, they query them.
+    obj_relationships = {
+        'loaded_nodegroups': [('1.25', '1.3')],
+    }
+
     fields = {
         'id': fields.IntegerField(),
         'uuid': fields.UUIDField(nullable=True),
@@ -97,6 +109,10 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         'fixed_subnet': fields.StringField(nullable=True),
         'floating_ip_enabled': fields.BooleanField(default=True),
         'master_lb_enabled': fields.BooleanField(default=False),
+        # The nodegroups loaded along with the cluster, None when they are
+        # queried on access. Not saved.
+        'loaded_nodegroups': fields.ListOfObjectsField('NodeGroup',
+                                                       nullable=True),
     }
 
     @staticmethod
@@ -105,57 +121,92 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         for field in cluster.fields:
             # cluster_template will be loaded lazily when it is needed
             # by obj_load_attr.
-            if field != 'cluster_template':
+            if (field != 'cluster_template' and
+                    field not in NON_PERSISTENT_FIELDS):
                 cluster[field] = db_cluster[field]
 
+        # Clusters coming from a list carry their nodegroups, which were
+        # loaded for the whole page at once.
+        db_nodegroups = db_cluster.get('nodegroups')
+        cluster.loaded_nodegroups = (
+            None if db_nodegroups is None else
+            NodeGroup._from_db_object_list(db_nodegroups, NodeGroup,
+                                           cluster._context))
+
         cluster.obj_reset_changes()
         return cluster
 
+    @property
+    def _nodegroups(self):
+        if not self.obj_attr_is_set('loaded_nodegroups'):
+            return None
+        return self.loaded_nodegroups
+
     @property
     def nodegroups(self):
         # Returns all nodegroups that belong to the cluster.
+        if self._nodegroups is not None:
+            return self._nodegroups
         return NodeGroup.list(self._context, self.uuid)
 
+    @nodegroups.setter
+    def nodegroups(self, nodegroups):
+        # Nodegroups the caller loaded along with the cluster.
+        self.loaded_nodegroups = nodegroups
+        self.obj_reset_changes(['loaded_nodegroups'])
+
     @property
     def default_ng_worker(self):
         # Assume that every cluster will have only one default
         # non-master nodegroup. We don't want to limit the roles
         # so each nodegroup that does not have a master role is
         # considered as a worker/minion nodegroup.
-        filters = {'is_default': True}
-        default_ngs = NodeGroup.list(self._context, self.uuid, filters=filters)
+        if self._nodegroups is not None:
+            default_ngs = [n for n in self._nodegroups if n.is_default]
+        else:
+            filters = {'is_default': True}
+            default_ngs = NodeGroup.list(self._context, self.uuid,
+                                         filters=filters)
         return [n for n in default_ngs if n.role != 'master'][0]
 
     @property
     def default_ng_master(self):
         # Assume that every cluster will have only one default
         # master nodegroup.
+        if self._nodegroups is not None:
+            return [n for n in self._nodegroups
+                    if n.role == 'master' and n.is_default][0]
         filters = {'role': 'master', 'is_default': True}
         return NodeGroup.list(self._context, self.uuid, filters=filters)[0]
 
+    @staticmethod
+    def _count(nodegroups, master):
+        return sum(n.node_count for n in nodegroups
+                   if (n.role == 'master') == master)
+
+    @staticmethod
+    def _addresses(nodegroups, master):
+        addresses = []
+        for ng in nodegroups:
+            if (ng.role == 'master') == master:
+                addresses += ng.node_addresses
+        return addresses
+
     @property
     def node_count(self):
-        return sum(n.node_count for n in self.nodegroups if n.role != 'master')
+        return self._count(self.nodegroups, master=False)
 
     @property
     def master_count(self):
-        return sum(n.node_count for n in self.nodegroups if n.role == 'master')
+        return self._count(self.nodegroups, master=True)
 
     @property
     def node_addresses(self):
-        node_addresses = []
-        for ng in self.nodegroups:
-            if ng.role != 'master':
-                node_addresses += ng.node_addresses
-        return node_addresses
+        return self._addresses(self.nodegroups, master=False)
 
     @property
     def master_addresses(self):
-        master_addresses = []
-        for ng in self.nodegroups:
-            if ng.role == 'master':
-                master_addresses += ng.node_addresses
-        return master_addresses
+        return self._addresses(self.nodegroups, master=True)
 
     @staticmethod
     def _from_db_object_list(db_objects, cls, context):
@@ -164,6 +215,7 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get(cls, context, cluster_id):
         """Find a cluster based on its id or uuid and return a Cluster object.
 
@@ -179,6 +231,7 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
             raise exception.InvalidIdentity(identity=cluster_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, cluster_id):
         """Find a cluster based on its integer id and return a Cluster object.
 
@@ -191,6 +244,7 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         return cluster
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_uuid(cls, context, uuid):
         """Find a cluster based on uuid and return a :class:`Cluster` object.
 
@@ -203,6 +257,7 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         return cluster
 
     @base.remotable_classmethod
+    @base.read_only
     def get_count_all(cls, context, filters=None):
         """Get count of matching clusters.
 
@@ -216,6 +271,7 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         return cls.dbapi.get_cluster_count_all(context, filters=filters)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_name(cls, context, name):
         """Find a cluster based on name and return a Cluster object.
 
@@ -228,8 +284,9 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         return cluster
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None, filters=None):
+             sort_key=None, sort_dir=None, filters=None, cursor=None):
         """Return a list of Cluster objects.
 
         :param context: Security context.
@@ -241,6 +298,8 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
                         'name', 'node_count', 'stack_id', 'api_address',
                         'node_addresses', 'project_id', 'user_id',
                         'status'(should be a status list), 'master_count'.
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: a list of :class:`Cluster` object.
 
         """
@@ -248,10 +307,12 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
                                                  marker=marker,
                                                  sort_key=sort_key,
                                                  sort_dir=sort_dir,
-                                                 filters=filters)
+                                                 filters=filters,
+                                                 cursor=cursor)
         return Cluster._from_db_object_list(db_clusters, cls, context)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_stats(cls, context, project_id=None):
         """Return a list of Cluster objects.
 
@@ -273,6 +334,8 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
 
         """
         values = self.obj_get_changes()
+        for field in NON_PERSISTENT_FIELDS:
+            values.pop(field, None)
         db_cluster = self.dbapi.create_cluster(values)
         self._from_db_object(self, db_cluster)
 
@@ -305,10 +368,30 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
                         object, e.g.: Cluster(context)
         """
         updates = self.obj_get_changes()
+        for field in NON_PERSISTENT_FIELDS:
+            updates.pop(field, None)
         self.dbapi.update_cluster(self.uuid, updates)
 
         self.obj_reset_changes()
 
+    @classmethod
+    def save_health_status(cls, context, clusters):
+        """Save the health status of several Clusters in one update.
+
+        Only health_status and health_status_reason are saved, the other
+        changes of the Clusters are left pending. This is not remotable,
+        it is meant for the periodic health sync of the conductor.
+
+        :param context: Security context.
+        :param clusters: a list of :class:`Cluster` objects.
+        """
+        cls.dbapi.update_clusters_health_status(
+            {cluster.uuid: (cluster.health_status,
+                            cluster.health_status_reason)
+             for cluster in clusters})
+        for cluster in clusters:
+            cluster.obj_reset_changes(HEALTH_STATUS_FIELDS)
+
     @base.remotable
     def refresh(self, context=None):
         """Loads updates for this Cluster.
@@ -326,8 +409,11 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
         """
         current = self.__class__.get_by_uuid(self._context, uuid=self.uuid)
         for field in self.fields:
+            if field in NON_PERSISTENT_FIELDS:
+                continue
             if self.obj_attr_is_set(field) and self[field] != current[field]:
                 self[field] = current[field]
+        self.nodegroups = None
 
     def obj_load_attr(self, attrname):
         if attrname not in LAZY_LOADED_ATTRS:
@@ -335,19 +421,26 @@ class Cluster(base.MagnumPersistentObject, base.MagnumObject,
                 action='obj_load_attr', obj_name=self.name, obj_id=self.uuid,
                 reason='unable to lazy-load %s' % attrname)
 
-        self['cluster_template'] = ClusterTemplate.get_by_uuid(
+        self['cluster_template'] = ClusterTemplate.get_cached(
             self._context, self.cluster_template_id)
 
         self.obj_reset_changes(['cluster_template'])
 
+    # The attributes as_dict() adds to the fields.
+    as_dict_properties = ('node_count', 'master_count', 'node_addresses',
+                          'master_addresses')
+
     def as_dict(self):
         dict_ = super(Cluster, self).as_dict()
+        for field in NON_PERSISTENT_FIELDS:
+            dict_.pop(field, None)
         # Update the dict with the attributes coming form
-        # the cluster's nodegroups.
+        # the cluster's nodegroups, loading them only once.
+        nodegroups = self.nodegroups
         dict_.update({
-            'node_count': self.node_count,
-            'master_count': self.master_count,
-            'node_addresses': self.node_addresses,
-            'master_addresses': self.master_addresses
+            'node_count': self._count(nodegroups, master=False),
+            'master_count': self._count(nodegroups, master=True),
+            'node_addresses': self._addresses(nodegroups, master=False),
+            'master_addresses': self._addresses(nodegroups, master=True)
         })
         return dict_
@@ -10,14 +10,98 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
+import threading
+import time
+
 from oslo_utils import strutils
 from oslo_utils import uuidutils
 from oslo_versionedobjects import fields
 
+import magnum.conf
 from magnum.db import api as dbapi
 from magnum.objects import base
 from magnum.objects import fields as m_fields
 
+CONF = magnum.conf.CONF
+
+# Attribute of the request context holding the templates looked up on
+# behalf of that request.
+_REQUEST_CACHE_ATTR = '_cluster_templates'
+
+
+def _visibility_key(context):
+    # The templates a context can see depend on its tenant, see
+    # _get_tenant_filter in the database API.
+    if context.is_admin and context.all_tenants:
+        return ('all',)
+    return (context.project_id, context.user_id, context.domain_id)
+
+
+def _request_cache(context):
+    return vars(context).setdefault(_REQUEST_CACHE_ATTR, {})
+
+
+class ClusterTemplateCache(object):
+    """Cluster templates of this process, kept for a short time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, context, uuid):
+        key = (uuid, _visibility_key(context))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+            self.misses += 1
+        return None
+
+    def set(self, context, uuid, cluster_template):
+        ttl = CONF.cluster_template.cache_ttl
+        if not ttl:
+            return
+        key = (uuid, _visibility_key(context))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, cluster_template)
+
+    def invalidate(self, uuid):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == uuid]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries)}
+
+
+CLUSTER_TEMPLATES = ClusterTemplateCache()
+
+
+def _invalidates_cache(fn):
+    """Drop the cached copies of the template once fn returns."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            CLUSTER_TEMPLATES.invalidate(self.uuid)
+            if self._context is not None:
+                _request_cache(self._context).pop(self.uuid, None)
+    return wrapper
+
 
 @base.MagnumObjectRegistry.register
 class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
@@ -43,7 +127,8 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
     # Version 1.18: DockerStorageDriver is a StringField (was an Enum)
     # Version 1.19: Added 'hidden' field
     # Version 1.20: Added 'tags' field
-    VERSION = '1.20'
+    # Version 1.21: Added cursor to list
+    VERSION = '1.21'
 
     dbapi = dbapi.get_instance()
 
@@ -99,6 +184,7 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
                 db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get(cls, context, cluster_template_id):
         """Find and return ClusterTemplate object based on its id or uuid.
 
@@ -114,6 +200,7 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
             return cls.get_by_name(context, cluster_template_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, cluster_template_id):
         """Find and return ClusterTemplate object based on its integer id.
 
@@ -128,6 +215,7 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
         return cluster_template
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_uuid(cls, context, uuid):
         """Find and return ClusterTemplate object based on uuid.
 
@@ -141,7 +229,33 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
                                                            db_cluster_template)
         return cluster_template
 
+    @classmethod
+    def get_cached(cls, context, uuid):
+        """Return ClusterTemplate object based on uuid, from cache if possible.
+
+        Templates are kept for the lifetime of the request context and for
+        up to ``[cluster_template]/cache_ttl`` seconds in this process.
+
+        :param uuid: the uuid of a ClusterTemplate.
+        :param context: Security context
+        :returns: a :class:`ClusterTemplate` object.
+        """
+        request_cache = _request_cache(context)
+        cluster_template = request_cache.get(uuid)
+        if cluster_template is None:
+            cluster_template = CLUSTER_TEMPLATES.get(context, uuid)
+            if cluster_template is None:
+                cluster_template = cls.get_by_uuid(context, uuid).obj_clone()
+                cluster_template._context = None
+                CLUSTER_TEMPLATES.set(context, uuid, cluster_template)
+            request_cache[uuid] = cluster_template
+        # Callers get their own copy, bound to their context.
+        cluster_template = cluster_template.obj_clone()
+        cluster_template._context = context
+        return cluster_template
+
     @base.remotable_classmethod
+    @base.read_only
     def get_by_name(cls, context, name):
         """Find and return ClusterTemplate object based on name.
 
@@ -156,8 +270,9 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
         return cluster_template
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, cursor=None):
         """Return a list of ClusterTemplate objects.
 
         :param context: Security context.
@@ -165,12 +280,14 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: a list of :class:`ClusterTemplate` object.
 
         """
         db_cluster_templates = cls.dbapi.get_cluster_template_list(
             context, limit=limit, marker=marker, sort_key=sort_key,
-            sort_dir=sort_dir)
+            sort_dir=sort_dir, cursor=cursor)
         return ClusterTemplate._from_db_object_list(db_cluster_templates,
                                                     cls, context)
 
@@ -190,6 +307,7 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
         db_cluster_template = self.dbapi.create_cluster_template(values)
         self._from_db_object(self, db_cluster_template)
 
+    @_invalidates_cache
     @base.remotable
     def destroy(self, context=None):
         """Delete the ClusterTemplate from the DB.
@@ -204,6 +322,7 @@ class ClusterTemplate(base.MagnumPersistentObject, base.MagnumObject,
         self.dbapi.destroy_cluster_template(self.uuid)
         self.obj_reset_changes()
 
+    @_invalidates_cache
     @base.remotable
     def save(self, context=None):
         """Save updates to this ClusterTemplate.
@@ -60,6 +60,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get(cls, context, federation_id):
         """Find a federation based on its id or uuid and return it.
 
@@ -75,6 +76,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
             raise exception.InvalidIdentity(identity=federation_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, federation_id):
         """Find a federation based on its integer id and return it.
 
@@ -87,6 +89,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
         return federation
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_uuid(cls, context, uuid):
         """Find a federation based on uuid and return it.
 
@@ -99,6 +102,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
         return federation
 
     @base.remotable_classmethod
+    @base.read_only
     def get_count_all(cls, context, filters=None):
         """Get count of matching federation.
 
@@ -111,6 +115,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
         return cls.dbapi.get_federation_count_all(context, filters=filters)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_name(cls, context, name):
         """Find a federation based on name and return a Federation object.
 
@@ -123,6 +128,7 @@ class Federation(base.MagnumPersistentObject, base.MagnumObject,
         return federation
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
              sort_key=None, sort_dir=None, filters=None):
         """Return a list of Federation objects.
@@ -50,6 +50,7 @@ class MagnumService(base.MagnumPersistentObject, base.MagnumObject):
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_host_and_binary(cls, context, host, binary):
         """Find a magnum_service based on its hostname and binary.
 
@@ -67,6 +68,7 @@ class MagnumService(base.MagnumPersistentObject, base.MagnumObject):
         return magnum_service
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
              sort_key=None, sort_dir=None):
         """Return a list of MagnumService objects.
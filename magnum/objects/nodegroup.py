@@ -27,8 +27,10 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
                 base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
     # Version 1.1: min_node_count defaults to 0
+    # Version 1.2: Added list_by_stack_id method
+    # Version 1.3: Added cursor to list
 
-    VERSION = '1.1'
+    VERSION = '1.3'
 
     dbapi = dbapi.get_instance()
 
@@ -70,6 +72,7 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get(cls, context, cluster_id, nodegroup_id):
         """Find a nodegroup based on its id or uuid and return a NodeGroup.
 
@@ -86,6 +89,7 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
             return cls.get_by_name(context, cluster_id, nodegroup_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, cluster, id_):
         """Find a nodegroup based on its integer id and return a NodeGroup.
 
@@ -99,6 +103,7 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
         return nodegroup
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_uuid(cls, context, cluster, uuid):
         """Find a nodegroup based on uuid and return a :class:`NodeGroup`.
 
@@ -112,6 +117,7 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
         return nodegroup
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_name(cls, context, cluster, name):
         """Find a nodegroup based on name and return a NodeGroup object.
 
@@ -125,6 +131,7 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
         return nodegroup
 
     @base.remotable_classmethod
+    @base.read_only
     def get_count_all(cls, context, cluster_id):
         """Get count of nodegroups in cluster.
 
@@ -135,8 +142,9 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
         return cls.dbapi.get_cluster_nodegroup_count(context, cluster_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, cluster_id, limit=None, marker=None,
-             sort_key=None, sort_dir=None, filters=None):
+             sort_key=None, sort_dir=None, filters=None, cursor=None):
         """Return a list of NodeGroup objects.
 
         :param context: Security context.
@@ -148,12 +156,28 @@ class NodeGroup(base.MagnumPersistentObject, base.MagnumObject,
         :param filters: filter dict, can includes 'name', 'node_count',
                         'stack_id', 'node_addresses',
                         'status'(should be a status list).
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: a list of :class:`NodeGroup` objects.
 
         """
         db_nodegroups = cls.dbapi.list_cluster_nodegroups(
             context, cluster_id, limit=limit, marker=marker, sort_key=sort_key,
-            sort_dir=sort_dir, filters=filters)
+            sort_dir=sort_dir, filters=filters, cursor=cursor)
+        return NodeGroup._from_db_object_list(db_nodegroups, cls, context)
+
+    @base.remotable_classmethod
+    @base.read_only
+    def list_by_stack_id(cls, context, stack_id):
+        """Return the NodeGroup objects backed by a Heat stack.
+
+        :param context: Security context.
+        :param stack_id: The id of the Heat stack.
+        :returns: a list of :class:`NodeGroup` objects.
+
+        """
+        db_nodegroups = cls.dbapi.list_nodegroups_by_stack_id(context,
+                                                              stack_id)
         return NodeGroup._from_db_object_list(db_nodegroups, cls, context)
 
     @base.remotable
@@ -20,7 +20,8 @@ from magnum.objects import base
 class Quota(base.MagnumPersistentObject, base.MagnumObject,
             base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Added cursor to list
+    VERSION = '1.1'
 
     dbapi = dbapi.get_instance()
 
@@ -32,6 +33,7 @@ class Quota(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @base.remotable_classmethod
+    @base.read_only
     def get_quota_by_project_id_resource(cls, context, project_id, resource):
         """Find a quota based on its integer id and return a Quota object.
 
@@ -61,6 +63,7 @@ class Quota(base.MagnumPersistentObject, base.MagnumObject,
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, quota_id):
         """Find a quota based on its integer id and return a Quota object.
 
@@ -73,8 +76,9 @@ class Quota(base.MagnumPersistentObject, base.MagnumObject,
         return quota
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None, filters=None):
+             sort_key=None, sort_dir=None, filters=None, cursor=None):
         """Return a list of Quota objects.
 
         :param context: Security context.
@@ -84,6 +88,8 @@ class Quota(base.MagnumPersistentObject, base.MagnumObject,
         :param sort_dir: direction to sort. "asc" or "desc".
         :param filters: filter dict, can includes 'project_id',
                         'resource'.
+        :param cursor: the values of the sort key and of the id of the last
+                       item of the previous page, used instead of a marker.
         :returns: a list of :class:`Quota` object.
 
         """
@@ -92,10 +98,12 @@ class Quota(base.MagnumPersistentObject, base.MagnumObject,
                                              marker=marker,
                                              sort_key=sort_key,
                                              sort_dir=sort_dir,
-                                             filters=filters)
+                                             filters=filters,
+                                             cursor=cursor)
         return Quota._from_db_object_list(db_quotas, cls, context)
 
     @base.remotable_classmethod
+    @base.read_only
     def quota_get_all_by_project_id(cls, context, project_id):
         """Find a quota based on project id.
 
@@ -34,6 +34,7 @@ class Stats(base.MagnumObject, base.MagnumObjectDictCompat):
     }
 
     @base.remotable_classmethod
+    @base.read_only
     def get_cluster_stats(cls, context, project_id=None):
         """Return cluster stats for the given project.
 
@@ -56,6 +56,7 @@ class X509KeyPair(base.MagnumPersistentObject, base.MagnumObject):
                 for obj in db_objects]
 
     @base.remotable_classmethod
+    @base.read_only
     def get(cls, context, x509keypair_id):
         """Find a X509KeyPair based on its id or uuid.
 
@@ -73,6 +74,7 @@ class X509KeyPair(base.MagnumPersistentObject, base.MagnumObject):
             raise exception.InvalidIdentity(identity=x509keypair_id)
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_id(cls, context, x509keypair_id):
         """Find a X509KeyPair based on its integer id.
 
@@ -88,6 +90,7 @@ class X509KeyPair(base.MagnumPersistentObject, base.MagnumObject):
         return x509keypair
 
     @base.remotable_classmethod
+    @base.read_only
     def get_by_uuid(cls, context, uuid):
         """Find a x509keypair based on uuid and return a :class:`X509KeyPair` object.
 
@@ -100,6 +103,7 @@ class X509KeyPair(base.MagnumPersistentObject, base.MagnumObject):
         return x509keypair
 
     @base.remotable_classmethod
+    @base.read_only
     def list(cls, context, limit=None, marker=None,
              sort_key=None, sort_dir=None, filters=None):
         """Return a list of X509KeyPair objects.
@@ -0,0 +1,97 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Event driven cluster status sync from Heat stack notifications."""
+
+from oslo_log import log
+import oslo_messaging as messaging
+
+from magnum.common import context
+from magnum.common import exception
+from magnum.common import rpc
+import magnum.conf
+from magnum import objects
+from magnum.service import periodic
+
+
+CONF = magnum.conf.CONF
+LOG = log.getLogger(__name__)
+
+
+def _get_stack_id(payload):
+    # NOTE: Heat sends the stack identity as an ARN such as
+    # arn:openstack:heat::<project>:stacks/<stack name>/<stack id>
+    identity = payload.get('stack_identity')
+    if not identity:
+        return None
+    return identity.rstrip('/').rsplit('/', 1)[-1]
+
+
+class HeatStackEndpoint(object):
+    """Sync the nodegroup backed by a stack when Heat reports on it."""
+
+    filter_rule = messaging.NotificationFilter(
+        event_type=r'^orchestration\.stack\..*\.(end|error)$')
+
+    def __init__(self):
+        self.scheduler = periodic.get_status_sync()
+
+    def info(self, ctxt, publisher_id, event_type, payload, metadata):
+        self._process(event_type, payload)
+
+    def error(self, ctxt, publisher_id, event_type, payload, metadata):
+        self._process(event_type, payload)
+
+    def _process(self, event_type, payload):
+        stack_id = _get_stack_id(payload)
+        if stack_id is None:
+            return
+        try:
+            self.sync_stack(stack_id)
+        except Exception as e:
+            LOG.warning("Failed to handle %(event)s for stack %(stack)s: "
+                        "%(e)s",
+                        {'event': event_type, 'stack': stack_id, 'e': e},
+                        exc_info=True)
+
+    def sync_stack(self, stack_id):
+        ctx = context.make_admin_context(all_tenants=True)
+        nodegroups = objects.NodeGroup.list_by_stack_id(ctx, stack_id)
+        if not nodegroups:
+            # Not a stack managed by Magnum.
+            return
+        try:
+            cluster = objects.Cluster.get_by_uuid(ctx,
+                                                  nodegroups[0].cluster_id)
+        except exception.ClusterNotFound:
+            return
+        if not cluster.status.endswith('_IN_PROGRESS'):
+            # Only clusters with an operation in progress are synced, as
+            # the periodic task does.
+            return
+        LOG.debug("Stack %(stack)s of cluster %(cluster)s changed, syncing "
+                  "its status", {'stack': stack_id, 'cluster': cluster.uuid})
+        job = periodic.ClusterUpdateJob(ctx, cluster, stack_ids=[stack_id])
+        if not self.scheduler.submit(cluster.uuid, job.update_status):
+            # The cluster is being synced already, the periodic task picks
+            # up whatever that sync missed.
+            LOG.debug("Cluster %s is already being synced", cluster.uuid)
+
+
+def get_listener(executor='eventlet'):
+    exchange = CONF.cluster_heat.stack_notifications_exchange
+    targets = [messaging.Target(topic=topic, exchange=exchange)
+               for topic in CONF.cluster_heat.stack_notifications_topics]
+    return rpc.get_notification_listener(
+        targets, [HeatStackEndpoint()],
+        pool=CONF.cluster_heat.stack_notifications_pool,
+        executor=executor)
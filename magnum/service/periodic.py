@@ -14,15 +14,18 @@
 # limitations under the License.
 
 import functools
+import threading
 
+import futurist
 from oslo_log import log
-from oslo_service import loopingcall
 from oslo_service import periodic_task
+from oslo_utils import timeutils
 
 from pycadf import cadftaxonomy as taxonomy
 
 from magnum.common import context
 from magnum.common import exception
+from magnum.common import hash_ring
 from magnum.common import profiler
 from magnum.common import rpc
 from magnum.conductor import monitors
@@ -59,17 +62,21 @@ class ClusterUpdateJob(object):
         objects.fields.ClusterStatus.ROLLBACK_FAILED: taxonomy.ACTION_UPDATE
     }
 
-    def __init__(self, ctx, cluster):
+    def __init__(self, ctx, cluster, stack_ids=None):
         self.ctx = ctx
         self.cluster = cluster
+        self.stack_ids = stack_ids
 
     def update_status(self):
         LOG.debug("Updating status for cluster %s", self.cluster.id)
         # get the driver for the cluster
         cdriver = driver.Driver.get_driver_for_cluster(self.ctx, self.cluster)
+        kwargs = {}
+        if self.stack_ids is not None:
+            kwargs['stack_ids'] = self.stack_ids
         # ask the driver to sync status
         try:
-            cdriver.update_cluster_status(self.ctx, self.cluster)
+            cdriver.update_cluster_status(self.ctx, self.cluster, **kwargs)
         except exception.AuthorizationFailure as e:
             trust_ex = ("Could not find trust: %s" % self.cluster.trust_id)
             # Try to use admin context if trust not found.
@@ -77,7 +84,7 @@ class ClusterUpdateJob(object):
             # Magnum, we still be able to check cluster status
             if trust_ex in str(e):
                 cdriver.update_cluster_status(
-                    self.ctx, self.cluster, use_admin_ctx=True)
+                    self.ctx, self.cluster, use_admin_ctx=True, **kwargs)
             else:
                 raise
 
@@ -99,15 +106,57 @@ class ClusterUpdateJob(object):
             for ng in objects.NodeGroup.list(self.ctx, self.cluster.uuid):
                 ng.destroy()
             self.cluster.destroy()
-        # end the "loop"
-        raise loopingcall.LoopingCallDone()
+
+
+class HealthStatusBatch(object):
+    """Health status changes of a health sync pass, saved together.
+
+    The clusters whose health status or reason changed are saved with a
+    single update when the pass finishes, and a notification is sent for
+    those whose health status changed.
+    """
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self._lock = threading.Lock()
+        self._clusters = {}
+        self._transitions = {}
+
+    def add(self, cluster, previous_health_status):
+        with self._lock:
+            self._clusters[cluster.uuid] = cluster
+            if cluster.health_status != previous_health_status:
+                self._transitions.setdefault(cluster.uuid,
+                                             previous_health_status)
+
+    def flush(self):
+        with self._lock:
+            clusters = list(self._clusters.values())
+            transitions = self._transitions
+            self._clusters = {}
+            self._transitions = {}
+        if not clusters:
+            return
+
+        objects.Cluster.save_health_status(self.ctx, clusters)
+        LOG.debug("Saved the health status of %d cluster(s)", len(clusters))
+        for cluster in clusters:
+            if cluster.uuid in transitions:
+                conductor_utils.notify_about_cluster_health_status(
+                    self.ctx, cluster, transitions[cluster.uuid])
 
 
 class ClusterHealthUpdateJob(object):
 
-    def __init__(self, ctx, cluster):
+    def __init__(self, ctx, cluster, batch=None):
         self.ctx = ctx
         self.cluster = cluster
+        self.batch = batch
+
+    def _health_status(self):
+        return tuple(getattr(self.cluster, field)
+                     if self.cluster.obj_attr_is_set(field) else None
+                     for field in objects.cluster.HEALTH_STATUS_FIELDS)
 
     def _update_health_status(self):
         monitor = monitors.create_monitor(self.ctx, self.cluster)
@@ -127,10 +176,23 @@ class ClusterHealthUpdateJob(object):
             return
 
         if monitor.data.get('health_status'):
+            previous = self._health_status()
             self.cluster.health_status = monitor.data.get('health_status')
             self.cluster.health_status_reason = monitor.data.get(
                 'health_status_reason')
+            # Compare once set, as the reason values are coerced to strings.
+            if previous == self._health_status():
+                self.cluster.obj_reset_changes(
+                    objects.cluster.HEALTH_STATUS_FIELDS)
+                return
+
+            if self.batch is not None:
+                self.batch.add(self.cluster, previous[0])
+                return
             self.cluster.save()
+            if self.cluster.health_status != previous[0]:
+                conductor_utils.notify_about_cluster_health_status(
+                    self.ctx, self.cluster, previous[0])
 
     def update_health_status(self):
         LOG.debug("Updating health status for cluster %s", self.cluster.id)
@@ -138,9 +200,248 @@ class ClusterHealthUpdateJob(object):
         LOG.debug("Status for cluster %s updated to %s (%s)",
                   self.cluster.id, self.cluster.health_status,
                   self.cluster.health_status_reason)
-        # TODO(flwang): Health status update notifications?
-        # end the "loop"
-        raise loopingcall.LoopingCallDone()
+
+
+class _SyncPass(object):
+    """Book-keeping for the jobs submitted by one periodic sync pass."""
+
+    def __init__(self, name, timeout, on_finish=None):
+        self.name = name
+        self.on_finish = on_finish
+        self.deadline = timeutils.StopWatch(duration=timeout)
+        self.deadline.start()
+        self.submitted = 0
+        self.skipped = 0
+        self.expired = 0
+        self.failed = 0
+        self.duration = None
+        # The submitting loop holds one reference until every job has been
+        # queued, so the pass cannot finish while jobs are still added.
+        self._pending = 1
+        self._lock = threading.Lock()
+
+    def add(self):
+        with self._lock:
+            self.submitted += 1
+            self._pending += 1
+
+    def done(self):
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self.finish()
+
+    def finish(self):
+        self.duration = duration = self.deadline.elapsed()
+        LOG.debug("Periodic %(name)s pass finished in %(duration).2fs: "
+                  "%(submitted)d submitted, %(skipped)d already in flight, "
+                  "%(expired)d expired, %(failed)d failed",
+                  {'name': self.name, 'duration': duration,
+                   'submitted': self.submitted, 'skipped': self.skipped,
+                   'expired': self.expired, 'failed': self.failed})
+        if self.expired:
+            LOG.warning("Periodic %(name)s pass hit its deadline, "
+                        "%(expired)d cluster(s) left for the next pass.",
+                        {'name': self.name, 'expired': self.expired})
+        if self.on_finish is not None:
+            try:
+                self.on_finish()
+            except Exception as e:
+                LOG.warning("Failed to finish periodic %(name)s pass: %(e)s",
+                            {'name': self.name, 'e': e}, exc_info=True)
+
+
+class ClusterSyncScheduler(object):
+    """Run per-cluster periodic jobs on a bounded pool of green threads.
+
+    A cluster is handed to the pool at most once: while a job for it is
+    still queued or running, later passes skip it instead of piling up
+    more polls against the same stack. Jobs that have not started when
+    the pass deadline expires are dropped and left for the next pass.
+    """
+
+    def __init__(self, name, workers=None, timeout=None):
+        self.name = name
+        self.workers = workers or CONF.conductor.sync_workers
+        self.timeout = timeout or CONF.conductor.sync_pass_timeout
+        self._executor = futurist.GreenThreadPoolExecutor(
+            max_workers=self.workers)
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._queued = 0
+        self.last_pass = None
+
+    @property
+    def queue_depth(self):
+        """Number of jobs waiting for a free worker."""
+        return self._queued
+
+    @property
+    def in_flight(self):
+        """Number of clusters with a queued or running job."""
+        return len(self._in_flight)
+
+    def statistics(self):
+        stats = {
+            'queue_depth': self.queue_depth,
+            'in_flight': self.in_flight,
+            'workers': self.workers,
+        }
+        if self.last_pass is not None:
+            stats.update({
+                'last_pass_submitted': self.last_pass.submitted,
+                'last_pass_skipped': self.last_pass.skipped,
+                'last_pass_expired': self.last_pass.expired,
+                'last_pass_failed': self.last_pass.failed,
+                'last_pass_duration': self.last_pass.duration,
+            })
+        return stats
+
+    def run_pass(self, jobs, on_finish=None):
+        """Submit a pass of jobs.
+
+        :param jobs: iterable of (cluster uuid, callable) pairs.
+        :param on_finish: optional callable run once every job of the pass
+                          is done.
+        """
+        sync_pass = _SyncPass(self.name, self.timeout, on_finish=on_finish)
+        self.last_pass = sync_pass
+        for key, func in jobs:
+            with self._lock:
+                if key in self._in_flight:
+                    sync_pass.skipped += 1
+                    continue
+                self._in_flight.add(key)
+                self._queued += 1
+            sync_pass.add()
+            self._executor.submit(self._run, key, func, sync_pass)
+        LOG.debug("Periodic %(name)s pass submitted %(submitted)d "
+                  "cluster(s), queue depth %(depth)d",
+                  {'name': self.name, 'submitted': sync_pass.submitted,
+                   'depth': self.queue_depth})
+        sync_pass.done()
+        return sync_pass
+
+    def submit(self, key, func):
+        """Submit a single job, outside of any pass.
+
+        :param key: the cluster uuid.
+        :param func: the callable syncing the cluster.
+        :returns: False if a job for the cluster is already in flight.
+        """
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+            self._queued += 1
+        self._executor.submit(self._run, key, func)
+        return True
+
+    def _run(self, key, func, sync_pass=None):
+        with self._lock:
+            self._queued -= 1
+        try:
+            if sync_pass is not None and sync_pass.deadline.expired():
+                sync_pass.expired += 1
+                LOG.debug("Skipping periodic %(name)s of cluster %(key)s, "
+                          "pass deadline expired",
+                          {'name': self.name, 'key': key})
+                return
+            func()
+        except Exception as e:
+            if sync_pass is not None:
+                sync_pass.failed += 1
+            LOG.warning("Periodic %(name)s of cluster %(key)s failed: %(e)s",
+                        {'name': self.name, 'key': key, 'e': e},
+                        exc_info=True)
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+            if sync_pass is not None:
+                sync_pass.done()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+_STATUS_SYNC = None
+_STATUS_SYNC_LOCK = threading.Lock()
+
+
+def get_status_sync():
+    """Return the scheduler of the cluster status syncs of this process.
+
+    The periodic status sync and the Heat stack notification listener share
+    it, so that a cluster is only synced by one of them at a time.
+    """
+    global _STATUS_SYNC
+    with _STATUS_SYNC_LOCK:
+        if _STATUS_SYNC is None:
+            _STATUS_SYNC = ClusterSyncScheduler('status sync')
+        return _STATUS_SYNC
+
+
+class ConductorShard(object):
+    """Select the clusters this conductor host syncs periodically.
+
+    The live magnum-conductor hosts, as reported by their magnum_service
+    heartbeats, are placed on a consistent hash ring and each cluster is
+    synced only by the host its UUID maps to. The ring is rebuilt when the
+    membership changes, so the clusters of a conductor that stops
+    heartbeating move to the remaining hosts.
+    """
+
+    def __init__(self, host, binary='magnum-conductor'):
+        self.host = host
+        self.binary = binary
+        self.ring = None
+
+    @staticmethod
+    def _is_up(service):
+        if service.forced_down:
+            return False
+        last_heartbeat = (service.last_seen_up or service.updated_at or
+                          service.created_at)
+        elapsed = timeutils.delta_seconds(last_heartbeat,
+                                          timeutils.utcnow(True))
+        return abs(elapsed) <= CONF.service_down_time
+
+    def refresh(self, ctx):
+        try:
+            services = objects.MagnumService.list(ctx)
+        except Exception as e:
+            LOG.warning("Failed to list conductors for periodic sync "
+                        "sharding: %s", e)
+            if self.ring is None:
+                self.ring = hash_ring.HashRing([self.host])
+            return
+
+        hosts = set(service.host for service in services
+                    if service.binary == self.binary and
+                    self._is_up(service))
+        # Always keep this host on the ring, its own heartbeat may simply
+        # not have been recorded yet.
+        hosts.add(self.host)
+        if self.ring is not None and self.ring.hosts == hosts:
+            return
+        if self.ring is not None:
+            LOG.info("Conductor membership changed from %(old)s to "
+                     "%(new)s, rebalancing periodic cluster sync",
+                     {'old': sorted(self.ring.hosts), 'new': sorted(hosts)})
+        self.ring = hash_ring.HashRing(hosts)
+
+    def owns(self, cluster):
+        return self.ring.get_host(cluster.uuid) == self.host
+
+    def filter(self, ctx, clusters):
+        self.refresh(ctx)
+        owned = [cluster for cluster in clusters if self.owns(cluster)]
+        LOG.debug("Conductor %(host)s owns %(owned)d of %(total)d clusters "
+                  "across %(members)d conductor(s)",
+                  {'host': self.host, 'owned': len(owned),
+                   'total': len(clusters), 'members': len(self.ring.hosts)})
+        return owned
 
 
 @profiler.trace_cls("rpc")
@@ -163,6 +464,16 @@ class MagnumPeriodicTasks(periodic_task.PeriodicTasks):
     def __init__(self, conf):
         super(MagnumPeriodicTasks, self).__init__(conf)
         self.notifier = rpc.get_notifier()
+        self.status_sync = get_status_sync()
+        self.health_sync = ClusterSyncScheduler('health sync')
+        self.shard = None
+        if CONF.conductor.shard_periodic_sync:
+            self.shard = ConductorShard(CONF.host)
+
+    def _owned_clusters(self, ctx, clusters):
+        if self.shard is None:
+            return clusters
+        return self.shard.filter(ctx, clusters)
 
     @periodic_task.periodic_task(spacing=10, run_immediately=True)
     @set_context
@@ -176,18 +487,15 @@ class MagnumPeriodicTasks(periodic_task.PeriodicTasks):
                       objects.fields.ClusterStatus.DELETE_IN_PROGRESS,
                       objects.fields.ClusterStatus.ROLLBACK_IN_PROGRESS]
             filters = {'status': status}
-            clusters = objects.Cluster.list(ctx, filters=filters)
+            clusters = self._owned_clusters(
+                ctx, objects.Cluster.list(ctx, filters=filters))
             if not clusters:
                 return
 
             # synchronize with underlying orchestration
-            for cluster in clusters:
-                job = ClusterUpdateJob(ctx, cluster)
-                # though this call isn't really looping, we use this
-                # abstraction anyway to avoid dealing directly with eventlet
-                # hooey
-                lc = loopingcall.FixedIntervalLoopingCall(f=job.update_status)
-                lc.start(1, stop_on_exception=True)
+            self.status_sync.run_pass(
+                (cluster.uuid, ClusterUpdateJob(ctx, cluster).update_status)
+                for cluster in clusters)
 
         except Exception as e:
             LOG.warning(
@@ -207,19 +515,20 @@ class MagnumPeriodicTasks(periodic_task.PeriodicTasks):
                       objects.fields.ClusterStatus.UPDATE_IN_PROGRESS,
                       objects.fields.ClusterStatus.ROLLBACK_IN_PROGRESS]
             filters = {'status': status}
-            clusters = objects.Cluster.list(ctx, filters=filters)
+            clusters = self._owned_clusters(
+                ctx, objects.Cluster.list(ctx, filters=filters))
             if not clusters:
                 return
 
-            # synchronize using native COE API
-            for cluster in clusters:
-                job = ClusterHealthUpdateJob(ctx, cluster)
-                # though this call isn't really looping, we use this
-                # abstraction anyway to avoid dealing directly with eventlet
-                # hooey
-                lc = loopingcall.FixedIntervalLoopingCall(
-                    f=job.update_health_status)
-                lc.start(1, stop_on_exception=True)
+            # synchronize using native COE API, saving the changes of the
+            # whole pass at once
+            batch = HealthStatusBatch(ctx)
+            self.health_sync.run_pass(
+                ((cluster.uuid,
+                  ClusterHealthUpdateJob(ctx, cluster,
+                                         batch).update_health_status)
+                 for cluster in clusters),
+                on_finish=batch.flush)
 
         except Exception as e:
             LOG.warning(
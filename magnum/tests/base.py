@@ -27,7 +27,12 @@ import testscenarios
 
 from magnum.common import context as magnum_context
 from magnum.common import keystone as magnum_keystone
+from magnum.common import lookup_cache
+from magnum.conductor.handlers.common import cert_manager
+from magnum.conductor import k8s_api
+from magnum.drivers.heat import template_cache
 from magnum.objects import base as objects_base
+from magnum.objects import cluster_template
 from magnum.tests import conf_fixture
 from magnum.tests import fake_notifier
 from magnum.tests import output_fixture
@@ -77,6 +82,8 @@ class TestCase(base.BaseTestCase):
         self.global_mocks = {}
 
         self.keystone_client = magnum_keystone.KeystoneClientV3(self.context)
+        self.addCleanup(magnum_keystone.SESSION_CACHE.clear)
+        self.addCleanup(magnum_keystone.TOKEN_INFO.clear)
 
         self.policy = self.useFixture(policy_fixture.PolicyFixture())
 
@@ -121,6 +128,11 @@ class TestCase(base.BaseTestCase):
 
         self.useFixture(conf_fixture.ConfFixture())
         self.useFixture(fixtures.NestedTempfile())
+        self.addCleanup(k8s_api.SESSION_CACHE.clear)
+        self.addCleanup(cert_manager.CLIENT_CREDENTIALS.clear)
+        self.addCleanup(template_cache.TEMPLATES.clear)
+        self.addCleanup(cluster_template.CLUSTER_TEMPLATES.clear)
+        self.addCleanup(lookup_cache.LOOKUPS.clear)
 
         self._base_test_obj_backup = copy.copy(
             objects_base.MagnumObjectRegistry._registry._obj_classes)
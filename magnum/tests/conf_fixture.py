@@ -29,5 +29,6 @@ class ConfFixture(fixtures.Fixture):
         CONF.set_default('host', 'fake-mini')
         CONF.set_default('connection', "sqlite://", group='database')
         CONF.set_default('sqlite_synchronous', False, group='database')
+        CONF.set_default('rsa_key_pool_size', 0, group='x509')
         config.parse_args([], default_config_files=[])
         self.addCleanup(CONF.reset)
@@ -0,0 +1,72 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-memory stand-in for the Octavia client used by magnum."""
+
+import collections
+import copy
+
+from osc_lib import exceptions as osc_exc
+
+
+class FakeOctaviaClient(object):
+    """Load balancers deleted asynchronously, as Octavia does.
+
+    A deleted load balancer stays in PENDING_DELETE for delete_polls status
+    checks, then disappears. Pass stuck=True to keep them forever.
+    """
+
+    def __init__(self, lbs=(), delete_polls=2, stuck=False):
+        self.lbs = collections.OrderedDict(
+            (lb["id"], dict(lb)) for lb in lbs)
+        self.delete_polls = delete_polls
+        self.stuck = stuck
+        self._pending = {}
+        self.calls = collections.Counter()
+        self.deleted = []
+
+    def add(self, lb_id, description="", status="ACTIVE", vip_port_id=None):
+        self.lbs[lb_id] = {
+            "id": lb_id,
+            "name": lb_id,
+            "description": description,
+            "provisioning_status": status,
+            "vip_port_id": vip_port_id or "port-%s" % lb_id,
+        }
+
+    def _tick(self, lb_id):
+        if lb_id not in self._pending or self.stuck:
+            return
+        self._pending[lb_id] -= 1
+        if self._pending[lb_id] <= 0:
+            del self._pending[lb_id]
+            del self.lbs[lb_id]
+
+    def load_balancer_list(self, **filters):
+        self.calls["load_balancer_list"] += 1
+        return {"loadbalancers": [copy.deepcopy(lb)
+                                  for lb in self.lbs.values()]}
+
+    def load_balancer_show(self, lb_id):
+        self.calls["load_balancer_show"] += 1
+        self._tick(lb_id)
+        if lb_id not in self.lbs:
+            raise osc_exc.NotFound(404)
+        return copy.deepcopy(self.lbs[lb_id])
+
+    def load_balancer_delete(self, lb_id, cascade=False):
+        self.calls["load_balancer_delete"] += 1
+        if lb_id not in self.lbs:
+            raise osc_exc.NotFound(404)
+        self.deleted.append(lb_id)
+        self.lbs[lb_id]["provisioning_status"] = "PENDING_DELETE"
+        self._pending[lb_id] = self.delete_polls
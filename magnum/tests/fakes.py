@@ -13,6 +13,7 @@
 import time
 from unittest import mock
 
+import futurist
 from oslo_service import loopingcall
 
 fakeAuthTokenHeaders = {'X-User-Id': u'773a902f022949619b5c2f32cd89d419',
@@ -124,3 +125,15 @@ class FakeLoopingCall(object):
                     raise exc
             if interval:
                 time.sleep(interval)
+
+
+class FakeGreenThreadPoolExecutor(futurist.SynchronousExecutor):
+    """Fake a green thread pool by running submitted work inline
+
+       For tests, run every job in the caller so that the results can be
+       checked as soon as the submitting call returns.
+    """
+
+    def __init__(self, max_workers=None, **kwargs):
+        super(FakeGreenThreadPoolExecutor, self).__init__()
+        self.max_workers = max_workers
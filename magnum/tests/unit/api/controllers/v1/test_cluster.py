@@ -21,6 +21,7 @@ from wsme import types as wtypes
 
 from magnum.api import attr_validator
 from magnum.api.controllers.v1 import cluster as api_cluster
+from magnum.api import utils as api_utils
 from magnum.common import exception
 from magnum.conductor import api as rpcapi
 import magnum.conf
@@ -124,6 +125,16 @@ class TestListCluster(api_base.FunctionalTest):
         self.assertIn('labels_added', response)
         self.assertIn('labels_skipped', response)
 
+    def test_get_one_by_uuid_nodegroups_loaded_once(self):
+        temp_uuid = uuidutils.generate_uuid()
+        obj_utils.create_test_cluster(self.context, uuid=temp_uuid)
+        with mock.patch.object(objects.NodeGroup, 'list',
+                               side_effect=objects.NodeGroup.list) as m_list:
+            response = self.get_json('/clusters/%s' % temp_uuid)
+        self.assertEqual(temp_uuid, response['uuid'])
+        self.assertEqual(3, response['node_count'])
+        m_list.assert_called_once_with(mock.ANY, temp_uuid)
+
     def test_get_one_merged_labels(self):
         ct_uuid = uuidutils.generate_uuid()
         ct_labels = {'label1': 'value1', 'label2': 'value2'}
@@ -185,6 +196,36 @@ class TestListCluster(api_base.FunctionalTest):
         self.assertEqual(cluster_list[-1].uuid,
                          response['clusters'][0]['uuid'])
 
+    def test_get_all_with_pagination_cursor(self):
+        headers = {'OpenStack-API-Version': 'container-infra 1.12'}
+        for id_, name in enumerate(['b', 'a', 'c', 'a']):
+            obj_utils.create_test_cluster(self.context, id=id_, name=name,
+                                          uuid=uuidutils.generate_uuid())
+
+        names = []
+        url = '/clusters?limit=3&sort_key=name'
+        while url:
+            response = self.get_json(url, headers=headers)
+            names += [c['name'] for c in response['clusters']]
+            self.assertNotIn('marker=', response.get('next', ''))
+            url = response.get('next', '').partition('/v1')[2]
+        self.assertEqual(['a', 'a', 'b', 'c'], names)
+
+    def test_get_all_with_invalid_cursor(self):
+        headers = {'OpenStack-API-Version': 'container-infra 1.12'}
+        cursor = api_utils.encode_cursor(
+            obj_utils.create_test_cluster(self.context), 'id', 'asc')
+
+        for url in ('/clusters?cursor=invalid',
+                    '/clusters?sort_dir=desc&cursor=%s' % cursor,
+                    '/clusters/detail?sort_key=name&cursor=%s' % cursor):
+            response = self.get_json(url, headers=headers,
+                                     expect_errors=True)
+            self.assertEqual(400, response.status_int)
+        response = self.get_json('/clusters?cursor=%s' % cursor,
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
     @mock.patch("magnum.common.policy.enforce")
     @mock.patch("magnum.common.context.make_context")
     @mock.patch("magnum.objects.Cluster.obj_load_attr")
@@ -224,6 +265,24 @@ class TestListCluster(api_base.FunctionalTest):
         self._verify_attrs(self._expand_cluster_attrs,
                            response['clusters'][0])
 
+    def test_detail_with_pagination_cursor(self):
+        headers = {'OpenStack-API-Version': 'container-infra 1.12'}
+        cluster_list = []
+        for id_ in range(4):
+            cluster = obj_utils.create_test_cluster(
+                self.context, id=id_, uuid=uuidutils.generate_uuid())
+            cluster_list.append(cluster)
+
+        response = self.get_json('/clusters/detail?limit=3&sort_dir=desc',
+                                 headers=headers)
+        self.assertIn('/clusters/detail?', response['next'])
+        response = self.get_json(response['next'].partition('/v1')[2],
+                                 headers=headers)
+        self.assertEqual([cluster_list[0].uuid],
+                         [c['uuid'] for c in response['clusters']])
+        self._verify_attrs(self._expand_cluster_attrs,
+                           response['clusters'][0])
+
     def test_detail_against_single(self):
         cluster = obj_utils.create_test_cluster(self.context)
         response = self.get_json('/clusters/%s/detail' % cluster['uuid'],
@@ -642,6 +701,22 @@ class TestPost(api_base.FunctionalTest):
         self.assertEqual(403, response.status_int)
         self.assertTrue(response.json['errors'])
 
+    @mock.patch('oslo_utils.timeutils.utcnow')
+    def test_create_cluster_project_quota_reached(self, mock_utcnow):
+        mock_utcnow.return_value = datetime.datetime(2000, 1, 1, 0, 0)
+        obj_utils.create_test_quota(self.context,
+                                    project_id=self.context.project_id,
+                                    resource='Cluster', hard_limit=1)
+        bdict = apiutils.cluster_post_data()
+
+        response = self.post_json('/clusters', bdict)
+        self.assertEqual(202, response.status_int)
+
+        response = self.post_json('/clusters', bdict, expect_errors=True)
+        self.assertEqual(403, response.status_int)
+        self.assertIn('maximum clusters per project, 1',
+                      response.json['errors'][0]['detail'])
+
     def test_create_cluster_set_project_id_and_user_id(self):
         bdict = apiutils.cluster_post_data()
 
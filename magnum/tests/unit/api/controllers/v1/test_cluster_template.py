@@ -156,6 +156,24 @@ class TestListClusterTemplate(api_base.FunctionalTest):
         self.assertEqual(bm_list[-1].uuid,
                          response['clustertemplates'][0]['uuid'])
 
+    def test_get_all_with_pagination_cursor(self):
+        headers = {'OpenStack-API-Version': 'container-infra 1.12'}
+        bm_list = []
+        for id_ in range(4):
+            cluster_template = obj_utils.create_test_cluster_template(
+                self.context, id=id_,
+                uuid=uuidutils.generate_uuid())
+            bm_list.append(cluster_template)
+
+        response = self.get_json('/clustertemplates?limit=3',
+                                 headers=headers)
+        self.assertIn('cursor=', response['next'])
+        response = self.get_json(response['next'].partition('/v1')[2],
+                                 headers=headers)
+        self.assertEqual([bm_list[-1].uuid],
+                         [ct['uuid'] for ct in response['clustertemplates']])
+        self.assertNotIn('next', response)
+
     @mock.patch("magnum.common.policy.enforce")
     @mock.patch("magnum.common.context.make_context")
     def test_get_all_with_all_projects(self, mock_context, mock_policy):
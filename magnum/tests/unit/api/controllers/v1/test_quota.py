@@ -164,6 +164,27 @@ class TestQuota(api_base.FunctionalTest):
         self.assertTrue('limit=2' in response['next'])
         self.assertTrue('marker=%s' % quota_list[1].id in response['next'])
 
+    @mock.patch("magnum.common.policy.enforce")
+    @mock.patch("magnum.common.context.make_context")
+    def test_get_all_admin_all_with_pagination_cursor(self, mock_context,
+                                                      mock_policy):
+        mock_context.return_value = self.context
+        for i in range(4):
+            obj_utils.create_test_quota(self.context,
+                                        project_id="proj-id-"+str(i))
+
+        self.context.is_admin = True
+        headers = {'OpenStack-API-Version': 'container-infra 1.12'}
+        response = self.get_json(
+            '/quotas?limit=3&sort_key=project_id&sort_dir=desc'
+            '&all_tenants=True', headers=headers)
+        self.assertIn('cursor=', response['next'])
+        response = self.get_json(
+            response['next'].partition('/v1')[2] + '&all_tenants=True',
+            headers=headers)
+        self.assertEqual(['proj-id-0'],
+                         [r['project_id'] for r in response['quotas']])
+
     @mock.patch("magnum.common.policy.enforce")
     @mock.patch("magnum.common.context.make_context")
     def test_get_all_admin_all_with_pagination_marker(self, mock_context,
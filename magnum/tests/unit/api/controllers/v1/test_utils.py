@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
 import jsonpatch
 from unittest import mock
 
@@ -53,6 +54,33 @@ class TestApiUtils(base.FunctionalTest):
                           utils.validate_sort_dir,
                           'fake-sort')
 
+    def test_encode_cursor(self):
+        created_at = datetime.datetime(2020, 1, 2, 3, 4, 5,
+                                       tzinfo=datetime.timezone.utc)
+        resource = mock.Mock(id=42, created_at=created_at)
+
+        cursor = utils.encode_cursor(resource, 'created_at', 'desc')
+
+        self.assertNotIn('=', cursor)
+        self.assertEqual(['2020-01-02T03:04:05.000000', 42],
+                         utils.decode_cursor(cursor, 'created_at', 'desc'))
+        self.assertEqual(
+            [42], utils.decode_cursor(utils.encode_cursor(resource, 'id',
+                                                          'asc'),
+                                      'id', 'asc'))
+
+    def test_decode_cursor_invalid(self):
+        cursor = utils.encode_cursor(mock.Mock(id=42, name='a'), 'name',
+                                     'asc')
+
+        for sort_key, sort_dir in (('id', 'asc'), ('name', 'desc')):
+            self.assertRaises(wsme.exc.ClientSideError, utils.decode_cursor,
+                              cursor, sort_key, sort_dir)
+        for cursor in ('not-a-cursor', 'bm90IGpzb24', 'eyJhIjogMX0',
+                       'WyJpZCIsICJhc2MiLCBbMSwgMl1d', 'é'):
+            self.assertRaises(wsme.exc.ClientSideError, utils.decode_cursor,
+                              cursor, 'id', 'asc')
+
     @mock.patch('pecan.request')
     @mock.patch('magnum.objects.Cluster.get_by_name')
     @mock.patch('magnum.objects.Cluster.get_by_uuid')
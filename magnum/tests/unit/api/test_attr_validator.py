@@ -19,11 +19,16 @@ from unittest import mock
 
 from magnum.api import attr_validator
 from magnum.common import exception
+from magnum.common import lookup_cache
 from magnum.tests import base
 
 
 class TestAttrValidator(base.BaseTestCase):
 
+    def setUp(self):
+        super(TestAttrValidator, self).setUp()
+        self.addCleanup(lookup_cache.LOOKUPS.clear)
+
     def test_validate_flavor_with_vaild_flavor(self):
         mock_flavor = mock.MagicMock()
         mock_flavor.name = 'test_flavor'
@@ -61,6 +66,33 @@ class TestAttrValidator(base.BaseTestCase):
                           attr_validator.validate_flavor,
                           mock_os_cli, 'test_flavor')
 
+    def test_validate_flavor_listed_once(self):
+        mock_flavors = []
+        for name in ('master_flavor', 'flavor'):
+            mock_flavor = mock.MagicMock(id='%s_id' % name)
+            mock_flavor.name = name
+            mock_flavors.append(mock_flavor)
+        mock_nova = mock.MagicMock()
+        mock_nova.flavors.list.return_value = mock_flavors
+        mock_os_cli = mock.MagicMock()
+        mock_os_cli.nova.return_value = mock_nova
+        attr_validator.validate_flavor(mock_os_cli, 'master_flavor')
+        attr_validator.validate_flavor(mock_os_cli, 'flavor_id')
+        mock_nova.flavors.list.assert_called_once_with()
+
+    def test_validate_flavor_created_since_listed(self):
+        mock_flavor = mock.MagicMock(id='new_flavor_id')
+        mock_flavor.name = 'new_flavor'
+        mock_nova = mock.MagicMock()
+        mock_nova.flavors.list.side_effect = [[], [mock_flavor]]
+        mock_os_cli = mock.MagicMock()
+        mock_os_cli.nova.return_value = mock_nova
+        self.assertRaises(exception.FlavorNotFound,
+                          attr_validator.validate_flavor,
+                          mock_os_cli, 'new_flavor')
+        attr_validator.validate_flavor(mock_os_cli, 'new_flavor')
+        self.assertEqual(2, mock_nova.flavors.list.call_count)
+
     def test_validate_external_network_with_valid_network(self):
         mock_networks = {'networks': [{'name': 'test_ext_net',
                          'id': 'test_ext_net_id'}]}
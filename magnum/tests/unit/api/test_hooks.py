@@ -68,6 +68,35 @@ class TestContextHook(base.BaseTestCase):
         self.assertEqual('assert_this', ctx.auth_token_info)
 
 
+@mock.patch('magnum.conductor.api.API')
+class TestRPCHook(base.TestCase):
+
+    def test_rpc_hook(self, mock_api):
+        state = mock.Mock()
+        hooks.RPCHook().before(state)
+
+        mock_api.assert_called_once_with(context=state.request.context,
+                                         async_casts=False)
+        self.assertIs(mock_api.return_value, state.request.rpcapi)
+
+    def test_rpc_hook_async_casts(self, mock_api):
+        self.config(async_rpc_casts=True, server_mode='prefork', group='api')
+        state = mock.Mock()
+        hooks.RPCHook().before(state)
+
+        mock_api.assert_called_once_with(context=state.request.context,
+                                         async_casts=True)
+
+    def test_rpc_hook_async_casts_forking(self, mock_api):
+        self.config(async_rpc_casts=True, server_mode='werkzeug',
+                    group='api')
+        state = mock.Mock()
+        hooks.RPCHook().before(state)
+
+        mock_api.assert_called_once_with(context=state.request.context,
+                                         async_casts=False)
+
+
 class TestNoExceptionTracebackHook(api_base.FunctionalTest):
 
     TRACE = [u'Traceback (most recent call last):',
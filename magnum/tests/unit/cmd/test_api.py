@@ -117,3 +117,19 @@ class TestMagnumAPI(base.TestCase):
                                          base.CONF.api.port, app,
                                          processes=workers,
                                          ssl_context=('tmp_crt', 'tmp_key'))
+
+    @mock.patch('magnum.common.wsgi_service.serve')
+    @mock.patch('werkzeug.serving.run_simple')
+    @mock.patch.object(api, 'api_app')
+    @mock.patch('magnum.common.service.prepare_service')
+    def test_api_prefork(self, mock_prep, mock_app, mock_run, mock_serve,
+                         mock_base):
+        self.config(server_mode='prefork', workers=4, group='api')
+        api.main()
+
+        app = mock_app.load_app.return_value
+        mock_run.assert_not_called()
+        mock_serve.assert_called_once_with('magnum-api', app,
+                                           base.CONF.api.host,
+                                           base.CONF.api.port, 4,
+                                           ssl_files=None)
@@ -22,10 +22,12 @@ from magnum.tests import base
 
 class TestMagnumConductor(base.TestCase):
 
+    @mock.patch.object(conductor, 'template_cache')
     @mock.patch('oslo_service.service.launch')
     @mock.patch.object(conductor, 'rpc_service')
     @mock.patch('magnum.common.service.prepare_service')
-    def test_conductor(self, mock_prep, mock_rpc, mock_launch):
+    def test_conductor(self, mock_prep, mock_rpc, mock_launch,
+                       mock_template_cache):
         conductor.main()
 
         server = mock_rpc.Service.create.return_value
@@ -37,12 +39,17 @@ class TestMagnumConductor(base.TestCase):
         workers = processutils.get_worker_count()
         mock_launch.assert_called_once_with(base.CONF, server,
                                             workers=workers)
+        server.create_periodic_tasks.assert_called_once_with()
+        server.create_notification_listener.assert_called_once_with()
+        mock_template_cache.prewarm.assert_called_once_with()
         launcher.wait.assert_called_once_with()
 
+    @mock.patch.object(conductor, 'template_cache')
     @mock.patch('oslo_service.service.launch')
     @mock.patch.object(conductor, 'rpc_service')
     @mock.patch('magnum.common.service.prepare_service')
-    def test_conductor_config_workers(self, mock_prep, mock_rpc, mock_launch):
+    def test_conductor_config_workers(self, mock_prep, mock_rpc, mock_launch,
+                                      mock_template_cache):
         fake_workers = 8
         self.config(workers=fake_workers, group='conductor')
         conductor.main()
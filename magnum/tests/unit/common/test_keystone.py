@@ -81,6 +81,25 @@ class KeystoneClientTest(base.TestCase):
         mock_ks.assert_called_once_with(session=session, trust_id=None)
         self.assertIsInstance(auth_plugin, ka_identity.Password)
 
+    def test_session_cached_for_trust(self, mock_ks):
+        self.ctx.auth_token_info = None
+        self.ctx.auth_token = None
+        self.ctx.trust_id = 'fake_trust'
+        self.ctx.user_name = 'fake_trustee'
+        self.ctx.password = 'fake_password'
+        session = keystone.KeystoneClientV3(self.ctx).session
+        self.assertIs(session, keystone.KeystoneClientV3(self.ctx).session)
+        self.assertIs(keystone.SESSION_CACHE.http, session.session)
+
+        self.ctx.password = 'other_password'
+        self.assertIsNot(session, keystone.KeystoneClientV3(self.ctx).session)
+
+    def test_session_not_cached_for_token_info(self, mock_ks):
+        self.ctx.auth_token_info = {'token': {}}
+        session = keystone.KeystoneClientV3(self.ctx).session
+        self.assertIsNot(session,
+                         keystone.KeystoneClientV3(self.ctx).session)
+
     @mock.patch('magnum.common.keystone.ka_loading')
     @mock.patch('magnum.common.keystone.ka_v3')
     def test_client_with_password_legacy(self, mock_v3, mock_loading, mock_ks):
@@ -241,3 +260,166 @@ class KeystoneClientTest(base.TestCase):
         ks_client = keystone.KeystoneClientV3(self.ctx)
         self.assertRaises(exception.InvalidParameterValue,
                           ks_client.get_validate_region_name, val)
+
+
+class SessionCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(SessionCacheTest, self).setUp()
+        self.cache = keystone.SessionCache()
+
+    def _session(self, expires_soon=False):
+        session = mock.Mock()
+        session.auth.auth_ref.will_expire_soon.return_value = expires_soon
+        return session
+
+    def test_get(self):
+        session = self._session()
+        create = mock.Mock(return_value=session)
+        self.assertIs(session, self.cache.get('key', create))
+        self.assertIs(session, self.cache.get('key', create))
+        create.assert_called_once_with()
+
+    def test_get_no_key(self):
+        create = mock.Mock(side_effect=[self._session(), self._session()])
+        self.assertIsNot(self.cache.get(None, create),
+                         self.cache.get(None, create))
+
+    def test_get_disabled(self):
+        self.config(session_cache_size=0, group=ksconf.CFG_GROUP)
+        create = mock.Mock(side_effect=[self._session(), self._session()])
+        self.assertIsNot(self.cache.get('key', create),
+                         self.cache.get('key', create))
+
+    def test_get_token_expires_soon(self):
+        expiring = self._session(expires_soon=True)
+        fresh = self._session()
+        create = mock.Mock(side_effect=[expiring, fresh])
+        self.assertIs(expiring, self.cache.get('key', create))
+        self.assertIs(fresh, self.cache.get('key', create))
+        self.assertIs(fresh, self.cache.get('key', create))
+
+    @mock.patch('time.monotonic')
+    def test_get_ttl(self, mock_time):
+        self.config(session_cache_ttl=60, group=ksconf.CFG_GROUP)
+        old = self._session()
+        new = self._session()
+        create = mock.Mock(side_effect=[old, new])
+        mock_time.return_value = 100
+        self.assertIs(old, self.cache.get('key', create))
+        mock_time.return_value = 159
+        self.assertIs(old, self.cache.get('key', create))
+        mock_time.return_value = 160
+        self.assertIs(new, self.cache.get('key', create))
+
+    def test_get_evicts_least_recently_used(self):
+        self.config(session_cache_size=2, group=ksconf.CFG_GROUP)
+        sessions = {key: self._session() for key in ('a', 'b', 'c')}
+        for key in ('a', 'b'):
+            self.cache.get(key, lambda: sessions[key])
+        self.cache.get('a', mock.Mock())
+        self.cache.get('c', lambda: sessions['c'])
+
+        create = mock.Mock()
+        self.assertIs(sessions['a'], self.cache.get('a', create))
+        self.assertIs(sessions['c'], self.cache.get('c', create))
+        create.assert_not_called()
+        self.assertIs(create.return_value, self.cache.get('b', create))
+
+
+class TokenInfoCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(TokenInfoCacheTest, self).setUp()
+        self.cache = keystone.TokenInfoCache()
+        self.config(www_authenticate_uri='http://server.test:5000/v3',
+                    group=ksconf.CFG_LEGACY_GROUP)
+        p = mock.patch('keystoneauth1.loading.load_session_from_conf_options')
+        self.mock_session = p.start().return_value
+        self.addCleanup(p.stop)
+
+    @staticmethod
+    def _token_info(expires_at='2999-01-01T00:00:00.000000Z'):
+        return {'token': {'expires_at': expires_at, 'catalog': []}}
+
+    def test_get(self):
+        token_info = self._token_info()
+        self.cache.put('token', token_info)
+
+        self.assertIs(token_info, self.cache.get('token'))
+        self.mock_session.get.assert_not_called()
+        self.assertEqual({'hits': 1, 'misses': 0, 'fetch_errors': 0,
+                          'size': 1}, self.cache.stats())
+
+    def test_get_fetches_missing(self):
+        token_info = self._token_info()
+        self.mock_session.get.return_value.json.return_value = token_info
+
+        self.assertEqual(token_info, self.cache.get('token'))
+        self.assertEqual(token_info, self.cache.get('token'))
+
+        self.mock_session.get.assert_called_once_with(
+            'http://server.test:5000/v3/auth/tokens',
+            headers={'X-Auth-Token': 'token', 'X-Subject-Token': 'token'},
+            authenticated=False)
+
+    def test_get_expired(self):
+        self.cache.put('token', self._token_info('2000-01-01T00:00:00Z'))
+        token_info = self._token_info()
+        self.mock_session.get.return_value.json.return_value = token_info
+
+        self.assertEqual(token_info, self.cache.get('token'))
+
+    def test_get_fetch_error(self):
+        self.mock_session.get.side_effect = ka_exception.NotFound()
+
+        self.assertIsNone(self.cache.get('token'))
+        self.assertEqual(1, self.cache.stats()['fetch_errors'])
+
+    @mock.patch('time.monotonic')
+    def test_get_fetch_error_not_retried_at_once(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.mock_session.get.side_effect = ka_exception.NotFound()
+        self.assertIsNone(self.cache.get('token'))
+        self.assertIsNone(self.cache.get('token'))
+        self.assertEqual(1, self.mock_session.get.call_count)
+
+        token_info = self._token_info()
+        self.mock_session.get.side_effect = None
+        self.mock_session.get.return_value.json.return_value = token_info
+        self.assertEqual(token_info, self.cache.get('other'))
+        mock_monotonic.return_value = 100 + keystone._TOKEN_FETCH_RETRY_DELAY
+        self.assertEqual(token_info, self.cache.get('token'))
+        self.assertEqual(3, self.mock_session.get.call_count)
+
+    @mock.patch.object(keystone, 'LOG')
+    def test_get_no_auth_url(self, mock_log):
+        self.config(www_authenticate_uri=None, auth_uri=None,
+                    group=ksconf.CFG_LEGACY_GROUP)
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.mock_session.get.assert_not_called()
+        self.assertEqual(2, self.cache.stats()['fetch_errors'])
+        self.assertEqual(1, mock_log.warning.call_count)
+
+    def test_put_evicts_least_recently_used(self):
+        self.config(token_info_cache_size=2, group=ksconf.CFG_GROUP)
+        for token in ('a', 'b'):
+            self.cache.put(token, self._token_info())
+        self.cache.get('a')
+        self.cache.put('c', self._token_info())
+
+        self.cache.get('a')
+        self.cache.get('c')
+        self.mock_session.get.assert_not_called()
+        self.mock_session.get.return_value.json.return_value = (
+            self._token_info())
+        self.cache.get('b')
+        self.assertEqual(1, self.mock_session.get.call_count)
+
+    def test_put_disabled(self):
+        self.config(token_info_cache_size=0, group=ksconf.CFG_GROUP)
+        self.cache.put('token', self._token_info())
+
+        self.assertEqual(0, self.cache.stats()['size'])
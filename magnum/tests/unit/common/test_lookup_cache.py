@@ -0,0 +1,144 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from novaclient import exceptions as nova_exception
+
+from magnum.common import clients
+from magnum.common import context
+from magnum.common import exception
+from magnum.common import lookup_cache
+from magnum.common import neutron
+from magnum.common import nova
+from magnum.tests import base
+
+
+class TestLookupCache(base.TestCase):
+
+    def setUp(self):
+        super(TestLookupCache, self).setUp()
+        self.cache = lookup_cache.LookupCache()
+
+    @mock.patch('time.monotonic')
+    def test_get_or_load(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        load = mock.Mock(return_value='value')
+
+        self.assertEqual('value',
+                         self.cache.get_or_load('network', 'key', load))
+        self.assertEqual('value',
+                         self.cache.get_or_load('network', 'key', load))
+        self.assertEqual(1, load.call_count)
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1},
+                         self.cache.stats())
+
+        mock_monotonic.return_value = 401
+        self.cache.get_or_load('network', 'key', load)
+        self.assertEqual(2, load.call_count)
+
+    def test_get_or_load_not_cached(self):
+        self.config(lookup_cache_ttl={'network': 0}, group='drivers')
+        load = mock.Mock(return_value='value')
+
+        self.cache.get_or_load('network', 'key', load)
+        self.cache.get_or_load('network', 'key', load)
+        self.cache.get_or_load('subnet', 'key', load)
+        self.cache.get_or_load('subnet', 'key', load)
+
+        self.assertEqual(4, load.call_count)
+
+    @mock.patch('time.monotonic')
+    def test_get_or_load_negative(self, mock_monotonic):
+        self.config(lookup_negative_cache_ttl=30, group='drivers')
+        mock_monotonic.return_value = 100
+        load = mock.Mock(side_effect=exception.FixedSubnetNotFound(
+            subnet='private'))
+
+        for _ in range(2):
+            self.assertRaises(exception.FixedSubnetNotFound,
+                              self.cache.get_or_load, 'subnet', 'key', load,
+                              negative=(exception.FixedSubnetNotFound,))
+        self.assertEqual(1, load.call_count)
+
+        mock_monotonic.return_value = 131
+        self.assertRaises(exception.FixedSubnetNotFound,
+                          self.cache.get_or_load, 'subnet', 'key', load,
+                          negative=(exception.FixedSubnetNotFound,))
+        self.assertEqual(2, load.call_count)
+
+    def test_get_or_load_error_not_cached(self):
+        load = mock.Mock(side_effect=[ValueError, 'value'])
+
+        self.assertRaises(ValueError, self.cache.get_or_load, 'subnet',
+                          'key', load,
+                          negative=(exception.FixedSubnetNotFound,))
+        self.assertEqual('value',
+                         self.cache.get_or_load('subnet', 'key', load))
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_get_network_per_project(self, mock_clients):
+        mock_nclient = mock_clients.return_value.neutron.return_value
+        mock_nclient.list_networks.return_value = {
+            'networks': [{'id': 'net-id', 'name': 'public'}]}
+        other_context = mock.Mock(project_id='other_project',
+                                  trust_id=None)
+
+        for ctx in (self.context, self.context, other_context):
+            self.assertEqual('net-id', neutron.get_external_network_id(
+                ctx, 'public'))
+
+        self.assertEqual(2, mock_nclient.list_networks.call_count)
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_get_ssh_key_not_found(self, mock_clients):
+        mock_keypairs = mock_clients.return_value.nova.return_value.keypairs
+        mock_keypairs.get.side_effect = nova_exception.NotFound(404)
+
+        self.assertEqual('', nova.get_ssh_key(self.context, 'keypair'))
+        self.assertEqual('', nova.get_ssh_key(self.context, 'keypair'))
+
+        mock_keypairs.get.assert_called_once_with('keypair')
+
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_get_network_admin_context_not_cached(self, mock_clients):
+        mock_nclient = mock_clients.return_value.neutron.return_value
+        mock_nclient.list_networks.return_value = {
+            'networks': [{'id': 'net-id', 'name': 'public'}]}
+        admin_context = context.make_admin_context()
+
+        for _ in range(2):
+            self.assertEqual('net-id', neutron.get_external_network_id(
+                admin_context, 'public'))
+
+        self.assertEqual(2, mock_nclient.list_networks.call_count)
+        self.assertEqual(0, lookup_cache.LOOKUPS.stats()['size'])
+
+    @mock.patch('magnum.common.keystone.KeystoneClientV3')
+    def test_url_for_per_trust(self, mock_keystone):
+        endpoints = {'trust-1': 'http://heat/v1/project-1',
+                     'trust-2': 'http://heat/v1/project-2'}
+
+        def keystone(ctx):
+            session = mock.Mock()
+            session.get_endpoint.return_value = endpoints[ctx.trust_id]
+            return mock.Mock(session=session)
+
+        mock_keystone.side_effect = keystone
+        for trust_id, endpoint in sorted(endpoints.items()) * 2:
+            cluster = mock.Mock(trust_id=trust_id)
+            osc = clients.OpenStackClients(
+                context.make_cluster_context(cluster))
+            self.assertEqual(endpoint,
+                             osc.url_for(service_type='orchestration'))
+
+        self.assertEqual(2, mock_keystone.call_count)
@@ -93,6 +93,38 @@ class NeutronTest(base.TestCase):
 
         self.assertFalse(mock_nclient.delete_floatingip.called)
 
+    @mock.patch.object(neutron, 'FLOATINGIP_PORTS_PER_REQUEST', 2)
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_delete_floatingips(self, mock_clients):
+        mock_nclient = mock.MagicMock()
+        port_ids = ['port1', 'port2', 'port3']
+        description = ('Floating IP for Kubernetes external service %s '
+                       'from cluster %s')
+        mock_nclient.list_floatingips.side_effect = [
+            {'floatingips': [
+                {'id': 'fip1', 'port_id': 'port1',
+                 'description': description % ('svc1', self.cluster.uuid)},
+                {'id': 'fip2', 'port_id': 'port2',
+                 'description': 'Not created for a service'},
+            ]},
+            {'floatingips': [
+                {'id': 'fip3', 'port_id': 'port3',
+                 'description': description % ('svc3', self.cluster.uuid)},
+            ]},
+        ]
+
+        osc = mock.MagicMock()
+        mock_clients.return_value = osc
+        osc.neutron.return_value = mock_nclient
+
+        neutron.delete_floatingips(self.context, port_ids, self.cluster)
+
+        self.assertEqual([mock.call(port_id=['port1', 'port2']),
+                          mock.call(port_id=['port3'])],
+                         mock_nclient.list_floatingips.call_args_list)
+        self.assertEqual([mock.call('fip1'), mock.call('fip3')],
+                         mock_nclient.delete_floatingip.call_args_list)
+
     @mock.patch('magnum.common.clients.OpenStackClients')
     def test_delete_floatingip_exception(self, mock_clients):
         mock_nclient = mock.MagicMock()
@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import time
 from unittest import mock
 
 import heatclient.exc as heat_exc
@@ -20,6 +21,7 @@ from magnum.common import exception
 from magnum.common import octavia
 from magnum import objects
 from magnum.tests import base
+from magnum.tests import fake_octavia
 from magnum.tests.unit.db import utils
 
 
@@ -40,58 +42,86 @@ class OctaviaTest(base.TestCase):
             objects.NodeGroup(self.context, **nodegroups_dict['worker'])
         ]
 
-    @mock.patch("magnum.common.neutron.delete_floatingip")
-    @mock.patch('magnum.common.clients.OpenStackClients')
-    def test_delete_loadbalancers(self, mock_clients, mock_delete_fip):
-        mock_lbs = {
-            "loadbalancers": [
-                {
-                    "id": "fake_id_1",
-                    "description": "Kubernetes external service "
-                                   "ad3080723f1c211e88adbfa163ee1203 from "
-                                   "cluster %s" % self.cluster.uuid,
-                    "name": "fake_name_1",
-                    "provisioning_status": "ACTIVE",
-                    "vip_port_id": "b4ca07d1-a31e-43e2-891a-7d14f419f342"
-                },
-                {
-                    "id": "fake_id_2",
-                    "description": "Kubernetes Ingress test-octavia-ingress "
-                                   "in namespace default from cluster %s, "
-                                   "version: 32207" % self.cluster.uuid,
-                    "name": "fake_name_2",
-                    "provisioning_status": "ERROR",
-                    "vip_port_id": "c17c1a6e-1868-11e9-84cd-00224d6b7bc1"
-                },
-            ]
-        }
-        mock_octavia_client = mock.MagicMock()
-        mock_octavia_client.load_balancer_list.side_effect = [
-            mock_lbs, {"loadbalancers": []}
-        ]
-        mock_octavia_client.load_balancer_show.return_value = {
-            'id': 'heat_lb_id',
-            'provisioning_status': 'ACTIVE'
-        }
-
+    def _mock_clients(self, mock_clients, octavia_client,
+                      heat_lb_ids=()):
         mock_heat_client = mock.MagicMock()
         mock_heat_client.resources.list.return_value = [
-            TestHeatLBResource('heat_lb_id')
+            TestHeatLBResource(lb_id) for lb_id in heat_lb_ids
         ]
-
         osc = mock.MagicMock()
         mock_clients.return_value = osc
-        osc.octavia.return_value = mock_octavia_client
+        osc.octavia.return_value = octavia_client
         osc.heat.return_value = mock_heat_client
 
+    @mock.patch('time.sleep')
+    @mock.patch("magnum.common.neutron.delete_floatingips")
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_delete_loadbalancers(self, mock_clients, mock_delete_fips,
+                                  mock_sleep):
+        octavia_client = fake_octavia.FakeOctaviaClient()
+        octavia_client.add(
+            "fake_id_1",
+            description="Kubernetes external service "
+                        "ad3080723f1c211e88adbfa163ee1203 from "
+                        "cluster %s" % self.cluster.uuid,
+            vip_port_id="b4ca07d1-a31e-43e2-891a-7d14f419f342")
+        octavia_client.add(
+            "fake_id_2",
+            description="Kubernetes Ingress test-octavia-ingress "
+                        "in namespace default from cluster %s, "
+                        "version: 32207" % self.cluster.uuid,
+            status="ERROR",
+            vip_port_id="c17c1a6e-1868-11e9-84cd-00224d6b7bc1")
+        octavia_client.add("other_id", description="Not from a cluster")
+        octavia_client.add("heat_lb_id")
+        self._mock_clients(mock_clients, octavia_client, ["heat_lb_id"])
+
         octavia.delete_loadbalancers(self.context, self.cluster)
 
-        calls = [
-            mock.call("fake_id_1", cascade=True),
-            mock.call("fake_id_2", cascade=True),
-            mock.call("heat_lb_id", cascade=True)
-        ]
-        mock_octavia_client.load_balancer_delete.assert_has_calls(calls)
+        self.assertEqual(["fake_id_1", "fake_id_2", "heat_lb_id"],
+                         sorted(octavia_client.deleted))
+        self.assertEqual(["other_id"], list(octavia_client.lbs))
+        # The project load balancers are only listed once.
+        self.assertEqual(1, octavia_client.calls["load_balancer_list"])
+        mock_delete_fips.assert_called_once_with(
+            self.context, ["b4ca07d1-a31e-43e2-891a-7d14f419f342",
+                           "c17c1a6e-1868-11e9-84cd-00224d6b7bc1"],
+            self.cluster)
+
+    @mock.patch('time.sleep')
+    @mock.patch("magnum.common.neutron.delete_floatingips")
+    @mock.patch('magnum.common.clients.OpenStackClients')
+    def test_delete_loadbalancers_many(self, mock_clients, mock_delete_fips,
+                                       mock_sleep):
+        self.config(pre_delete_lb_workers=4, group='cluster')
+        octavia_client = fake_octavia.FakeOctaviaClient(delete_polls=3)
+        for i in range(20):
+            octavia_client.add(
+                "lb_%d" % i,
+                description="Kubernetes external service %d from "
+                            "cluster %s" % (i, self.cluster.uuid))
+        self._mock_clients(mock_clients, octavia_client)
+
+        octavia.delete_loadbalancers(self.context, self.cluster)
+
+        self.assertEqual(20, len(octavia_client.deleted))
+        self.assertFalse(octavia_client.lbs)
+        self.assertEqual(1, mock_delete_fips.call_count)
+        self.assertEqual(20, len(mock_delete_fips.call_args[0][1]))
+
+    @mock.patch('time.sleep')
+    def test_wait_for_lb_deleted_backoff(self, mock_sleep):
+        octavia_client = fake_octavia.FakeOctaviaClient(delete_polls=6)
+        octavia_client.add("lb_id")
+        octavia_client.load_balancer_delete("lb_id")
+
+        octavia.wait_for_lb_deleted(octavia_client, "lb_id",
+                                    time.time() + 60)
+
+        self.assertEqual([mock.call(0.5), mock.call(1), mock.call(2),
+                          mock.call(4), mock.call(8)],
+                         mock_sleep.call_args_list)
+        self.assertEqual(6, octavia_client.calls["load_balancer_show"])
 
     @mock.patch('magnum.common.clients.OpenStackClients')
     def test_delete_loadbalancers_no_candidate(self, mock_clients):
@@ -109,37 +139,19 @@ class OctaviaTest(base.TestCase):
 
         self.assertFalse(mock_octavia_client.load_balancer_delete.called)
 
-    @mock.patch("magnum.common.neutron.delete_floatingip")
+    @mock.patch('time.sleep')
+    @mock.patch("magnum.common.neutron.delete_floatingips")
     @mock.patch('magnum.common.clients.OpenStackClients')
-    def test_delete_loadbalancers_timeout(self, mock_clients, mock_delete_fip):
-        osc = mock.MagicMock()
-        mock_clients.return_value = osc
-        mock_octavia_client = mock.MagicMock()
-        osc.octavia.return_value = mock_octavia_client
-
-        mock_lbs = {
-            "loadbalancers": [
-                {
-                    "id": "fake_id_1",
-                    "description": "Kubernetes external service "
-                                   "ad3080723f1c211e88adbfa163ee1203 from "
-                                   "cluster %s" % self.cluster.uuid,
-                    "name": "fake_name_1",
-                    "provisioning_status": "ACTIVE",
-                    "vip_port_id": "b4ca07d1-a31e-43e2-891a-7d14f419f342"
-                },
-                {
-                    "id": "fake_id_2",
-                    "description": "Kubernetes external service "
-                                   "a9f9ba08cf28811e89547fa163ea824f from "
-                                   "cluster %s" % self.cluster.uuid,
-                    "name": "fake_name_2",
-                    "provisioning_status": "ACTIVE",
-                    "vip_port_id": "c17c1a6e-1868-11e9-84cd-00224d6b7bc1"
-                },
-            ]
-        }
-        mock_octavia_client.load_balancer_list.return_value = mock_lbs
+    def test_delete_loadbalancers_timeout(self, mock_clients,
+                                          mock_delete_fips, mock_sleep):
+        self.config(pre_delete_lb_timeout=0, group='cluster')
+        octavia_client = fake_octavia.FakeOctaviaClient(stuck=True)
+        for lb_id in ("fake_id_1", "fake_id_2"):
+            octavia_client.add(
+                lb_id,
+                description="Kubernetes external service %s from "
+                            "cluster %s" % (lb_id, self.cluster.uuid))
+        self._mock_clients(mock_clients, octavia_client)
 
         self.assertRaises(
             exception.PreDeletionFailed,
@@ -147,8 +159,10 @@ class OctaviaTest(base.TestCase):
             self.context,
             self.cluster
         )
+        self.assertEqual(["fake_id_1", "fake_id_2"],
+                         sorted(octavia_client.deleted))
 
-    @mock.patch("magnum.common.neutron.delete_floatingip")
+    @mock.patch("magnum.common.neutron.delete_floatingips")
     @mock.patch('magnum.common.clients.OpenStackClients')
     def test_delete_loadbalancers_already_deleted(self, mock_clients,
                                                   mock_delete_fip):
@@ -172,7 +186,7 @@ class OctaviaTest(base.TestCase):
         self.assertFalse(mock_octavia_client.load_balancer_show.called)
         self.assertFalse(mock_octavia_client.load_balancer_delete.called)
 
-    @mock.patch("magnum.common.neutron.delete_floatingip")
+    @mock.patch("magnum.common.neutron.delete_floatingips")
     @mock.patch('magnum.common.clients.OpenStackClients')
     def test_delete_loadbalancers_with_stack_not_found(self, mock_clients,
                                                        mock_delete_fip):
@@ -13,9 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from unittest import mock
+
+from oslo_policy import _external
 from oslo_policy import policy as oslo_policy
 
 from magnum.common import context as magnum_context
+from magnum.common import exception
 from magnum.common import policy
 
 from magnum.tests import base
@@ -43,3 +47,99 @@ class TestPolicy(base.TestCase):
         # there is no admin role set in the context, so check_is_admin
         # should return False
         self.assertFalse(policy.check_is_admin(ctx))
+
+
+class TestPolicyDecisionCache(base.TestCase):
+
+    def setUp(self):
+        super(TestPolicyDecisionCache, self).setUp()
+        self.policy.set_rules({
+            'owner': 'project_id:%(project_id)s',
+            'test:get': 'rule:owner or role:admin',
+            'test:http': 'http://example.com/%(project_id)s',
+        })
+        self.enforcer = policy.init()
+        p = mock.patch.object(self.enforcer, 'enforce',
+                              wraps=self.enforcer.enforce)
+        self.mock_enforce = p.start()
+        self.addCleanup(p.stop)
+
+    def _enforce(self, project_id='fake_project', rule='test:get', **kwargs):
+        return policy.enforce(self.context, rule,
+                              {'project_id': project_id, 'name': 'name'},
+                              **kwargs)
+
+    def test_decision_cached(self):
+        self.assertTrue(self._enforce())
+        self.assertTrue(self._enforce())
+
+        self.assertEqual(1, self.mock_enforce.call_count)
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1},
+                         self.enforcer.decisions.stats())
+
+    def test_decision_per_target_attributes(self):
+        self._enforce()
+        self.assertRaises(exception.PolicyNotAuthorized, self._enforce,
+                          project_id='other_project', action='test:get')
+        self.assertRaises(exception.PolicyNotAuthorized, self._enforce,
+                          project_id='other_project', action='test:get')
+
+        self.assertEqual(2, self.mock_enforce.call_count)
+
+    def test_decision_per_credentials(self):
+        self._enforce(project_id='other_project', do_raise=False)
+        self.context.roles = ['admin']
+
+        self.assertTrue(self._enforce(project_id='other_project'))
+        self.assertEqual(2, self.mock_enforce.call_count)
+
+    def test_decisions_dropped_with_rules(self):
+        self._enforce()
+        self.policy.set_rules({'test:get': '!'})
+
+        self.assertFalse(self._enforce(do_raise=False))
+        self.assertEqual(2, self.mock_enforce.call_count)
+
+    def test_decision_not_cached(self):
+        self.config(policy_decision_cache_size=0)
+        self._enforce()
+        self._enforce()
+
+        self.assertEqual(2, self.mock_enforce.call_count)
+
+    @mock.patch('magnum.common.policy._trustee_domain_id')
+    def test_rule_of_unknown_checks_not_cached(self, mock_domain):
+        with mock.patch.object(_external.HttpCheck, '__call__',
+                               return_value=True):
+            self._enforce(rule='test:http')
+            self._enforce(rule='test:http')
+
+        self.assertEqual(2, self.mock_enforce.call_count)
+        mock_domain.assert_not_called()
+
+    def test_lazy_target(self):
+        getter = mock.Mock(return_value='value')
+        target = policy.LazyTarget({'a': 1}, {'b': getter})
+
+        self.assertEqual(1, target['a'])
+        getter.assert_not_called()
+        self.assertEqual({'a', 'b'}, set(target))
+        self.assertEqual('value', target['b'])
+        self.assertEqual('value', target['b'])
+        getter.assert_called_once_with()
+
+    def test_object_target(self):
+        cluster = mock.Mock(fields={'project_id': None, 'name': None},
+                            as_dict_properties=('node_count',))
+        type(cluster).node_count = mock.PropertyMock(
+            side_effect=AssertionError)
+        cluster.project_id = 'fake_project'
+
+        self.assertTrue(policy.enforce(self.context, 'test:get',
+                                       policy.object_target(cluster)))
+
+    def test_check_is_admin_cached(self):
+        for _ in range(2):
+            self.assertFalse(policy.check_is_admin(self.context))
+
+        self.assertEqual(1, self.mock_enforce.call_count)
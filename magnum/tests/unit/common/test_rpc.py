@@ -98,10 +98,24 @@ class TestRpc(base.TestCase):
                                          access_policy=access_policy)
         self.assertEqual('server', server)
 
+    @mock.patch.object(messaging, 'get_notification_listener')
+    @mock.patch.object(messaging, 'get_notification_transport')
+    def test_get_notification_listener(self, mock_transport, mock_get):
+        tgts = [mock.Mock()]
+        ends = [mock.Mock()]
+        mock_get.return_value = 'listener'
+
+        listener = rpc.get_notification_listener(tgts, ends, pool='pool')
+
+        mock_transport.assert_called_once_with(rpc.CONF)
+        mock_get.assert_called_once_with(mock_transport.return_value, tgts,
+                                         ends, executor='eventlet',
+                                         pool='pool')
+        self.assertEqual('listener', listener)
+
+    @mock.patch.object(rpc, 'CONF')
     @mock.patch.object(messaging, 'TransportURL')
-    def test_get_transport_url(self, mock_url):
-        conf = mock.Mock()
-        rpc.CONF = conf
+    def test_get_transport_url(self, mock_url, conf):
         mock_url.parse.return_value = 'foo'
 
         url = rpc.get_transport_url(url_str='bar')
@@ -109,10 +123,9 @@ class TestRpc(base.TestCase):
         self.assertEqual('foo', url)
         mock_url.parse.assert_called_once_with(conf, 'bar')
 
+    @mock.patch.object(rpc, 'CONF')
     @mock.patch.object(messaging, 'TransportURL')
-    def test_get_transport_url_null(self, mock_url):
-        conf = mock.Mock()
-        rpc.CONF = conf
+    def test_get_transport_url_null(self, mock_url, conf):
         mock_url.parse.return_value = 'foo'
 
         url = rpc.get_transport_url()
@@ -200,11 +213,75 @@ class TestRequestContextSerializer(base.TestCase):
 
     def test_serialize_context(self):
         context = mock.Mock()
+        context.to_dict.return_value = {'project_id': 'test'}
 
-        self.ser.serialize_context(context)
+        self.assertEqual({'project_id': 'test'},
+                         self.ser.serialize_context(context))
 
         context.to_dict.assert_called_once_with()
 
+    def test_serialize_context_compact(self):
+        rpc.CONTEXT_METRICS.clear()
+        token_info = {'token': {'catalog': [{'type': 'identity'}]}}
+        ctx = context.RequestContext(auth_token='token',
+                                     auth_token_info=token_info,
+                                     is_admin=False)
+
+        values = self.ser.serialize_context(ctx)
+
+        self.assertIsNone(values['auth_token_info'])
+        self.assertTrue(values['auth_token_info_omitted'])
+        stats = rpc.CONTEXT_METRICS.stats()
+        self.assertEqual(1, stats['contexts'])
+        self.assertEqual(1, stats['compacted'])
+        # Sizes are only measured when asked to.
+        self.assertEqual(0, stats['measured'])
+        self.assertEqual(0, stats['omitted_bytes'])
+
+    def test_serialize_context_size_metrics(self):
+        self.config(rpc_context_size_metrics=True)
+        rpc.CONTEXT_METRICS.clear()
+        token_info = {'token': {'catalog': [{'type': 'identity'}]}}
+        ctx = context.RequestContext(auth_token='token',
+                                     auth_token_info=token_info,
+                                     is_admin=False)
+
+        values = self.ser.serialize_context(ctx)
+
+        stats = rpc.CONTEXT_METRICS.stats()
+        self.assertEqual(1, stats['measured'])
+        self.assertEqual(len(jsonutils.dumps(values)), stats['bytes'])
+        self.assertEqual(len(jsonutils.dumps(token_info)),
+                         stats['omitted_bytes'])
+
+    def test_serialize_context_not_compact(self):
+        self.config(rpc_compact_context=False)
+        token_info = {'token': {'catalog': []}}
+        ctx = context.RequestContext(auth_token='token',
+                                     auth_token_info=token_info,
+                                     is_admin=False)
+
+        values = self.ser.serialize_context(ctx)
+
+        self.assertEqual(token_info, values['auth_token_info'])
+        self.assertFalse(values['auth_token_info_omitted'])
+
+    @mock.patch('magnum.common.keystone.TOKEN_INFO')
+    def test_deserialize_context_compact(self, mock_token_info):
+        token_info = {'token': {'catalog': []}}
+        mock_token_info.get.return_value = token_info
+        ctx = context.RequestContext(auth_token='token',
+                                     auth_token_info=token_info,
+                                     is_admin=False)
+
+        received = self.ser.deserialize_context(
+            jsonutils.loads(jsonutils.dumps(self.ser.serialize_context(ctx))))
+
+        self.assertFalse(mock_token_info.get.called)
+        self.assertEqual(token_info, received.auth_token_info)
+        self.assertEqual(token_info, received.auth_token_info)
+        mock_token_info.get.assert_called_once_with('token')
+
     @mock.patch.object(context, 'RequestContext')
     def test_deserialize_context(self, mock_req):
         self.ser.deserialize_context('context')
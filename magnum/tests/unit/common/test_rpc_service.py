@@ -0,0 +1,87 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+import oslo_messaging as messaging
+
+from magnum.common import rpc
+from magnum.common import rpc_service
+from magnum.tests import base
+
+
+class TestAPI(base.TestCase):
+
+    def setUp(self):
+        super(TestAPI, self).setUp()
+        p = mock.patch.object(rpc, 'TRANSPORT', mock.Mock())
+        p.start()
+        self.addCleanup(p.stop)
+        p = mock.patch.object(rpc, 'get_client')
+        self.mock_get_client = p.start()
+        self.addCleanup(p.stop)
+        self.mock_get_client.side_effect = (
+            lambda *args, **kwargs: mock.Mock(transport=rpc.TRANSPORT))
+        self.addCleanup(rpc_service._CLIENTS.clear)
+        rpc_service.CALL_METRICS.clear()
+        self.addCleanup(rpc_service.CALL_METRICS.clear)
+
+    def test_client_shared(self):
+        api = rpc_service.API(context='ctx1', topic='topic')
+        other = rpc_service.API(context='ctx2', topic='topic')
+        ping = rpc_service.API(topic='topic', server='host', timeout=1)
+
+        self.assertIs(api._client, other._client)
+        self.assertIsNot(api._client, ping._client)
+        self.assertEqual(2, self.mock_get_client.call_count)
+
+    def test_client_new_transport(self):
+        client = rpc_service.API(topic='topic')._client
+        with mock.patch.object(rpc, 'TRANSPORT', mock.Mock()):
+            self.assertIsNot(client, rpc_service.API(topic='topic')._client)
+
+    def test_call_metrics(self):
+        api = rpc_service.API(context='ctx', topic='topic')
+        api._client.call.side_effect = ['result', messaging.MessagingTimeout]
+
+        self.assertEqual('result', api._call('ping', arg=1))
+        self.assertRaises(messaging.MessagingTimeout, api._call, 'ping')
+        api._cast('echo', message='hi')
+
+        api._client.call.assert_called_with('ctx', 'ping')
+        api._client.cast.assert_called_once_with('ctx', 'echo', message='hi')
+        stats = rpc_service.CALL_METRICS.stats()
+        self.assertEqual({'ping', 'cast:echo'}, set(stats))
+        self.assertEqual(2, stats['ping']['count'])
+        self.assertEqual(1, stats['ping']['errors'])
+        self.assertEqual(0, stats['cast:echo']['errors'])
+
+    def test_async_cast(self):
+        api = rpc_service.API(context='ctx', topic='topic', async_casts=True)
+
+        api._cast('echo', message='hi')
+        rpc_service.wait_for_casts()
+
+        api._client.cast.assert_called_once_with('ctx', 'echo', message='hi')
+        self.assertEqual(set(), rpc_service._CAST_FUTURES)
+
+    @mock.patch.object(rpc_service, 'LOG')
+    def test_async_cast_error(self, mock_log):
+        api = rpc_service.API(context='ctx', topic='topic', async_casts=True)
+        api._client.cast.side_effect = messaging.MessageDeliveryFailure
+
+        api._cast('echo', message='hi')
+        rpc_service.wait_for_casts()
+
+        self.assertTrue(mock_log.error.called)
+        self.assertEqual(1, rpc_service.CALL_METRICS.stats()[
+            'cast:echo']['errors'])
@@ -73,6 +73,25 @@ class UtilsTestCase(base.TestCase):
                         mock.mock_open(read_data="CERT"), create=True):
             self.assertEqual('CERT', utils.get_openstack_ca())
 
+    def test_get_openstack_ca_cached(self):
+        fd, ca_file = tempfile.mkstemp()
+        os.write(fd, b'CERT')
+        os.close(fd)
+        self.addCleanup(os.remove, ca_file)
+        self.addCleanup(utils._OPENSTACK_CA.clear)
+        CONF.set_override('openstack_ca_file', ca_file, group='drivers')
+
+        self.assertEqual('CERT', utils.get_openstack_ca())
+        with mock.patch('magnum.common.utils.open', create=True) as mock_open:
+            self.assertEqual('CERT', utils.get_openstack_ca())
+            self.assertFalse(mock_open.called)
+
+        with open(ca_file, 'w') as f:
+            f.write('NEW CERT')
+        mtime = os.stat(ca_file).st_mtime + 10
+        os.utime(ca_file, (mtime, mtime))
+        self.assertEqual('NEW CERT', utils.get_openstack_ca())
+
 
 class ExecuteTestCase(base.TestCase):
 
@@ -0,0 +1,117 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import signal
+from unittest import mock
+
+from magnum.common import wsgi_service
+from magnum.tests import base
+
+
+def _app(environ, start_response):
+    start_response('200 OK', [])
+    return [b'ok']
+
+
+class WSGIServiceTestCase(base.TestCase):
+
+    def setUp(self):
+        super(WSGIServiceTestCase, self).setUp()
+        p = mock.patch('oslo_service.wsgi.Server')
+        self.mock_server = p.start()
+        self.addCleanup(p.stop)
+
+    def test_init(self):
+        service = wsgi_service.WSGIService('magnum-api', _app, '127.0.0.1',
+                                           9511, pool_size=10)
+        self.mock_server.assert_called_once_with(
+            wsgi_service.CONF, 'magnum-api', _app, host='127.0.0.1',
+            port=9511, pool_size=10, use_ssl=False)
+        service.start()
+        self.mock_server.return_value.start.assert_called_once_with()
+        service.stop()
+        self.mock_server.return_value.stop.assert_called_once_with()
+        service.wait()
+        self.mock_server.return_value.wait.assert_called_once_with()
+
+    def test_init_ssl(self):
+        wsgi_service.WSGIService('magnum-api', _app, '127.0.0.1', 9511,
+                                 ssl_files=('tmp_crt', 'tmp_key'))
+        self.addCleanup(wsgi_service.CONF.clear_default, 'cert_file',
+                        group='ssl')
+        self.addCleanup(wsgi_service.CONF.clear_default, 'key_file',
+                        group='ssl')
+        self.assertEqual('tmp_crt', wsgi_service.CONF.ssl.cert_file)
+        self.assertEqual('tmp_key', wsgi_service.CONF.ssl.key_file)
+        self.assertTrue(self.mock_server.call_args[1]['use_ssl'])
+
+    @mock.patch('os.kill')
+    def test_max_requests(self, mock_kill):
+        service = wsgi_service.WSGIService('magnum-api', _app, '127.0.0.1',
+                                           9511, max_requests=2)
+        app = self.mock_server.call_args[0][2]
+        start_response = mock.Mock()
+
+        response = app({}, start_response)
+        self.assertEqual([b'ok'], list(response))
+        response.close()
+        mock_kill.assert_not_called()
+        response = app({}, start_response)
+        self.assertEqual([b'ok'], list(response))
+        # The worker is only replaced once the response has been sent.
+        mock_kill.assert_not_called()
+        response.close()
+        mock_kill.assert_called_once_with(mock.ANY, signal.SIGTERM)
+        self.assertEqual(2, service.served)
+
+        service.start()
+        self.assertEqual(0, service.served)
+
+    @mock.patch('os.kill')
+    def test_max_requests_closes_response(self, mock_kill):
+        response = mock.Mock()
+        service = wsgi_service.WSGIService(
+            'magnum-api', mock.Mock(return_value=response), '127.0.0.1',
+            9511, max_requests=1)
+        app = self.mock_server.call_args[0][2]
+
+        app({}, mock.Mock()).close()
+
+        response.close.assert_called_once_with()
+        mock_kill.assert_called_once_with(mock.ANY, signal.SIGTERM)
+        self.assertEqual(1, service.served)
+
+    @mock.patch('os.kill')
+    def test_max_requests_app_error(self, mock_kill):
+        service = wsgi_service.WSGIService(
+            'magnum-api', mock.Mock(side_effect=ValueError), '127.0.0.1',
+            9511, max_requests=1)
+        app = self.mock_server.call_args[0][2]
+
+        self.assertRaises(ValueError, app, {}, mock.Mock())
+
+        mock_kill.assert_called_once_with(mock.ANY, signal.SIGTERM)
+        self.assertEqual(1, service.served)
+
+    @mock.patch('oslo_service.service.ProcessLauncher')
+    def test_serve(self, mock_launcher):
+        self.config(worker_pool_size=50, max_requests_per_worker=1000,
+                    group='api')
+        wsgi_service.serve('magnum-api', _app, '127.0.0.1', 9511, 4)
+
+        launcher = mock_launcher.return_value
+        service = launcher.launch_service.call_args[0][0]
+        self.assertIsInstance(service, wsgi_service.WSGIService)
+        self.assertEqual(1000, service.max_requests)
+        self.assertEqual(50, self.mock_server.call_args[1]['pool_size'])
+        launcher.launch_service.assert_called_once_with(service, workers=4)
+        launcher.wait.assert_called_once_with()
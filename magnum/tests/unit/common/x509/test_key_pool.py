@@ -0,0 +1,149 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+from unittest import mock
+
+from magnum.common.x509 import key_pool
+from magnum.common.x509 import operations
+from magnum.tests import base
+
+
+class TestKeyPool(base.TestCase):
+
+    def setUp(self):
+        super(TestKeyPool, self).setUp()
+        p = mock.patch.object(key_pool, '_generate',
+                              side_effect=lambda key_size: mock.Mock(
+                                  key_size=key_size))
+        self.mock_generate = p.start()
+        self.addCleanup(p.stop)
+        self.pool = key_pool.KeyPool()
+        self.addCleanup(self.pool.stop)
+
+    def _wait_for(self, key_size, count):
+        deadline = time.monotonic() + 10
+        while self.pool.stats()['available'][key_size] < count:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def test_disabled(self):
+        self.config(rsa_key_pool_size=0, group='x509')
+
+        key = self.pool.get(2048)
+
+        self.assertEqual(2048, key.key_size)
+        self.assertIsNone(self.pool._thread)
+        stats = self.pool.stats()
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+
+    def test_refilled(self):
+        self.config(rsa_key_pool_size=2, rsa_key_pool_key_sizes=[2048, 4096],
+                    group='x509')
+        self.pool.start()
+        self._wait_for(2048, 2)
+        self._wait_for(4096, 2)
+
+        self.assertEqual(4096, self.pool.get(4096).key_size)
+        self._wait_for(4096, 2)
+
+        stats = self.pool.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(0, stats['misses'])
+        self.assertEqual(5, stats['refills'])
+        self.assertEqual({2048: 2, 4096: 2}, stats['available'])
+
+    def test_size_not_pooled(self):
+        self.config(rsa_key_pool_size=1, rsa_key_pool_key_sizes=[2048],
+                    group='x509')
+        self.pool.start()
+        self._wait_for(2048, 1)
+
+        self.assertEqual(3072, self.pool.get(3072).key_size)
+
+        stats = self.pool.stats()
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual({2048: 1}, stats['available'])
+
+    def test_defaults_to_rsa_key_size(self):
+        self.config(rsa_key_pool_size=1, rsa_key_size=3072, group='x509')
+        self.pool.start()
+        self._wait_for(3072, 1)
+
+        self.assertEqual({3072: 1}, self.pool.stats()['available'])
+
+    def test_get_does_not_start(self):
+        self.config(rsa_key_pool_size=1, group='x509')
+
+        self.assertEqual(2048, self.pool.get(2048).key_size)
+
+        self.assertIsNone(self.pool._thread)
+        self.assertEqual(1, self.pool.stats()['misses'])
+
+    def test_started_once(self):
+        self.config(rsa_key_pool_size=1, group='x509')
+        self.pool.start()
+        thread = self.pool._thread
+        self.pool.start()
+
+        self.assertIs(thread, self.pool._thread)
+
+    def test_reset_after_fork(self):
+        self.config(rsa_key_pool_size=1, group='x509')
+        self.pool.start()
+        self._wait_for(2048, 1)
+        # The condition was held by another thread of the parent when it
+        # forked.
+        cond = self.pool._cond
+        thread = self.pool._thread
+        cond.acquire()
+
+        self.pool._reset()
+
+        self.assertIsNot(cond, self.pool._cond)
+        self.assertIsNone(self.pool._thread)
+        self.assertEqual(0, self.pool.stats()['available'][2048])
+        self.assertEqual(2048, self.pool.get(2048).key_size)
+        self.pool.start()
+        self._wait_for(2048, 1)
+
+        # Only here does the thread of the parent see that it is done.
+        cond.notify_all()
+        cond.release()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+
+    def test_stop(self):
+        self.config(rsa_key_pool_size=1, group='x509')
+        self.pool.start()
+        thread = self.pool._thread
+        self._wait_for(2048, 1)
+
+        self.pool.stop()
+
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(0, self.pool.stats()['available'][2048])
+
+    @mock.patch.object(key_pool, 'get_private_key')
+    def test_certificate_key_from_pool(self, mock_get_private_key):
+        self.config(rsa_key_size=4096, group='x509')
+        # A small real key keeps signing the certificate fast.
+        mock_get_private_key.return_value = (
+            key_pool.rsa.generate_private_key(public_exponent=65537,
+                                              key_size=1024))
+
+        operations.generate_ca_certificate('ca')
+
+        mock_get_private_key.assert_called_once_with(4096)
@@ -14,13 +14,17 @@
 
 from unittest import mock
 
+import futurist
+
 from magnum.common import exception
+from magnum.common.x509 import operations as x509
 from magnum.conductor.handlers.common import cert_manager
 from magnum.tests import base
 from oslo_config import cfg
 
 import magnum.conf
 import os
+import ssl
 import stat
 import tempfile
 
@@ -31,6 +35,7 @@ CONF = magnum.conf.CONF
 class CertManagerTestCase(base.BaseTestCase):
     def setUp(self):
         super(CertManagerTestCase, self).setUp()
+        self.addCleanup(cert_manager.CLIENT_CREDENTIALS.clear)
 
         cert_manager_patcher = mock.patch.object(cert_manager, 'cert_manager')
         self.cert_manager = cert_manager_patcher.start()
@@ -168,6 +173,58 @@ class CertManagerTestCase(base.BaseTestCase):
                                          mock_generate_ca_cert,
                                          mock_generate_client_cert)
 
+    @mock.patch('magnum.conductor.handlers.common.cert_manager.'
+                '_generate_client_cert')
+    @mock.patch('magnum.conductor.handlers.common.cert_manager.'
+                '_generate_ca_cert')
+    def test_generate_certificates_with_executor(self, mock_generate_ca_cert,
+                                                 mock_generate_client_cert):
+        mock_cluster = mock.MagicMock()
+        mock_cluster.name = 'ca-name'
+        mock_generate_ca_cert.side_effect = [
+            ('etcd-ca-cert-ref', {}, 'etcd-ca-password'),
+            ('fp-ca-cert-ref', {}, 'fp-ca-password'),
+            ('ca-cert-ref', {'private_key': 'ca_private_key'}, 'ca-password'),
+        ]
+        mock_generate_client_cert.return_value = 'cert-ref'
+        executor = mock.Mock(wraps=futurist.SynchronousExecutor())
+
+        cert_manager.generate_certificates_to_cluster(mock_cluster,
+                                                      executor=executor)
+
+        self.assertEqual(2, executor.submit.call_count)
+        self.assertEqual('ca-cert-ref', mock_cluster.ca_cert_ref)
+        self.assertEqual('cert-ref', mock_cluster.magnum_cert_ref)
+        self.assertEqual('etcd-ca-cert-ref', mock_cluster.etcd_ca_cert_ref)
+        self.assertEqual('fp-ca-cert-ref',
+                         mock_cluster.front_proxy_ca_cert_ref)
+        mock_generate_client_cert.assert_called_once_with(
+            'ca-name', {'private_key': 'ca_private_key'}, 'ca-password',
+            context=None)
+
+    @mock.patch('magnum.conductor.handlers.common.cert_manager.'
+                '_generate_client_cert')
+    @mock.patch('magnum.conductor.handlers.common.cert_manager.'
+                '_generate_ca_cert')
+    def test_generate_certificates_with_executor_error(
+            self, mock_generate_ca_cert, mock_generate_client_cert):
+        mock_cluster = mock.MagicMock()
+        mock_generate_ca_cert.side_effect = [
+            ('etcd-ca-cert-ref', {}, 'etcd-ca-password'),
+            exception.MagnumException(),
+            ('ca-cert-ref', {}, 'ca-password'),
+        ]
+        executor = futurist.SynchronousExecutor()
+
+        self.assertRaises(exception.CertificatesToClusterFailed,
+                          cert_manager.generate_certificates_to_cluster,
+                          mock_cluster, executor=executor)
+        # The cluster CA and client cert are still generated, but no
+        # reference is set on the cluster.
+        mock_generate_client_cert.assert_called_once_with(
+            mock.ANY, {}, 'ca-password', context=None)
+        self.assertNotEqual('ca-cert-ref', mock_cluster.ca_cert_ref)
+
     @mock.patch('magnum.conductor.handlers.common.cert_manager.'
                 '_get_issuer_name')
     def test_generate_certificates_with_error(self, mock_get_issuer_name):
@@ -348,7 +405,9 @@ class CertManagerTestCase(base.BaseTestCase):
         self.assertEqual(mock_cert.get_certificate.return_value,
                          cluster_magnum_cert.read())
 
-        # Test for certs and keys that might be returned in binary
+        # Test for certs and keys that might be returned in binary, once
+        # the cached credentials are dropped.
+        cert_manager.CLIENT_CREDENTIALS.invalidate(mock_cluster.uuid)
         mock_cert.get_certificate.return_value = b"byte_content"
         mock_cert.get_decrypted_private_key.return_value = b"byte_key"
         ca_cert_text = magnum_cert_text = \
@@ -524,3 +583,96 @@ class CertManagerTestCase(base.BaseTestCase):
 
         self.assertEqual(True, os.path.isdir(mock_dir))
         self.assertEqual(False, os.path.isdir(cert_dir))
+
+    def _mock_cluster_certs(self):
+        mock_cluster = mock.MagicMock()
+        mock_cluster.uuid = "mock_cluster_uuid"
+        mock_cluster.ca_cert_ref = "ca_cert_ref"
+        mock_cluster.magnum_cert_ref = "magnum_cert_ref"
+
+        mock_cert = mock.MagicMock()
+        mock_cert.get_certificate.return_value = "some_content"
+        mock_cert.get_decrypted_private_key.return_value = "some_key"
+        self.CertManager.get_cert.return_value = mock_cert
+        return mock_cluster
+
+    def test_get_client_credentials_cached(self):
+        mock_cluster = self._mock_cluster_certs()
+
+        credentials = cert_manager.get_client_credentials(mock_cluster)
+        self.assertIs(credentials,
+                      cert_manager.get_client_credentials(mock_cluster))
+
+        self.assertEqual("some_content", credentials.ca_cert)
+        self.assertEqual("some_key", credentials.private_key)
+        self.assertEqual(2, self.CertManager.get_cert.call_count)
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1},
+                         cert_manager.CLIENT_CREDENTIALS.stats())
+
+    def test_get_client_credentials_ca_rotated(self):
+        mock_cluster = self._mock_cluster_certs()
+
+        credentials = cert_manager.get_client_credentials(mock_cluster)
+        mock_cluster.ca_cert_ref = "new_ca_cert_ref"
+
+        self.assertIsNot(credentials,
+                         cert_manager.get_client_credentials(mock_cluster))
+        self.assertEqual(4, self.CertManager.get_cert.call_count)
+
+    @mock.patch('time.monotonic')
+    def test_get_client_credentials_expired(self, mock_monotonic):
+        CONF.set_override('client_credentials_cache_ttl', 60,
+                          group='cluster')
+        mock_cluster = self._mock_cluster_certs()
+
+        mock_monotonic.return_value = 100
+        credentials = cert_manager.get_client_credentials(mock_cluster)
+        mock_monotonic.return_value = 161
+
+        self.assertIsNot(credentials,
+                         cert_manager.get_client_credentials(mock_cluster))
+        self.assertEqual(4, self.CertManager.get_cert.call_count)
+
+    def test_get_client_credentials_cache_disabled(self):
+        CONF.set_override('client_credentials_cache_ttl', 0,
+                          group='cluster')
+        mock_cluster = self._mock_cluster_certs()
+
+        cert_manager.get_client_credentials(mock_cluster)
+        cert_manager.get_client_credentials(mock_cluster)
+
+        self.assertEqual(4, self.CertManager.get_cert.call_count)
+        self.assertEqual(0, cert_manager.CLIENT_CREDENTIALS.stats()['size'])
+
+    def test_delete_client_files_drops_credentials(self):
+        mock_cluster = self._mock_cluster_certs()
+        cert_manager.get_client_credentials(mock_cluster)
+
+        cert_manager.delete_client_files(mock_cluster)
+        cert_manager.get_client_credentials(mock_cluster)
+
+        self.assertEqual(4, self.CertManager.get_cert.call_count)
+
+    def test_create_client_ssl_context(self):
+        CONF.set_override('rsa_key_pool_size', 0, group='x509')
+        ca = x509.generate_ca_certificate('ca')
+        client = x509.generate_client_certificate(
+            'ca', 'client', 'system:masters', ca['private_key'])
+        mock_cluster = self._mock_cluster_certs()
+        ca_cert = mock.MagicMock()
+        ca_cert.get_certificate.return_value = ca['certificate']
+        magnum_cert = mock.MagicMock()
+        magnum_cert.get_certificate.return_value = client['certificate']
+        magnum_cert.get_decrypted_private_key.return_value = (
+            client['private_key'])
+        self.CertManager.get_cert.side_effect = [ca_cert, magnum_cert]
+
+        with mock.patch.object(tempfile, 'NamedTemporaryFile') as mock_tmp:
+            ssl_context = cert_manager.create_client_ssl_context(mock_cluster)
+            self.assertFalse(mock_tmp.called)
+
+        self.assertIsInstance(ssl_context, ssl.SSLContext)
+        self.assertEqual(ssl.CERT_REQUIRED, ssl_context.verify_mode)
+        self.assertEqual(1, len(ssl_context.get_ca_certs()))
+        self.assertIs(ssl_context,
+                      cert_manager.create_client_ssl_context(mock_cluster))
@@ -57,3 +57,23 @@ class TestSignConductor(base.TestCase):
         self.assertEqual(mock_cluster.user_id, actual_cert.user_id)
         self.assertEqual(mock_cluster.project_id, actual_cert.project_id)
         self.assertEqual('fake-pem', actual_cert.pem)
+
+    @mock.patch('magnum.drivers.common.driver.Driver.get_driver_for_cluster')
+    @mock.patch.object(ca_conductor, 'k8s_api')
+    @mock.patch.object(ca_conductor, 'cert_manager')
+    def test_rotate_ca_certificate(self, mock_cert_manager, mock_k8s_api,
+                                   mock_get_driver):
+        mock_cluster = mock.MagicMock()
+        mock_cluster.status = 'CREATE_COMPLETE'
+
+        self.ca_handler.rotate_ca_certificate(self.context, mock_cluster)
+
+        mock_cert_manager.generate_certificates_to_cluster.\
+            assert_called_once_with(mock_cluster, context=self.context)
+        mock_cert_manager.delete_client_files.assert_called_once_with(
+            mock_cluster, context=self.context)
+        mock_k8s_api.invalidate_session.assert_called_once_with(mock_cluster)
+        mock_get_driver.return_value.rotate_ca_certificate.\
+            assert_called_once_with(self.context, mock_cluster)
+        self.assertEqual('UPDATE_IN_PROGRESS', mock_cluster.status)
+        mock_cluster.save.assert_called_once_with()
@@ -17,6 +17,7 @@
 from unittest import mock
 from unittest.mock import patch
 
+import eventlet
 import six
 
 from heatclient import exc
@@ -242,7 +243,8 @@ class TestHandler(db_base.DbTestCase):
         mock_dr.create_cluster.assert_called_once_with(self.context,
                                                        cluster, timeout)
         mock_cm.generate_certificates_to_cluster.assert_called_once_with(
-            cluster, context=self.context)
+            cluster, context=self.context,
+            executor=self.handler._setup_executor)
         self.assertEqual(cluster_status.CREATE_IN_PROGRESS, cluster.status)
         mock_trust_manager.create_trustee_and_trust.assert_called_once_with(
             osc, cluster)
@@ -273,7 +275,9 @@ class TestHandler(db_base.DbTestCase):
 
         gctb = mock_cert_manager.generate_certificates_to_cluster
         if is_create_cert_called:
-            gctb.assert_called_once_with(self.cluster, context=self.context)
+            gctb.assert_called_once_with(
+                self.cluster, context=self.context,
+                executor=self.handler._setup_executor)
         else:
             gctb.assert_not_called()
         ctat = mock_trust_manager.create_trustee_and_trust
@@ -358,8 +362,7 @@ class TestHandler(db_base.DbTestCase):
             mock_cert_manager,
             mock_trust_manager,
             mock_cluster_create,
-            exception.TrusteeOrTrustToClusterFailed,
-            False
+            exception.TrusteeOrTrustToClusterFailed
         )
 
         notifications = fake_notifier.NOTIFICATIONS
@@ -369,6 +372,70 @@ class TestHandler(db_base.DbTestCase):
         self.assertEqual(
             taxonomy.OUTCOME_FAILURE, notifications[0].payload['outcome'])
 
+    @patch('magnum.objects.Cluster.create')
+    @patch('magnum.conductor.handlers.cluster_conductor.trust_manager')
+    @patch('magnum.conductor.handlers.cluster_conductor.cert_manager')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_create_with_trust_and_cert_failed(self,
+                                               mock_openstack_client_class,
+                                               mock_cert_manager,
+                                               mock_trust_manager,
+                                               mock_cluster_create):
+        mock_trust_manager.create_trustee_and_trust.side_effect = (
+            exception.TrusteeOrTrustToClusterFailed(cluster_uuid='uuid'))
+        mock_cert_manager.generate_certificates_to_cluster.side_effect = (
+            exception.CertificatesToClusterFailed(cluster_uuid='uuid'))
+
+        self._test_create_failed(
+            mock_openstack_client_class,
+            mock_cert_manager,
+            mock_trust_manager,
+            mock_cluster_create,
+            exception.TrusteeOrTrustToClusterFailed
+        )
+
+        notifications = fake_notifier.NOTIFICATIONS
+        self.assertEqual(1, len(notifications))
+        self.assertEqual(
+            taxonomy.OUTCOME_FAILURE, notifications[0].payload['outcome'])
+        self.assertEqual(cluster_status.CREATE_FAILED, self.cluster.status)
+
+    @patch('magnum.conductor.handlers.cluster_conductor.trust_manager')
+    @patch('magnum.conductor.handlers.cluster_conductor.cert_manager')
+    @patch('magnum.drivers.common.driver.Driver.get_driver')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_create_setup_steps_concurrent(self, mock_openstack_client_class,
+                                           mock_driver, mock_cert_manager,
+                                           mock_trust_manager):
+        trust_created = eventlet.event.Event()
+
+        def create_trustee_and_trust(osc, cluster):
+            trust_created.send()
+
+        def generate_certificates(cluster, context, executor):
+            # Only returns if the trust is created meanwhile.
+            with eventlet.Timeout(5):
+                trust_created.wait()
+
+        mock_trust_manager.create_trustee_and_trust.side_effect = (
+            create_trustee_and_trust)
+        mock_cert_manager.generate_certificates_to_cluster.side_effect = (
+            generate_certificates)
+        cluster_dict = utils.get_test_cluster(node_count=1)
+        del cluster_dict['id']
+        del cluster_dict['uuid']
+        cluster = objects.Cluster(self.context, **cluster_dict)
+
+        self.handler.cluster_create(self.context, cluster, 1, 1, 15)
+
+        notifications = fake_notifier.NOTIFICATIONS
+        self.assertEqual(
+            taxonomy.OUTCOME_PENDING, notifications[0].payload['outcome'])
+        attachments = {a['name']: a['content']
+                       for a in notifications[0].payload['attachments']}
+        self.assertEqual({'trust', 'certificates', 'setup'},
+                         set(attachments['timings']))
+
     @patch('magnum.objects.Cluster.create')
     @patch('magnum.conductor.handlers.cluster_conductor.trust_manager')
     @patch('magnum.conductor.handlers.cluster_conductor.cert_manager')
@@ -85,3 +85,52 @@ class TestIndirectionApiConductor(base.TestCase):
         # the same, and thus 'dict' will not be reported as changed
         self.assertIn('dict', updates)
         self.assertEqual({'foo': 'bar'}, updates['dict'])
+
+    def test_object_action_updates(self):
+        @obj_base.MagnumObjectRegistry.register
+        class TestObject(obj_base.MagnumObject):
+            fields = {'changed': fields.IntegerField(),
+                      'saved': fields.IntegerField(),
+                      'loaded': fields.IntegerField(),
+                      'unchanged': fields.IntegerField()}
+
+            def foo(self, context):
+                self.saved = 2
+                self.obj_reset_changes()
+                self.changed = 2
+                self.loaded = 2
+
+        obj = TestObject(changed=1, saved=1, unchanged=1)
+        obj.obj_reset_changes()
+        updates, result = self.conductor.object_action(
+            self.context, obj, 'foo', tuple(), {})
+        self.assertEqual({'changed': 2, 'saved': 2, 'loaded': 2,
+                          'obj_what_changed': {'changed', 'loaded'}},
+                         updates)
+
+    def test_object_class_actions(self):
+        @obj_base.MagnumObjectRegistry.register
+        class TestObject(obj_base.MagnumObject):
+            fields = {'id': fields.IntegerField()}
+
+            @classmethod
+            def get(cls, context, id):
+                return cls(id=id)
+
+            @classmethod
+            def count(cls, context, raise_exception=False):
+                if raise_exception:
+                    raise Exception('test')
+                return 2
+
+        name = TestObject.obj_name()
+        results = self.conductor.object_class_actions(
+            self.context, [[name, 'get', '1.0', [1], {}],
+                           [name, 'count', '1.0', [], {}]])
+        self.assertEqual([TestObject(id=1).obj_to_primitive(), 2], results)
+
+        self.assertRaises(messaging.ExpectedException,
+                          self.conductor.object_class_actions, self.context,
+                          [[name, 'get', '1.0', [1], {}],
+                           [name, 'count', '1.0', [],
+                            {'raise_exception': True}]])
@@ -12,8 +12,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import ssl
 from unittest import mock
 
+from magnum.conductor import k8s_api
 from magnum.tests import base
 
 
@@ -51,3 +53,71 @@ class TestK8sAPI(base.TestCase):
             TestK8sAPI.content_dict[cert_ref]['decrypted_private_key'])
 
         return cert_obj
+
+    def setUp(self):
+        super(TestK8sAPI, self).setUp()
+        p = mock.patch.object(k8s_api.cert_manager,
+                              'create_client_ssl_context',
+                              side_effect=lambda cluster, context:
+                              ssl.create_default_context())
+        self.mock_create_ssl_context = p.start()
+        self.addCleanup(p.stop)
+        self.cluster = self._cluster('cluster-uuid')
+
+    def _cluster(self, uuid, ca_cert_ref='fake-ca-cert-ref'):
+        cluster = mock.MagicMock()
+        cluster.uuid = uuid
+        cluster.api_address = 'https://%s:6443' % uuid
+        cluster.ca_cert_ref = ca_cert_ref
+        cluster.magnum_cert_ref = 'fake-magnum-cert-ref'
+        return cluster
+
+    @mock.patch('requests.Session.request')
+    def test_request(self, mock_request):
+        mock_request.return_value.json.return_value = {'items': []}
+        api = k8s_api.KubernetesAPI(self.context, self.cluster)
+
+        self.assertEqual({'items': []}, api.list_node())
+        mock_request.assert_called_once_with(
+            'GET', 'https://cluster-uuid:6443/api/v1/nodes')
+        adapter = api.session.get_adapter(self.cluster.api_address)
+        self.mock_create_ssl_context.assert_called_once_with(
+            self.cluster, self.context)
+        self.assertIsInstance(adapter.ssl_context, ssl.SSLContext)
+
+    def test_session_reused(self):
+        api = k8s_api.KubernetesAPI(self.context, self.cluster)
+        other = k8s_api.KubernetesAPI(self.context, self.cluster)
+        self.assertIs(api.session, other.session)
+        self.assertEqual(1, self.mock_create_ssl_context.call_count)
+
+    def test_session_ca_rotated(self):
+        api = k8s_api.KubernetesAPI(self.context, self.cluster)
+        rotated = self._cluster('cluster-uuid', ca_cert_ref='new-ca-cert-ref')
+        other = k8s_api.KubernetesAPI(self.context, rotated)
+        self.assertIsNot(api.session, other.session)
+        self.assertEqual(2, self.mock_create_ssl_context.call_count)
+
+    def test_invalidate_session(self):
+        api = k8s_api.KubernetesAPI(self.context, self.cluster)
+        with mock.patch.object(api.session, 'close') as mock_close:
+            k8s_api.invalidate_session(self.cluster)
+            mock_close.assert_called_once_with()
+        other = k8s_api.KubernetesAPI(self.context, self.cluster)
+        self.assertIsNot(api.session, other.session)
+
+    def test_session_evicted(self):
+        self.config(api_session_cache_size=2, group='kubernetes')
+        clusters = [self._cluster('cluster-%d' % i) for i in range(3)]
+        sessions = [k8s_api.KubernetesAPI(self.context, c).session
+                    for c in clusters[:2]]
+        # Use the first cluster again, so that the second one is evicted.
+        k8s_api.KubernetesAPI(self.context, clusters[0])
+        k8s_api.KubernetesAPI(self.context, clusters[2])
+
+        self.assertIs(sessions[0],
+                      k8s_api.KubernetesAPI(self.context, clusters[0]).session)
+        self.assertIsNot(
+            sessions[1],
+            k8s_api.KubernetesAPI(self.context, clusters[1]).session)
+        self.assertEqual(4, self.mock_create_ssl_context.call_count)
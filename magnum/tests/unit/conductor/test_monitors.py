@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import tempfile
 from unittest import mock
 
 from requests_mock.contrib import fixture
@@ -228,14 +227,9 @@ class MonitorsTestCase(base.TestCase):
         mem_util = self.v2_monitor.compute_memory_util()
         self.assertEqual(0, mem_util)
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
-    def test_k8s_monitor_pull_data_success(self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
+    def test_k8s_monitor_pull_data_success(self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -347,14 +341,9 @@ class MonitorsTestCase(base.TestCase):
         cpu_util = self.k8s_monitor.compute_cpu_util()
         self.assertEqual(0, cpu_util)
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
-    def test_k8s_monitor_health_healthy(self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
+    def test_k8s_monitor_health_healthy(self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -389,14 +378,9 @@ class MonitorsTestCase(base.TestCase):
         self.assertEqual(self.k8s_monitor.data['health_status_reason'],
                          {'api': 'ok', 'k8s-cluster-node-0.Ready': True})
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
-    def test_k8s_monitor_health_unhealthy_api(self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
+    def test_k8s_monitor_health_unhealthy_api(self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -431,14 +415,9 @@ class MonitorsTestCase(base.TestCase):
         self.assertEqual(self.k8s_monitor.data['health_status_reason'],
                          {'api': 'failed'})
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
-    def test_k8s_monitor_health_unhealthy_node(self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
+    def test_k8s_monitor_health_unhealthy_node(self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -487,15 +466,10 @@ class MonitorsTestCase(base.TestCase):
                          {'api': 'ok', 'k8s-cluster-node-0.Ready': False,
                           'k8s-cluster-node-1.Ready': True})
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
     def test_k8s_monitor_health_unreachable_cluster(
-            self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+            self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -512,15 +486,10 @@ class MonitorsTestCase(base.TestCase):
         self.assertEqual(self.k8s_monitor.data['health_status'],
                          m_fields.ClusterHealthStatus.UNKNOWN)
 
-    @mock.patch('magnum.conductor.k8s_api.create_client_files')
+    @mock.patch('magnum.conductor.k8s_api.cert_manager.'
+                'create_client_ssl_context')
     def test_k8s_monitor_health_unreachable_with_master_lb(
-            self, mock_create_client_files):
-        mock_create_client_files.return_value = (
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile(),
-            tempfile.NamedTemporaryFile()
-        )
-
+            self, mock_create_ssl_context):
         self.requests_mock.register_uri(
             'GET',
             f"{self.cluster.api_address}/api/v1/nodes",
@@ -35,9 +35,9 @@ class TestConductorUtils(base.TestCase):
     def _get_type_uri(self):
         return 'service/security/account/user'
 
-    @patch('magnum.objects.ClusterTemplate.get_by_uuid')
+    @patch('magnum.objects.ClusterTemplate.get_cached')
     def test_retrieve_cluster_template(self,
-                                       mock_cluster_template_get_by_uuid):
+                                       mock_cluster_template_get_cached):
         expected_context = 'context'
         expected_cluster_template_uuid = 'ClusterTemplate_uuid'
 
@@ -46,7 +46,7 @@ class TestConductorUtils(base.TestCase):
 
         utils.retrieve_cluster_template(expected_context, cluster)
 
-        mock_cluster_template_get_by_uuid.assert_called_once_with(
+        mock_cluster_template_get_cached.assert_called_once_with(
             expected_context,
             expected_cluster_template_uuid)
 
@@ -0,0 +1,72 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Tests that the common lookups are served by indexes."""
+
+import magnum.db.sqlalchemy.api as sa_api
+from magnum.db.sqlalchemy import models
+from magnum.tests.unit.db import base
+
+
+class SqlAlchemyIndexesTestCase(base.DbTestCase):
+
+    def _query_plan(self, query):
+        engine = sa_api.get_engine()
+        statement = query.statement.compile(
+            dialect=engine.dialect, compile_kwargs={'literal_binds': True})
+        rows = engine.execute('EXPLAIN QUERY PLAN %s' % statement)
+        return ' '.join(row[-1] for row in rows)
+
+    def assertUsesIndex(self, index, query):
+        plan = self._query_plan(query)
+        self.assertIn('INDEX %s' % index, plan)
+
+    def test_cluster_status(self):
+        query = sa_api.model_query(models.Cluster).filter(
+            models.Cluster.status.in_(['CREATE_IN_PROGRESS',
+                                       'UPDATE_IN_PROGRESS']))
+        self.assertUsesIndex('cluster_status_idx', query)
+
+    def test_cluster_project_id(self):
+        query = sa_api.model_query(models.Cluster).filter_by(
+            project_id='fake_project')
+        self.assertUsesIndex('cluster_project_id_idx', query)
+
+    def test_cluster_cluster_template_id(self):
+        query = sa_api.model_query(models.Cluster).filter_by(
+            cluster_template_id='e74c40e0-d825-11e2-a28f-0800200c9a66')
+        self.assertUsesIndex('cluster_cluster_template_id_idx', query)
+
+    def test_nodegroup_cluster_id_role_is_default(self):
+        query = sa_api.model_query(models.NodeGroup).filter_by(
+            cluster_id='5d12f6fd-a196-4bf0-ae4c-1f639a523a52',
+            role='master', is_default=True)
+        self.assertUsesIndex('nodegroup_cluster_id_role_is_default_idx',
+                             query)
+
+    def test_nodegroup_cluster_ids(self):
+        query = sa_api.model_query(models.NodeGroup).filter(
+            models.NodeGroup.cluster_id.in_(
+                ['5d12f6fd-a196-4bf0-ae4c-1f639a523a52',
+                 'e74c40e0-d825-11e2-a28f-0800200c9a66']))
+        self.assertUsesIndex('nodegroup_cluster_id_role_is_default_idx',
+                             query)
+
+    def test_nodegroup_stack_id(self):
+        query = sa_api.model_query(models.NodeGroup).filter_by(
+            stack_id='5f2d8a59-6e6a-4f3c-a7f1-3d7e64a4b6e1')
+        self.assertUsesIndex('nodegroup_stack_id_idx', query)
+
+    def test_cluster_template_project_id_public(self):
+        query = sa_api.model_query(models.ClusterTemplate).filter_by(
+            project_id='fake_project', public=True)
+        self.assertUsesIndex('cluster_template_project_id_public_idx', query)
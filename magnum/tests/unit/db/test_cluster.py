@@ -16,9 +16,11 @@
 """Tests for manipulating Clusters via the DB API"""
 from oslo_utils import uuidutils
 import six
+import sqlalchemy as sa
 
 from magnum.common import context
 from magnum.common import exception
+from magnum.db.sqlalchemy import api as sa_api
 from magnum.objects.fields import ClusterStatus as cluster_status
 from magnum.tests.unit.db import base
 from magnum.tests.unit.db import utils
@@ -117,6 +119,19 @@ class DbClusterTestCase(base.DbTestCase):
         res_uuids = [r.uuid for r in res]
         self.assertEqual(sorted(uuids), sorted(res_uuids))
 
+    def test_get_cluster_list_with_nodegroups(self):
+        uuid1 = uuidutils.generate_uuid()
+        utils.create_test_cluster(id=1, name='clusterone', uuid=uuid1)
+        utils.create_nodegroups_for_cluster(cluster_id=uuid1)
+        uuid2 = uuidutils.generate_uuid()
+        utils.create_test_cluster(id=2, name='clustertwo', uuid=uuid2)
+        res = self.dbapi.get_cluster_list(self.context, sort_key='id')
+        self.assertEqual([uuid1, uuid2], [r.uuid for r in res])
+        self.assertEqual(['worker', 'master'],
+                         [ng.role for ng in res[0].nodegroups])
+        self.assertEqual({uuid1}, {ng.cluster_id for ng in res[0].nodegroups})
+        self.assertEqual([], res[1].nodegroups)
+
     def test_get_cluster_list_sorted(self):
         uuids = []
         for _ in range(5):
@@ -131,6 +146,33 @@ class DbClusterTestCase(base.DbTestCase):
                           self.context,
                           sort_key='foo')
 
+    def test_get_cluster_list_cursor(self):
+        # Duplicate names are ordered by id.
+        for i, name in enumerate(['b', 'a', 'c', 'a', None], 1):
+            utils.create_test_cluster(id=i, name=name,
+                                      uuid=uuidutils.generate_uuid())
+
+        res = self.dbapi.get_cluster_list(self.context, sort_key='name',
+                                          limit=2, cursor=['a', 2])
+        self.assertEqual([4, 1], [r.id for r in res])
+        res = self.dbapi.get_cluster_list(self.context, sort_key='name',
+                                          sort_dir='desc', cursor=['b', 1])
+        self.assertEqual(['a', 'a', None], [r.name for r in res])
+        # NULL values sort first in ascending order on SQLite.
+        res = self.dbapi.get_cluster_list(self.context, sort_key='name',
+                                          limit=2, cursor=[None, 5])
+        self.assertEqual([2, 4], [r.id for r in res])
+        res = self.dbapi.get_cluster_list(self.context, sort_key='name',
+                                          sort_dir='desc', cursor=['a', 4])
+        self.assertEqual([2, 5], [r.id for r in res])
+
+        self.assertRaises(exception.InvalidParameterValue,
+                          self.dbapi.get_cluster_list, self.context,
+                          sort_key='created_at', cursor=['yesterday', 1])
+        self.assertRaises(exception.InvalidParameterValue,
+                          self.dbapi.get_cluster_list, self.context,
+                          cursor=[1, 2])
+
     def test_get_cluster_list_with_filters(self):
         ct1 = utils.get_test_cluster_template(id=1,
                                               uuid=uuidutils.generate_uuid())
@@ -272,3 +314,37 @@ class DbClusterTestCase(base.DbTestCase):
         self.assertRaises(exception.InvalidParameterValue,
                           self.dbapi.update_cluster, cluster.id,
                           {'uuid': ''})
+
+    def test_update_clusters_health_status(self):
+        clusters = [utils.create_test_cluster(uuid=uuidutils.generate_uuid(),
+                                              health_status=None)
+                    for i in range(3)]
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if statement.startswith('UPDATE'):
+                statements.append(statement)
+
+        engine = sa_api.get_engine()
+        sa.event.listen(engine, 'before_cursor_execute', before_execute)
+        self.addCleanup(sa.event.remove, engine, 'before_cursor_execute',
+                        before_execute)
+
+        count = self.dbapi.update_clusters_health_status({
+            clusters[0].uuid: ('HEALTHY', {'api': 'ok'}),
+            clusters[1].uuid: ('UNHEALTHY', {'node-0.Ready': 'False'}),
+            uuidutils.generate_uuid(): ('HEALTHY', {}),
+        })
+
+        self.assertEqual(2, count)
+        self.assertEqual(1, len(statements))
+        res = [self.dbapi.get_cluster_by_uuid(self.context, cluster.uuid)
+               for cluster in clusters]
+        self.assertEqual('HEALTHY', res[0].health_status)
+        self.assertEqual({'api': 'ok'}, res[0].health_status_reason)
+        self.assertEqual('UNHEALTHY', res[1].health_status)
+        self.assertEqual({'node-0.Ready': 'False'},
+                         res[1].health_status_reason)
+        self.assertIsNone(res[2].health_status)
+        self.assertIsNotNone(res[0].updated_at)
+        self.assertIsNone(res[2].updated_at)
@@ -16,8 +16,10 @@
 """Tests for manipulating ClusterTemplate via the DB API"""
 from oslo_utils import uuidutils
 import six
+import sqlalchemy as sa
 
 from magnum.common import exception
+from magnum.db.sqlalchemy import api as sa_api
 from magnum.tests.unit.db import base
 from magnum.tests.unit.db import utils
 
@@ -53,6 +55,43 @@ class DbClusterTemplateTestCase(base.DbTestCase):
                           self.context,
                           sort_key='foo')
 
+    def test_get_cluster_template_list_cursor(self):
+        for i in range(1, 6):
+            utils.create_test_cluster_template(
+                id=i, uuid=uuidutils.generate_uuid(), public=i % 2,
+                project_id='fake_project' if i < 4 else 'other_project')
+
+        # Public templates of other projects are part of the pages.
+        res = self.dbapi.get_cluster_template_list(self.context, limit=2,
+                                                   cursor=[2])
+        self.assertEqual([3, 5], [r.id for r in res])
+        res = self.dbapi.get_cluster_template_list(
+            self.context, sort_key='public', sort_dir='desc',
+            cursor=[True, 3])
+        self.assertEqual([1, 2], [r.id for r in res])
+
+    def test_get_cluster_template_list_cursor_nullable_key(self):
+        keypairs = ['a', None, 'c', None, 'b']
+        for i, keypair_id in enumerate(keypairs, 1):
+            utils.create_test_cluster_template(
+                id=i, uuid=uuidutils.generate_uuid(), keypair_id=keypair_id)
+
+        for sort_dir in ('asc', 'desc'):
+            rows = []
+            cursor = None
+            while True:
+                res = self.dbapi.get_cluster_template_list(
+                    self.context, limit=2, sort_key='keypair_id',
+                    sort_dir=sort_dir, cursor=cursor)
+                if not res:
+                    break
+                rows.extend((r.id, r.keypair_id) for r in res)
+                cursor = [res[-1].keypair_id, res[-1].id]
+            expected = [(2, None), (4, None), (1, 'a'), (5, 'b'), (3, 'c')]
+            if sort_dir == 'desc':
+                expected.reverse()
+            self.assertEqual(expected, rows)
+
     def test_get_cluster_template_list_with_filters(self):
         ct1 = utils.create_test_cluster_template(
             id=1,
@@ -117,6 +156,37 @@ class DbClusterTemplateTestCase(base.DbTestCase):
             self.context, ct['uuid'])
         self.assertEqual(ct['id'], cluster_template.id)
 
+    def test_get_cluster_template_by_uuid_other_project(self):
+        ct = utils.create_test_cluster_template(project_id='not_mine')
+        self.assertRaises(exception.ClusterTemplateNotFound,
+                          self.dbapi.get_cluster_template_by_uuid,
+                          self.context, ct['uuid'])
+
+    def test_get_cluster_template_by_uuid_other_project_public(self):
+        ct = utils.create_test_cluster_template(project_id='not_mine',
+                                                public=True)
+        cluster_template = self.dbapi.get_cluster_template_by_uuid(
+            self.context, ct['uuid'])
+        self.assertEqual(ct['id'], cluster_template.id)
+
+    def test_get_cluster_template_by_uuid_single_query(self):
+        ct = utils.create_test_cluster_template()
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if 'cluster_template' in statement:
+                statements.append(statement)
+
+        engine = sa_api.get_engine()
+        sa.event.listen(engine, 'before_cursor_execute', before_execute)
+        self.addCleanup(sa.event.remove, engine, 'before_cursor_execute',
+                        before_execute)
+
+        self.dbapi.get_cluster_template_by_uuid(self.context, ct['uuid'])
+
+        self.assertEqual(1, len(statements))
+        self.assertNotIn('UNION', statements[0])
+
     def test_get_cluster_template_that_does_not_exist(self):
         self.assertRaises(exception.ClusterTemplateNotFound,
                           self.dbapi.get_cluster_template_by_id,
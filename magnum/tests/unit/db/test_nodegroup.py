@@ -118,6 +118,23 @@ class DbNodeGroupTestCase(base.DbTestCase):
         for uuid in uuids_not_in_cluster:
             self.assertNotIn(uuid, res_uuids)
 
+    def test_list_nodegroups_by_stack_id(self):
+        cluster = utils.create_test_cluster(uuid=uuidutils.generate_uuid())
+        ng1 = utils.create_test_nodegroup(uuid=uuidutils.generate_uuid(),
+                                          name='test1', stack_id='stack1',
+                                          cluster_id=cluster.uuid)
+        ng2 = utils.create_test_nodegroup(uuid=uuidutils.generate_uuid(),
+                                          name='test2', stack_id='stack1',
+                                          cluster_id=cluster.uuid)
+        utils.create_test_nodegroup(uuid=uuidutils.generate_uuid(),
+                                    name='test3', stack_id='stack2',
+                                    cluster_id=cluster.uuid)
+        res = self.dbapi.list_nodegroups_by_stack_id(self.context, 'stack1')
+        self.assertEqual(sorted([ng1.uuid, ng2.uuid]),
+                         sorted([r.uuid for r in res]))
+        res = self.dbapi.list_nodegroups_by_stack_id(self.context, 'stack3')
+        self.assertEqual([], res)
+
     def test_get_cluster_list_sorted(self):
         uuids = []
         cluster = utils.create_test_cluster(uuid=uuidutils.generate_uuid())
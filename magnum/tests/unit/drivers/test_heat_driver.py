@@ -59,7 +59,7 @@ class TestHeatPoller(base.TestCase):
 
         stack_params = dict() if stack_params is None else stack_params
 
-        stack = mock.MagicMock(stack_status=stack_status,
+        stack = mock.MagicMock(id=stack_id, stack_status=stack_status,
                                stack_status_reason=status_reason,
                                parameters=stack_params)
         # In order to simulate a stack not found from osc we don't add the
@@ -120,10 +120,17 @@ class TestHeatPoller(base.TestCase):
                 # For this reason raise heat NotFound exception.
                 raise heatexc.NotFound("stack not found")
 
+        def list_ng_stacks(filters=None, show_deleted=False):
+            return [stack for stack_id, stack in self.mock_stacks.items()
+                    if stack_id in filters['id']]
+
         cluster_template_dict = utils.get_test_cluster_template(
             coe='kubernetes')
         mock_heat_client = mock.MagicMock()
-        mock_heat_client.stacks.get = get_ng_stack
+        mock_heat_client.stacks.get = mock.MagicMock(side_effect=get_ng_stack)
+        mock_heat_client.stacks.list = mock.MagicMock(
+            side_effect=list_ng_stacks)
+        self.mock_heat_client = mock_heat_client
         mock_openstack_client.heat.return_value = mock_heat_client
         cluster_template = objects.ClusterTemplate(self.context,
                                                    **cluster_template_dict)
@@ -577,6 +584,99 @@ class TestHeatPoller(base.TestCase):
         self.assertEqual(cluster_status.UPDATE_IN_PROGRESS, cluster.status)
         self.assertEqual(1, cluster.save.call_count)
 
+    def test_poll_and_check_lists_stacks_once(self):
+        cluster, poller = self.setup_poll_test()
+        self._create_nodegroup(cluster, 'ng1', 'stack2',
+                               stack_status=cluster_status.CREATE_COMPLETE)
+        self._create_nodegroup(cluster, 'ng2', 'stack3',
+                               stack_status=cluster_status.UPDATE_IN_PROGRESS)
+
+        cluster.status = cluster_status.UPDATE_IN_PROGRESS
+        poller.poll_and_check()
+
+        self.mock_heat_client.stacks.list.assert_called_once_with(
+            filters={'id': ['stack1', 'stack2', 'stack3']}, show_deleted=True)
+        # The default nodegroups share a stack, its outputs are resolved
+        # only once. The in progress stack is not resolved.
+        self.mock_heat_client.stacks.get.assert_has_calls([
+            mock.call('stack1', resolve_outputs=True),
+            mock.call('stack2', resolve_outputs=True),
+            mock.call('stack3', resolve_outputs=False)])
+        self.assertEqual(3, self.mock_heat_client.stacks.get.call_count)
+
+    def test_poll_and_check_unchanged_status(self):
+        cluster, poller = self.setup_poll_test(
+            default_stack_status=cluster_status.UPDATE_IN_PROGRESS)
+        for ng in self.def_ngs:
+            ng.status = cluster_status.UPDATE_IN_PROGRESS
+        ng = self._create_nodegroup(
+            cluster, 'ng1', 'stack2',
+            stack_status=cluster_status.CREATE_IN_PROGRESS)
+        ng.status = cluster_status.CREATE_IN_PROGRESS
+
+        cluster.status = cluster_status.UPDATE_IN_PROGRESS
+        poller.poll_and_check()
+
+        self.assertEqual(1, self.mock_heat_client.stacks.list.call_count)
+        self.assertEqual(0, self.mock_heat_client.stacks.get.call_count)
+        for def_ng in self.def_ngs:
+            self.assertEqual(0, def_ng.save.call_count)
+        self.assertEqual(0, ng.save.call_count)
+        self.assertEqual(cluster_status.UPDATE_IN_PROGRESS, cluster.status)
+
+    def test_poll_and_check_update_between_polls(self):
+        # The cluster was resized and its stack updated again between two
+        # polls, its nodegroups still hold the status of the previous
+        # update.
+        cluster, poller = self.setup_poll_test(
+            default_stack_status=cluster_status.UPDATE_COMPLETE,
+            stack_params={'number_of_minions': 5, 'number_of_masters': 1})
+        for ng in self.def_ngs:
+            ng.status = cluster_status.UPDATE_COMPLETE
+            ng.node_count = 1
+
+        cluster.status = cluster_status.UPDATE_IN_PROGRESS
+        poller.poll_and_check()
+
+        self.mock_heat_client.stacks.get.assert_called_once_with(
+            'stack1', resolve_outputs=True)
+        self.assertEqual(5, cluster.default_ng_worker.node_count)
+        self.assertEqual(cluster_status.UPDATE_COMPLETE, cluster.status)
+        self.assertEqual(1, cluster.save.call_count)
+
+    def test_poll_and_check_selected_stacks(self):
+        cluster, poller = self.setup_poll_test()
+        for ng in self.def_ngs:
+            ng.status = cluster_status.CREATE_COMPLETE
+        ng1 = self._create_nodegroup(
+            cluster, 'ng1', 'stack2',
+            stack_status=cluster_status.CREATE_COMPLETE)
+        ng1.status = cluster_status.CREATE_IN_PROGRESS
+
+        cluster.status = cluster_status.UPDATE_IN_PROGRESS
+        poller.poll_and_check(stack_ids=['stack2'])
+
+        self.mock_heat_client.stacks.list.assert_called_once_with(
+            filters={'id': ['stack2']}, show_deleted=True)
+        self.mock_heat_client.stacks.get.assert_called_once_with(
+            'stack2', resolve_outputs=True)
+        for def_ng in self.def_ngs:
+            self.assertEqual(0, def_ng.save.call_count)
+        self.assertEqual(cluster_status.CREATE_COMPLETE, ng1.status)
+        self.assertEqual(cluster_status.UPDATE_COMPLETE, cluster.status)
+
+    def test_poll_and_check_stack_not_listed(self):
+        cluster, poller = self.setup_poll_test(
+            default_stack_status=cluster_status.DELETE_IN_PROGRESS,
+            stack_missing=True)
+
+        poller.poll_and_check()
+
+        self.mock_heat_client.stacks.get.assert_called_once_with(
+            'stack1', resolve_outputs=False)
+        for ng in cluster.nodegroups:
+            self.assertEqual(cluster_status.DELETE_COMPLETE, ng.status)
+
     def test_poll_and_check_multiple_ngs_failed_and_updating(self):
         cluster, poller = self.setup_poll_test()
 
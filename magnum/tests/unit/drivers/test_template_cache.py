@@ -0,0 +1,123 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import tempfile
+from unittest import mock
+
+from heatclient.common import template_utils
+
+from magnum.drivers.heat import template_cache
+from magnum.drivers.k8s_fedora_coreos_v1 import driver as k8s_fcos_dr
+from magnum.tests import base
+
+TEMPLATE = """heat_template_version: 2015-04-30
+resources:
+  config:
+    type: OS::Heat::SoftwareConfig
+    properties:
+      config: {get_file: fragment.sh}
+"""
+
+ENVIRONMENT = """resource_registry:
+  "Magnum::Optional::Thing": nested.yaml
+"""
+
+NESTED = """heat_template_version: 2015-04-30
+resources: {}
+"""
+
+
+class TestTemplateCache(base.TestCase):
+
+    def setUp(self):
+        super(TestTemplateCache, self).setUp()
+        self.cache = template_cache.TemplateCache()
+        self.template_dir = tempfile.mkdtemp()
+        self.template_path = self._write('cluster.yaml', TEMPLATE)
+        self.fragment_path = self._write('fragment.sh', 'echo one\n')
+        self.env_path = self._write('env.yaml', ENVIRONMENT)
+        self.nested_path = self._write('nested.yaml', NESTED)
+
+    def _write(self, name, content, mtime=None):
+        path = os.path.join(self.template_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_get_template_contents(self):
+        files, template = self.cache.get_template_contents(
+            self.template_path)
+        self.assertEqual({'file://%s' % self.fragment_path: b'echo one\n'},
+                         files)
+        self.assertIn('config', template['resources'])
+
+        with mock.patch.object(template_utils,
+                               'get_template_contents') as mock_get:
+            cached_files, cached_template = (
+                self.cache.get_template_contents(self.template_path))
+            self.assertFalse(mock_get.called)
+
+        self.assertEqual(files, cached_files)
+        self.assertIsNot(files, cached_files)
+        self.assertIs(template, cached_template)
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1},
+                         self.cache.stats())
+
+    def test_get_template_contents_file_changed(self):
+        self.cache.get_template_contents(self.template_path)
+
+        # A nested file changing reloads the whole template.
+        self._write('fragment.sh', 'echo two\n',
+                    mtime=os.stat(self.fragment_path).st_mtime + 10)
+        files, _ = self.cache.get_template_contents(self.template_path)
+
+        self.assertEqual(b'echo two\n',
+                         files['file://%s' % self.fragment_path])
+        self.assertEqual(2, self.cache.stats()['misses'])
+
+    def test_get_env_files(self):
+        environment_files, env_map = self.cache.get_env_files(
+            [self.env_path])
+
+        self.assertEqual(['file://%s' % self.env_path], environment_files)
+        self.assertEqual({'file://%s' % self.env_path,
+                          'file://%s' % self.nested_path}, set(env_map))
+
+        self._write('nested.yaml', NESTED,
+                    mtime=os.stat(self.nested_path).st_mtime + 10)
+        self.cache.get_env_files([self.env_path])
+        self.cache.get_env_files([self.env_path])
+        self.assertEqual({'hits': 1, 'misses': 2, 'size': 1},
+                         self.cache.stats())
+
+    def test_prewarm(self):
+        template_cache.TEMPLATES.clear()
+
+        template_cache.prewarm()
+
+        definition = k8s_fcos_dr.Driver().get_template_definition()
+        with mock.patch.object(template_utils,
+                               'get_template_contents') as mock_get:
+            template_cache.TEMPLATES.get_template_contents(
+                definition.template_path)
+            self.assertFalse(mock_get.called)
+
+    @mock.patch.object(template_utils, 'get_template_contents')
+    def test_prewarm_failure(self, mock_get_template_contents):
+        mock_get_template_contents.side_effect = ValueError
+
+        template_cache.prewarm()
+
+        self.assertEqual(0, template_cache.TEMPLATES.stats()['size'])
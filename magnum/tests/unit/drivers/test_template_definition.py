@@ -26,6 +26,7 @@ from magnum.drivers.k8s_coreos_v1 import driver as k8s_coreos_dr
 from magnum.drivers.k8s_coreos_v1 import template_def as k8s_coreos_tdef
 from magnum.drivers.k8s_fedora_atomic_v1 import driver as k8sa_dr
 from magnum.drivers.k8s_fedora_atomic_v1 import template_def as k8sa_tdef
+from magnum.drivers.k8s_fedora_coreos_v1 import driver as k8s_fcos_dr
 from magnum.drivers.k8s_fedora_ironic_v1 import driver as k8s_i_dr
 from magnum.drivers.k8s_fedora_ironic_v1 import template_def as k8si_tdef
 from magnum.drivers.swarm_fedora_atomic_v1 import driver as swarm_dr
@@ -113,6 +114,53 @@ class TemplateDefinitionTestCase(base.TestCase):
                           driver.Driver.get_driver,
                           'vm', 'not_supported', 'kubernetes')
 
+    @mock.patch.dict(driver.Driver._instances, clear=True)
+    @mock.patch('stevedore.driver.DriverManager')
+    def test_get_driver_cached(self, mock_driver_manager):
+        first = driver.Driver.get_driver('vm', 'fedora-coreos', 'kubernetes')
+        second = driver.Driver.get_driver('vm', 'fedora-coreos', 'kubernetes')
+
+        self.assertIs(first, second)
+        mock_driver_manager.assert_called_once_with(
+            'magnum.drivers', 'k8s_fedora_coreos_v1')
+
+    @mock.patch.dict(driver.Driver._instances, clear=True)
+    def test_get_driver_cached_disabled(self):
+        driver.Driver.get_driver('vm', 'fedora-coreos', 'kubernetes')
+        CONF.set_override('disabled_drivers', ['k8s_fedora_coreos_v1'],
+                          group='drivers')
+
+        self.assertRaises(exception.ClusterTypeNotSupported,
+                          driver.Driver.get_driver,
+                          'vm', 'fedora-coreos', 'kubernetes')
+
+    @mock.patch('magnum.objects.ClusterTemplate.get_by_uuid')
+    def test_get_driver_for_cluster(self, mock_get_by_uuid):
+        cluster = mock.MagicMock(cluster_template_id='ct-uuid')
+        cluster.cluster_template = mock.MagicMock(
+            uuid='ct-uuid', server_type='vm', cluster_distro='fedora-coreos',
+            coe='kubernetes')
+
+        cluster_driver = driver.Driver.get_driver_for_cluster(self.context,
+                                                              cluster)
+
+        self.assertIsInstance(cluster_driver, k8s_fcos_dr.Driver)
+        self.assertFalse(mock_get_by_uuid.called)
+
+    @mock.patch('magnum.objects.ClusterTemplate.get_cached')
+    def test_get_driver_for_cluster_template_changed(self, mock_get_cached):
+        cluster = mock.MagicMock(cluster_template_id='new-ct-uuid')
+        cluster.cluster_template = mock.MagicMock(uuid='ct-uuid')
+        mock_get_cached.return_value = mock.MagicMock(
+            uuid='new-ct-uuid', server_type='vm',
+            cluster_distro='fedora-coreos', coe='kubernetes')
+
+        cluster_driver = driver.Driver.get_driver_for_cluster(self.context,
+                                                              cluster)
+
+        self.assertIsInstance(cluster_driver, k8s_fcos_dr.Driver)
+        mock_get_cached.assert_called_once_with(self.context, 'new-ct-uuid')
+
     def test_required_param_not_set(self):
         param = cmn_tdef.ParameterMapping('test', cluster_template_attr='test',
                                           required=True)
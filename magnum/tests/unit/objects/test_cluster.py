@@ -102,6 +102,83 @@ class TestClusterObject(base.DbTestCase):
             self.assertEqual(clusters[0].cluster_template_id,
                              clusters[0].cluster_template.uuid)
 
+    @mock.patch('magnum.objects.NodeGroup.list')
+    def test_list_with_nodegroups(self, mock_nodegroup_list):
+        self.fake_cluster['nodegroups'] = [self.fake_nodegroups['worker'],
+                                           self.fake_nodegroups['master']]
+        with mock.patch.object(self.dbapi, 'get_cluster_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_cluster]
+            clusters = objects.Cluster.list(self.context)
+            cluster_dict = clusters[0].as_dict()
+            self.assertEqual(3, cluster_dict['node_count'])
+            self.assertEqual(3, cluster_dict['master_count'])
+            self.assertEqual(['172.17.2.4'], cluster_dict['node_addresses'])
+            self.assertEqual(['172.17.2.18'], cluster_dict['master_addresses'])
+            self.assertEqual('master', clusters[0].default_ng_master.role)
+            self.assertEqual('worker', clusters[0].default_ng_worker.role)
+            self.assertFalse(mock_nodegroup_list.called)
+
+    @mock.patch('magnum.objects.NodeGroup.list')
+    def test_serialize_with_nodegroups(self, mock_nodegroup_list):
+        self.fake_cluster['nodegroups'] = [self.fake_nodegroups['worker'],
+                                           self.fake_nodegroups['master']]
+        with mock.patch.object(self.dbapi, 'get_cluster_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_cluster]
+            cluster = objects.Cluster.list(self.context)[0]
+        serializer = objects.base.MagnumObjectSerializer()
+        primitive = serializer.serialize_entity(self.context, cluster)
+        cluster = serializer.deserialize_entity(self.context, primitive)
+        self.assertEqual(['worker', 'master'],
+                         [ng.role for ng in cluster.nodegroups])
+        self.assertEqual(self.context, cluster.nodegroups[0]._context)
+        self.assertFalse(mock_nodegroup_list.called)
+
+    @mock.patch('magnum.objects.NodeGroup.list')
+    def test_nodegroups_not_sent_to_old_versions(self, mock_nodegroup_list):
+        self.fake_cluster['nodegroups'] = [self.fake_nodegroups['worker']]
+        with mock.patch.object(self.dbapi, 'get_cluster_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_cluster]
+            cluster = objects.Cluster.list(self.context)[0]
+
+        primitive = cluster.obj_to_primitive(target_version='1.24')
+
+        self.assertEqual('1.24', primitive['magnum_object.version'])
+        self.assertNotIn('loaded_nodegroups', primitive['magnum_object.data'])
+        self.assertNotIn('loaded_nodegroups',
+                         primitive.get('magnum_object.changes', []))
+
+    def test_nodegroups_not_saved(self):
+        cluster = objects.Cluster(self.context, **self.fake_cluster)
+        cluster.obj_reset_changes()
+        cluster.nodegroups = [objects.NodeGroup(
+            self.context, **self.fake_nodegroups['worker'])]
+        cluster.name = 'new-name'
+        with mock.patch.object(self.dbapi, 'update_cluster',
+                               autospec=True) as mock_update_cluster:
+            cluster.save()
+        mock_update_cluster.assert_called_once_with(cluster.uuid,
+                                                    {'name': 'new-name'})
+        self.assertNotIn('loaded_nodegroups', cluster.as_dict())
+
+    @mock.patch('magnum.objects.NodeGroup.list')
+    def test_refresh_drops_nodegroups(self, mock_nodegroup_list):
+        self.fake_cluster['nodegroups'] = [self.fake_nodegroups['worker']]
+        with mock.patch.object(self.dbapi, 'get_cluster_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_cluster]
+            cluster = objects.Cluster.list(self.context)[0]
+        with mock.patch.object(self.dbapi, 'get_cluster_by_uuid',
+                               autospec=True) as mock_get_cluster:
+            mock_get_cluster.return_value = dict(self.fake_cluster,
+                                                 nodegroups=None)
+            cluster.refresh()
+        cluster.nodegroups
+        mock_nodegroup_list.assert_called_once_with(self.context,
+                                                    cluster.uuid)
+
     @mock.patch('magnum.objects.ClusterTemplate.get_by_uuid')
     def test_list_all(self, mock_cluster_template_get):
         with mock.patch.object(self.dbapi, 'get_cluster_list',
@@ -112,7 +189,7 @@ class TestClusterObject(base.DbTestCase):
             clusters = objects.Cluster.list(self.context)
             mock_get_list.assert_called_once_with(
                 self.context, limit=None, marker=None, filters=None,
-                sort_dir=None, sort_key=None)
+                sort_dir=None, sort_key=None, cursor=None)
             self.assertEqual(1, mock_get_list.call_count)
             self.assertThat(clusters, HasLength(1))
             self.assertIsInstance(clusters[0], objects.Cluster)
@@ -129,7 +206,7 @@ class TestClusterObject(base.DbTestCase):
             mock_get_list.assert_called_once_with(self.context, sort_key=None,
                                                   sort_dir=None,
                                                   filters=filters, limit=None,
-                                                  marker=None)
+                                                  marker=None, cursor=None)
             self.assertEqual(1, mock_get_list.call_count)
             self.assertThat(clusters, HasLength(1))
             self.assertIsInstance(clusters[0], objects.Cluster)
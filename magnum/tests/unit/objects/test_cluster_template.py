@@ -18,8 +18,10 @@ from unittest import mock
 from oslo_utils import uuidutils
 from testtools.matchers import HasLength
 
+from magnum.common import context as magnum_context
 from magnum.common import exception
 from magnum import objects
+from magnum.objects import cluster_template as ct_obj
 from magnum.tests.unit.db import base
 from magnum.tests.unit.db import utils
 
@@ -143,3 +145,88 @@ class TestClusterTemplateObject(base.DbTestCase):
             self.assertEqual(expected,
                              mock_get_cluster_template.call_args_list)
             self.assertEqual(self.context, cluster_template._context)
+
+
+class TestClusterTemplateCache(base.DbTestCase):
+
+    def setUp(self):
+        super(TestClusterTemplateCache, self).setUp()
+        self.fake_cluster_template = utils.get_test_cluster_template()
+        self.uuid = self.fake_cluster_template['uuid']
+        p = mock.patch.object(self.dbapi, 'get_cluster_template_by_uuid',
+                              autospec=True,
+                              return_value=self.fake_cluster_template)
+        self.mock_get = p.start()
+        self.addCleanup(p.stop)
+
+    def test_get_cached_request_scope(self):
+        self.config(cache_ttl=0, group='cluster_template')
+
+        first = objects.ClusterTemplate.get_cached(self.context, self.uuid)
+        second = objects.ClusterTemplate.get_cached(self.context, self.uuid)
+
+        self.mock_get.assert_called_once_with(self.context, self.uuid)
+        self.assertEqual(self.uuid, second.uuid)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.context, second._context)
+
+        # A new request goes to the database again.
+        context = magnum_context.make_context()
+        objects.ClusterTemplate.get_cached(context, self.uuid)
+        self.assertEqual(2, self.mock_get.call_count)
+
+    @mock.patch('time.monotonic')
+    def test_get_cached_ttl(self, mock_monotonic):
+        self.config(cache_ttl=10, group='cluster_template')
+        mock_monotonic.return_value = 100
+
+        objects.ClusterTemplate.get_cached(self.context, self.uuid)
+        context = magnum_context.make_context()
+        cluster_template = objects.ClusterTemplate.get_cached(context,
+                                                              self.uuid)
+
+        self.assertEqual(1, self.mock_get.call_count)
+        self.assertEqual(context, cluster_template._context)
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1},
+                         ct_obj.CLUSTER_TEMPLATES.stats())
+
+        mock_monotonic.return_value = 111
+        objects.ClusterTemplate.get_cached(magnum_context.make_context(),
+                                           self.uuid)
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_get_cached_other_project(self):
+        objects.ClusterTemplate.get_cached(self.context, self.uuid)
+        context = magnum_context.make_context(project_id='other_project')
+
+        objects.ClusterTemplate.get_cached(context, self.uuid)
+
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_get_cached_invalidated_on_save(self):
+        cluster_template = objects.ClusterTemplate.get_cached(self.context,
+                                                              self.uuid)
+        cluster_template.image_id = 'test-image'
+        with mock.patch.object(self.dbapi, 'update_cluster_template',
+                               autospec=True):
+            cluster_template.save()
+
+        # Dropped from both the request and the process cache.
+        objects.ClusterTemplate.get_cached(self.context, self.uuid)
+        self.assertEqual(2, self.mock_get.call_count)
+        objects.ClusterTemplate.get_cached(magnum_context.make_context(),
+                                           self.uuid)
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_get_cached_invalidated_on_destroy(self):
+        cluster_template = objects.ClusterTemplate.get_cached(self.context,
+                                                              self.uuid)
+        with mock.patch.object(self.dbapi, 'destroy_cluster_template',
+                               autospec=True):
+            cluster_template.destroy()
+
+        self.mock_get.side_effect = exception.ClusterTemplateNotFound(
+            clustertemplate=self.uuid)
+        self.assertRaises(exception.ClusterTemplateNotFound,
+                          objects.ClusterTemplate.get_cached,
+                          magnum_context.make_context(), self.uuid)
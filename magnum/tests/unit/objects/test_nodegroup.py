@@ -75,7 +75,7 @@ class TestNodeGroupObject(base.DbTestCase):
             self.assertEqual(1, mock_get_list.call_count)
             mock_get_list.assert_called_once_with(
                 self.context, cluster_id, limit=None, marker=None,
-                filters=None, sort_dir=None, sort_key=None)
+                filters=None, sort_dir=None, sort_key=None, cursor=None)
             self.assertThat(nodegroups, HasLength(1))
             self.assertIsInstance(nodegroups[0], objects.NodeGroup)
             self.assertEqual(self.context, nodegroups[0]._context)
@@ -91,7 +91,19 @@ class TestNodeGroupObject(base.DbTestCase):
             self.assertEqual(1, mock_get_list.call_count)
             mock_get_list.assert_called_once_with(
                 self.context, cluster_id, limit=None, marker=None,
-                filters=filters, sort_dir=None, sort_key=None)
+                filters=filters, sort_dir=None, sort_key=None, cursor=None)
+            self.assertThat(nodegroups, HasLength(1))
+            self.assertIsInstance(nodegroups[0], objects.NodeGroup)
+            self.assertEqual(self.context, nodegroups[0]._context)
+
+    def test_list_by_stack_id(self):
+        with mock.patch.object(self.dbapi, 'list_nodegroups_by_stack_id',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_nodegroup]
+            nodegroups = objects.NodeGroup.list_by_stack_id(
+                self.context, self.fake_nodegroup['stack_id'])
+            mock_get_list.assert_called_once_with(
+                self.context, self.fake_nodegroup['stack_id'])
             self.assertThat(nodegroups, HasLength(1))
             self.assertIsInstance(nodegroups[0], objects.NodeGroup)
             self.assertEqual(self.context, nodegroups[0]._context)
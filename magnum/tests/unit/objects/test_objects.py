@@ -16,6 +16,7 @@ import datetime
 import gettext
 from unittest import mock
 
+import oslo_messaging as messaging
 from oslo_versionedobjects import exception as object_exception
 from oslo_versionedobjects import fields
 from oslo_versionedobjects import fixture
@@ -40,6 +41,7 @@ class MyObj(base.MagnumPersistentObject, base.MagnumObject):
         setattr(self, attrname, 'loaded!')
 
     @base.remotable_classmethod
+    @base.read_only
     def query(cls, context):
         obj = cls(context)
         obj.foo = 1
@@ -355,16 +357,16 @@ class TestObject(test_base.TestCase, _TestObject):
 # For more information on object version testing, read
 # https://docs.openstack.org/magnum/latest/contributor/objects.html
 object_data = {
-    'Cluster': '1.23-dfaf9ecb65a5fcab4f6c36497a8bc866',
-    'ClusterTemplate': '1.20-ea3b06c5fdbf4a3fba0db9865cd2ba4c',
+    'Cluster': '1.25-7f8bebd02f3df38ced89ebd02cba6d20',
+    'ClusterTemplate': '1.21-1738ebcb225135deef3a8d2a9646853a',
     'Certificate': '1.2-64f24db0e10ad4cbd72aea21d2075a80',
     'MyObj': '1.0-34c4b1aadefd177b13f9a2f894cc23cd',
     'X509KeyPair': '1.2-d81950af36c59a71365e33ce539d24f9',
     'MagnumService': '1.0-2d397ec59b0046bd5ec35cd3e06efeca',
     'Stats': '1.0-73a1cd6e3c0294c932a66547faba216c',
-    'Quota': '1.0-94e100aebfa88f7d8428e007f2049c18',
+    'Quota': '1.1-fedfc26d39f08c7144c7bf141372d27d',
     'Federation': '1.0-166da281432b083f0e4b851336e12e20',
-    'NodeGroup': '1.1-70211d19fcf53903a470607f1f4a784f'
+    'NodeGroup': '1.3-6ea2d5d1778405e2d470e92b5e2a4b58'
 }
 
 
@@ -386,6 +388,102 @@ class TestObjectVersions(test_base.TestCase):
                          "magnum/latest/contributor/objects.html")
 
 
+class TestMagnumObjectIndirectionAPI(test_base.TestCase):
+
+    def setUp(self):
+        super(TestMagnumObjectIndirectionAPI, self).setUp()
+        with mock.patch('magnum.conductor.api.API') as mock_api:
+            indirection_api = base.MagnumObjectIndirectionAPI()
+        self.conductor = mock_api.return_value
+        patcher = mock.patch.object(base.MagnumObject, 'indirection_api',
+                                    indirection_api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_through_conductor(self):
+        self.conductor.object_class_action.return_value = 'remote'
+
+        self.assertEqual('remote', MyObj.query(self.context))
+        self.conductor.object_class_action.assert_called_once_with(
+            self.context, 'MyObj', 'query', '1.0', (), {})
+
+    def test_direct_read(self):
+        self.config(direct_db_reads=True, group='api')
+
+        obj = MyObj.query(self.context)
+
+        self.assertEqual(1, obj.foo)
+        self.assertEqual(self.context, obj._context)
+        self.assertFalse(self.conductor.object_class_action.called)
+
+    def test_direct_read_write_through_conductor(self):
+        self.config(direct_db_reads=True, group='api')
+        self.conductor.object_action.return_value = ({}, 'polo')
+
+        obj = MyObj.query(self.context)
+        self.assertEqual('polo', obj.marco())
+
+        self.conductor.object_action.assert_called_once_with(
+            self.context, obj, 'marco', (), {})
+
+    def test_class_actions(self):
+        self.conductor.object_class_actions.return_value = ['one', 'two']
+
+        self.assertEqual(['one', 'two'], base.class_actions(
+            self.context, [(MyObj, 'query', (), {}),
+                           (MyObj, 'query', (), {})]))
+        self.conductor.object_class_actions.assert_called_once_with(
+            self.context, [('MyObj', 'query', '1.0', (), {}),
+                           ('MyObj', 'query', '1.0', (), {})])
+        self.assertFalse(self.conductor.object_class_action.called)
+
+    def test_class_actions_single(self):
+        self.conductor.object_class_action.return_value = 'remote'
+
+        self.assertEqual(['remote'], base.class_actions(
+            self.context, [(MyObj, 'query', (), {})]))
+        self.conductor.object_class_action.assert_called_once_with(
+            self.context, 'MyObj', 'query', '1.0', (), {})
+        self.assertFalse(self.conductor.object_class_actions.called)
+
+    def test_class_actions_direct_read(self):
+        self.config(direct_db_reads=True, group='api')
+
+        results = base.class_actions(
+            self.context, [(MyObj, 'query', (), {}),
+                           (MyObj, 'query', (), {})])
+
+        self.assertEqual([1, 1], [obj.foo for obj in results])
+        self.assertFalse(self.conductor.object_class_action.called)
+        self.assertFalse(self.conductor.object_class_actions.called)
+
+    def test_class_actions_old_conductor(self):
+        self.conductor.object_class_actions.side_effect = (
+            messaging.RemoteError('NoSuchMethod'))
+        self.conductor.object_class_action.side_effect = ['one', 'two']
+
+        self.assertEqual(['one', 'two'], base.class_actions(
+            self.context, [(MyObj, 'query', (), {}),
+                           (MyObj, 'query', (), {})]))
+        self.assertEqual(2, self.conductor.object_class_action.call_count)
+
+    def test_class_actions_remote_error(self):
+        self.conductor.object_class_actions.side_effect = (
+            messaging.RemoteError('ValueError'))
+
+        self.assertRaises(messaging.RemoteError, base.class_actions,
+                          self.context, [(MyObj, 'query', (), {}),
+                                         (MyObj, 'query', (), {})])
+        self.assertFalse(self.conductor.object_class_action.called)
+
+    def test_class_actions_local(self):
+        with mock.patch.object(base.MagnumObject, 'indirection_api', None):
+            results = base.class_actions(
+                self.context, [(MyObj, 'query', (), {})])
+
+        self.assertEqual(1, results[0].foo)
+
+
 class TestObjectSerializer(test_base.TestCase):
 
     def test_object_serialization(self):
@@ -0,0 +1,182 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+import oslo_messaging as messaging
+from oslo_messaging.notify import notifier
+
+from magnum.common import exception
+import magnum.conf
+from magnum import objects
+from magnum.objects.fields import ClusterStatus as cluster_status
+from magnum.service import heat_notification
+from magnum.service import periodic
+from magnum.tests import base
+from magnum.tests import fakes
+from magnum.tests.unit.db import utils
+
+CONF = magnum.conf.CONF
+
+STACK_ARN = ('arn:openstack:heat::fake_project:stacks/cluster-abc/'
+             '5f2d8a59-6e6a-4f3c-a7f1-3d7e64a4b6e1')
+STACK_ID = '5f2d8a59-6e6a-4f3c-a7f1-3d7e64a4b6e1'
+
+
+class HeatStackEndpointTestCase(base.TestCase):
+
+    def setUp(self):
+        super(HeatStackEndpointTestCase, self).setUp()
+        p = mock.patch('futurist.GreenThreadPoolExecutor',
+                       new=fakes.FakeGreenThreadPoolExecutor)
+        p.start()
+        self.addCleanup(p.stop)
+        p = mock.patch.object(periodic, '_STATUS_SYNC', None)
+        p.start()
+        self.addCleanup(p.stop)
+        self.endpoint = heat_notification.HeatStackEndpoint()
+        self.cluster = objects.Cluster(
+            self.context, **utils.get_test_cluster(
+                status=cluster_status.UPDATE_IN_PROGRESS))
+        self.nodegroup = objects.NodeGroup(
+            self.context, **utils.get_test_nodegroup(
+                cluster_id=self.cluster.uuid, stack_id=STACK_ID))
+
+    def test_get_stack_id(self):
+        self.assertEqual(STACK_ID, heat_notification._get_stack_id(
+            {'stack_identity': STACK_ARN}))
+        self.assertIsNone(heat_notification._get_stack_id({}))
+
+    @mock.patch('magnum.service.periodic.ClusterUpdateJob')
+    @mock.patch('magnum.objects.Cluster.get_by_uuid')
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_info_syncs_nodegroup(self, mock_list_ngs, mock_get_cluster,
+                                  mock_job):
+        mock_list_ngs.return_value = [self.nodegroup]
+        mock_get_cluster.return_value = self.cluster
+
+        self.endpoint.info({}, 'orchestration.host',
+                           'orchestration.stack.update.end',
+                           {'stack_identity': STACK_ARN}, {})
+
+        mock_list_ngs.assert_called_once_with(mock.ANY, STACK_ID)
+        mock_get_cluster.assert_called_once_with(mock.ANY, self.cluster.uuid)
+        mock_job.assert_called_once_with(mock.ANY, self.cluster,
+                                         stack_ids=[STACK_ID])
+        mock_job.return_value.update_status.assert_called_once_with()
+
+    @mock.patch('magnum.service.periodic.ClusterUpdateJob')
+    @mock.patch('magnum.objects.Cluster.get_by_uuid')
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_info_cluster_synced_periodically(self, mock_list_ngs,
+                                              mock_get_cluster, mock_job):
+        mock_list_ngs.return_value = [self.nodegroup]
+        mock_get_cluster.return_value = self.cluster
+        tasks = periodic.MagnumPeriodicTasks(CONF)
+        self.assertIs(tasks.status_sync, self.endpoint.scheduler)
+
+        def periodic_sync():
+            self.endpoint.info({}, 'orchestration.host',
+                               'orchestration.stack.update.end',
+                               {'stack_identity': STACK_ARN}, {})
+
+        # A notification for a cluster the periodic task is syncing is
+        # left to it.
+        tasks.status_sync.run_pass([(self.cluster.uuid, periodic_sync)])
+
+        mock_job.return_value.update_status.assert_not_called()
+        self.assertEqual(0, tasks.status_sync.in_flight)
+
+    @mock.patch('magnum.service.periodic.ClusterUpdateJob')
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_info_unknown_stack(self, mock_list_ngs, mock_job):
+        mock_list_ngs.return_value = []
+
+        self.endpoint.info({}, 'orchestration.host',
+                           'orchestration.stack.create.end',
+                           {'stack_identity': STACK_ARN}, {})
+
+        mock_job.assert_not_called()
+
+    @mock.patch('magnum.service.periodic.ClusterUpdateJob')
+    @mock.patch('magnum.objects.Cluster.get_by_uuid')
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_info_cluster_not_in_progress(self, mock_list_ngs,
+                                          mock_get_cluster, mock_job):
+        self.cluster.status = cluster_status.UPDATE_COMPLETE
+        mock_list_ngs.return_value = [self.nodegroup]
+        mock_get_cluster.return_value = self.cluster
+
+        self.endpoint.info({}, 'orchestration.host',
+                           'orchestration.stack.update.end',
+                           {'stack_identity': STACK_ARN}, {})
+
+        mock_job.assert_not_called()
+
+    @mock.patch('magnum.service.periodic.ClusterUpdateJob')
+    @mock.patch('magnum.objects.Cluster.get_by_uuid')
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_error_cluster_not_found(self, mock_list_ngs, mock_get_cluster,
+                                     mock_job):
+        mock_list_ngs.return_value = [self.nodegroup]
+        mock_get_cluster.side_effect = exception.ClusterNotFound(
+            cluster=self.cluster.uuid)
+
+        self.endpoint.error({}, 'orchestration.host',
+                            'orchestration.stack.delete.error',
+                            {'stack_identity': STACK_ARN}, {})
+
+        mock_job.assert_not_called()
+
+    @mock.patch('magnum.objects.NodeGroup.list_by_stack_id')
+    def test_info_sync_failure_is_logged(self, mock_list_ngs):
+        mock_list_ngs.side_effect = exception.MagnumException
+
+        self.endpoint.info({}, 'orchestration.host',
+                           'orchestration.stack.update.end',
+                           {'stack_identity': STACK_ARN}, {})
+
+
+class HeatNotificationListenerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(HeatNotificationListenerTestCase, self).setUp()
+        self.config(transport_url='fake:/')
+        p = mock.patch.object(periodic, '_STATUS_SYNC', None)
+        p.start()
+        self.addCleanup(p.stop)
+        self.config(stack_notifications_exchange=CONF.control_exchange,
+                    group='cluster_heat')
+
+    @mock.patch.object(heat_notification.HeatStackEndpoint, 'sync_stack')
+    def test_listener_with_fake_driver(self, mock_sync_stack):
+        synced = threading.Event()
+        mock_sync_stack.side_effect = lambda stack_id: synced.set()
+
+        listener = heat_notification.get_listener(executor='threading')
+        listener.start()
+        self.addCleanup(listener.wait)
+        self.addCleanup(listener.stop)
+
+        transport = messaging.get_notification_transport(CONF)
+        heat_notifier = notifier.Notifier(
+            transport, publisher_id='orchestration.host',
+            driver='messaging', topics=['notifications'])
+        # Events other than stack end and error are filtered out.
+        heat_notifier.info({}, 'orchestration.stack.update.start',
+                           {'stack_identity': STACK_ARN})
+        heat_notifier.info({}, 'orchestration.stack.update.end',
+                           {'stack_identity': STACK_ARN})
+
+        self.assertTrue(synced.wait(5))
+        mock_sync_stack.assert_called_once_with(STACK_ID)
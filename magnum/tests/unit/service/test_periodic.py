@@ -12,8 +12,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
 from unittest import mock
 
+from oslo_utils import timeutils
 from oslo_utils import uuidutils
 
 from magnum.common import context
@@ -54,6 +56,9 @@ class PeriodicTestCase(base.TestCase):
 
     def setUp(self):
         super(PeriodicTestCase, self).setUp()
+        p = mock.patch.object(periodic, '_STATUS_SYNC', None)
+        p.start()
+        self.addCleanup(p.stop)
 
         self.context = context.make_admin_context()
 
@@ -216,8 +221,8 @@ class PeriodicTestCase(base.TestCase):
         )
         self.assertEqual(2, self.mock_driver.update_cluster_status.call_count)
 
-    @mock.patch('oslo_service.loopingcall.FixedIntervalLoopingCall',
-                new=fakes.FakeLoopingCall)
+    @mock.patch('futurist.GreenThreadPoolExecutor',
+                new=fakes.FakeGreenThreadPoolExecutor)
     @mock.patch('magnum.drivers.common.driver.Driver.get_driver_for_cluster')
     @mock.patch('magnum.objects.Cluster.list')
     @mock.patch.object(dbapi.Connection, 'destroy_nodegroup')
@@ -254,8 +259,8 @@ class PeriodicTestCase(base.TestCase):
             notifications = fake_notifier.NOTIFICATIONS
             self.assertEqual(4, len(notifications))
 
-    @mock.patch('oslo_service.loopingcall.FixedIntervalLoopingCall',
-                new=fakes.FakeLoopingCall)
+    @mock.patch('futurist.GreenThreadPoolExecutor',
+                new=fakes.FakeGreenThreadPoolExecutor)
     @mock.patch('magnum.drivers.common.driver.Driver.get_driver_for_cluster')
     @mock.patch('magnum.objects.Cluster.list')
     def test_sync_cluster_status_not_changes(self, mock_cluster_list,
@@ -286,8 +291,8 @@ class PeriodicTestCase(base.TestCase):
         notifications = fake_notifier.NOTIFICATIONS
         self.assertEqual(0, len(notifications))
 
-    @mock.patch('oslo_service.loopingcall.FixedIntervalLoopingCall',
-                new=fakes.FakeLoopingCall)
+    @mock.patch('futurist.GreenThreadPoolExecutor',
+                new=fakes.FakeGreenThreadPoolExecutor)
     @mock.patch('magnum.drivers.common.driver.Driver.get_driver_for_cluster')
     @mock.patch('magnum.objects.Cluster.list')
     @mock.patch.object(dbapi.Connection, 'destroy_cluster')
@@ -323,8 +328,8 @@ class PeriodicTestCase(base.TestCase):
             notifications = fake_notifier.NOTIFICATIONS
             self.assertEqual(5, len(notifications))
 
-    @mock.patch('oslo_service.loopingcall.FixedIntervalLoopingCall',
-                new=fakes.FakeLoopingCall)
+    @mock.patch('futurist.GreenThreadPoolExecutor',
+                new=fakes.FakeGreenThreadPoolExecutor)
     @mock.patch('magnum.conductor.monitors.create_monitor')
     @mock.patch('magnum.objects.Cluster.list')
     @mock.patch('magnum.common.rpc.get_notifier')
@@ -350,3 +355,267 @@ class PeriodicTestCase(base.TestCase):
                          self.cluster4.health_status)
         self.assertEqual({'api': 'ok', 'node-0.Ready': 'False'},
                          self.cluster4.health_status_reason)
+
+    @mock.patch('futurist.GreenThreadPoolExecutor',
+                new=fakes.FakeGreenThreadPoolExecutor)
+    @mock.patch('magnum.conductor.utils.notify_about_cluster_health_status')
+    @mock.patch('magnum.objects.Cluster.save_health_status')
+    @mock.patch('magnum.objects.Cluster.save')
+    @mock.patch('magnum.conductor.monitors.create_monitor')
+    @mock.patch('magnum.objects.Cluster.list')
+    @mock.patch('magnum.common.context.make_admin_context')
+    def test_sync_cluster_health_status_coalesced(
+            self, mock_make_admin_context, mock_cluster_list,
+            mock_create_monitor, mock_save, mock_save_health_status,
+            mock_notify):
+        mock_make_admin_context.return_value = self.context
+        clusters = [self.cluster1, self.cluster2, self.cluster3]
+        for cluster in clusters:
+            cluster.status = cluster_status.CREATE_COMPLETE
+            cluster.health_status = cluster_health_status.HEALTHY
+            cluster.health_status_reason = {'api': 'ok'}
+            cluster.obj_reset_changes()
+        mock_cluster_list.return_value = clusters
+        health = {
+            self.cluster1.uuid: {
+                'health_status': cluster_health_status.HEALTHY,
+                'health_status_reason': {'api': 'ok'}},
+            self.cluster2.uuid: {
+                'health_status': cluster_health_status.HEALTHY,
+                'health_status_reason': {'api': 'ok',
+                                         'node-0.Ready': True}},
+            self.cluster3.uuid: {
+                'health_status': cluster_health_status.UNHEALTHY,
+                'health_status_reason': {'api': 'ok',
+                                         'node-0.Ready': False}},
+        }
+        mock_create_monitor.side_effect = lambda ctx, cluster: mock.MagicMock(
+            spec=k8s_monitor.K8sMonitor, data=health[cluster.uuid])
+
+        periodic.MagnumPeriodicTasks(CONF).sync_cluster_health_status(
+            self.context)
+
+        # One update for the clusters that changed, none for the others.
+        self.assertFalse(mock_save.called)
+        mock_save_health_status.assert_called_once_with(
+            self.context, [self.cluster2, self.cluster3])
+        self.assertFalse(self.cluster1.obj_what_changed())
+        # Only a change of health status is notified.
+        mock_notify.assert_called_once_with(
+            self.context, self.cluster3, cluster_health_status.HEALTHY)
+
+
+class ClusterSyncSchedulerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ClusterSyncSchedulerTestCase, self).setUp()
+        p = mock.patch('futurist.GreenThreadPoolExecutor',
+                       new=fakes.FakeGreenThreadPoolExecutor)
+        p.start()
+        self.addCleanup(p.stop)
+        self.scheduler = periodic.ClusterSyncScheduler('test', workers=2,
+                                                       timeout=30)
+
+    def test_run_pass(self):
+        job1 = mock.MagicMock()
+        job2 = mock.MagicMock()
+
+        sync_pass = self.scheduler.run_pass([('c1', job1), ('c2', job2)])
+
+        job1.assert_called_once_with()
+        job2.assert_called_once_with()
+        self.assertEqual(2, sync_pass.submitted)
+        self.assertIsNotNone(sync_pass.duration)
+        stats = self.scheduler.statistics()
+        self.assertEqual(0, stats['queue_depth'])
+        self.assertEqual(0, stats['in_flight'])
+        self.assertEqual(2, stats['workers'])
+        self.assertEqual(2, stats['last_pass_submitted'])
+
+    def test_run_pass_skips_in_flight_cluster(self):
+        inner_job = mock.MagicMock()
+        inner_passes = []
+
+        def outer_job():
+            self.assertEqual(1, self.scheduler.in_flight)
+            inner_passes.append(
+                self.scheduler.run_pass([('c1', inner_job)]))
+
+        self.scheduler.run_pass([('c1', outer_job)])
+
+        inner_job.assert_not_called()
+        self.assertEqual(0, inner_passes[0].submitted)
+        self.assertEqual(1, inner_passes[0].skipped)
+        self.assertEqual(0, self.scheduler.in_flight)
+
+    def test_run_pass_duplicate_in_same_pass(self):
+        job = mock.MagicMock()
+
+        sync_pass = self.scheduler.run_pass([('c1', job), ('c1', job)])
+
+        # The first job has already finished when the second one is
+        # submitted with the inline executor.
+        self.assertEqual(2, job.call_count)
+        self.assertEqual(0, sync_pass.skipped)
+
+    @mock.patch('oslo_utils.timeutils.StopWatch.expired', return_value=True)
+    def test_run_pass_deadline_expired(self, mock_expired):
+        job = mock.MagicMock()
+
+        sync_pass = self.scheduler.run_pass([('c1', job)])
+
+        job.assert_not_called()
+        self.assertEqual(1, sync_pass.expired)
+        self.assertEqual(0, self.scheduler.in_flight)
+
+    def test_submit(self):
+        inner_job = mock.MagicMock()
+        submitted = []
+
+        def outer_job():
+            submitted.append(self.scheduler.submit('c1', inner_job))
+
+        self.assertTrue(self.scheduler.submit('c1', outer_job))
+
+        inner_job.assert_not_called()
+        self.assertEqual([False], submitted)
+        self.assertEqual(0, self.scheduler.in_flight)
+        self.assertIsNone(self.scheduler.last_pass)
+
+    def test_submit_job_failure(self):
+        job = mock.MagicMock(side_effect=exception.MagnumException)
+
+        self.assertTrue(self.scheduler.submit('c1', job))
+
+        job.assert_called_once_with()
+        self.assertEqual(0, self.scheduler.in_flight)
+
+    def test_run_pass_job_failure(self):
+        job1 = mock.MagicMock(side_effect=exception.MagnumException)
+        job2 = mock.MagicMock()
+
+        sync_pass = self.scheduler.run_pass([('c1', job1), ('c2', job2)])
+
+        job2.assert_called_once_with()
+        self.assertEqual(1, sync_pass.failed)
+        self.assertEqual(0, self.scheduler.in_flight)
+        self.assertEqual(1, self.scheduler.statistics()['last_pass_failed'])
+
+
+class ConductorShardTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ConductorShardTestCase, self).setUp()
+        p = mock.patch.object(periodic, '_STATUS_SYNC', None)
+        p.start()
+        self.addCleanup(p.stop)
+        self.context = context.make_admin_context()
+        self.clusters = [
+            objects.Cluster(self.context, uuid=uuidutils.generate_uuid())
+            for i in range(50)]
+
+    def _service(self, host, binary='magnum-conductor', alive=True):
+        last_seen_up = timeutils.utcnow(True)
+        if not alive:
+            last_seen_up -= datetime.timedelta(
+                seconds=CONF.service_down_time + 60)
+        return objects.MagnumService(self.context, host=host, binary=binary,
+                                     forced_down=False,
+                                     last_seen_up=last_seen_up)
+
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_filter_splits_clusters(self, mock_service_list):
+        mock_service_list.return_value = [self._service('host1'),
+                                          self._service('host2')]
+        shard1 = periodic.ConductorShard('host1')
+        shard2 = periodic.ConductorShard('host2')
+
+        owned1 = shard1.filter(self.context, self.clusters)
+        owned2 = shard2.filter(self.context, self.clusters)
+
+        self.assertEqual(len(self.clusters), len(owned1) + len(owned2))
+        self.assertFalse(set(c.uuid for c in owned1) &
+                         set(c.uuid for c in owned2))
+        self.assertTrue(owned1)
+        self.assertTrue(owned2)
+
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_filter_ignores_dead_and_other_services(self, mock_service_list):
+        mock_service_list.return_value = [
+            self._service('host1'),
+            self._service('host2', alive=False),
+            self._service('host3', binary='magnum-api')]
+        shard = periodic.ConductorShard('host1')
+
+        owned = shard.filter(self.context, self.clusters)
+
+        self.assertEqual(self.clusters, owned)
+        self.assertEqual({'host1'}, shard.ring.hosts)
+
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_filter_ignores_forced_down_services(self, mock_service_list):
+        service = self._service('host2')
+        service.forced_down = True
+        mock_service_list.return_value = [self._service('host1'), service]
+        shard = periodic.ConductorShard('host1')
+
+        shard.filter(self.context, self.clusters)
+
+        self.assertEqual({'host1'}, shard.ring.hosts)
+
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_filter_rebalances_on_membership_change(self, mock_service_list):
+        mock_service_list.return_value = [self._service('host1'),
+                                          self._service('host2')]
+        shard = periodic.ConductorShard('host1')
+        owned = shard.filter(self.context, self.clusters)
+        self.assertLess(len(owned), len(self.clusters))
+
+        mock_service_list.return_value = [self._service('host1'),
+                                          self._service('host2',
+                                                        alive=False)]
+        owned = shard.filter(self.context, self.clusters)
+        self.assertEqual(self.clusters, owned)
+
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_filter_membership_error(self, mock_service_list):
+        mock_service_list.side_effect = exception.MagnumException
+        shard = periodic.ConductorShard('host1')
+
+        owned = shard.filter(self.context, self.clusters)
+
+        self.assertEqual(self.clusters, owned)
+
+    @mock.patch('magnum.service.periodic.ClusterSyncScheduler.run_pass')
+    @mock.patch('magnum.objects.Cluster.list')
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_sync_cluster_status_only_owned(self, mock_service_list,
+                                            mock_cluster_list,
+                                            mock_run_pass):
+        self.config(host='host1')
+        mock_service_list.return_value = [self._service('host1'),
+                                          self._service('host2')]
+        mock_cluster_list.return_value = self.clusters
+        tasks = periodic.MagnumPeriodicTasks(CONF)
+
+        tasks.sync_cluster_status(None)
+
+        expected = [c.uuid for c in self.clusters if tasks.shard.owns(c)]
+        jobs = list(mock_run_pass.call_args[0][0])
+        self.assertEqual(expected, [key for key, job in jobs])
+        self.assertLess(len(jobs), len(self.clusters))
+
+    @mock.patch('magnum.service.periodic.ClusterSyncScheduler.run_pass')
+    @mock.patch('magnum.objects.Cluster.list')
+    @mock.patch('magnum.objects.MagnumService.list')
+    def test_sync_cluster_status_sharding_disabled(self, mock_service_list,
+                                                   mock_cluster_list,
+                                                   mock_run_pass):
+        self.config(shard_periodic_sync=False, group='conductor')
+        mock_cluster_list.return_value = self.clusters
+
+        periodic.MagnumPeriodicTasks(CONF).sync_cluster_status(None)
+
+        mock_service_list.assert_not_called()
+        jobs = list(mock_run_pass.call_args[0][0])
+        self.assertEqual(len(self.clusters), len(jobs))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the throughput and latency of running magnum-api servers.
+
+Start one magnum-api per configuration to compare, for example one with
+``[api]/server_mode = werkzeug`` and one with ``[api]/server_mode = prefork``
+listening on different ports, then run::
+
+    tools/api_benchmark.py --token $(openstack token issue -f value -c id) \\
+        --target werkzeug=http://127.0.0.1:9511 \\
+        --target prefork=http://127.0.0.1:9512
+
+Every target is loaded in turn by ``--concurrency`` clients issuing
+``GET --path`` for ``--duration`` seconds, and the requests per second and
+latency percentiles are printed for each of them.
+"""
+
+import argparse
+import http.client
+import threading
+import time
+import urllib.parse
+
+
+def _percentile(samples, percent):
+    if not samples:
+        return 0.0
+    index = int(round(percent / 100.0 * (len(samples) - 1)))
+    return samples[index]
+
+
+class _Client(threading.Thread):
+
+    def __init__(self, url, path, headers, deadline):
+        super(_Client, self).__init__(daemon=True)
+        self.url = url
+        self.path = path
+        self.headers = headers
+        self.deadline = deadline
+        self.latencies = []
+        self.errors = 0
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            if self.url.scheme == 'https':
+                conn_class = http.client.HTTPSConnection
+            else:
+                conn_class = http.client.HTTPConnection
+            self._conn = conn_class(self.url.netloc, timeout=60)
+        return self._conn
+
+    def run(self):
+        while time.monotonic() < self.deadline:
+            start = time.monotonic()
+            try:
+                conn = self._connection()
+                conn.request('GET', self.path, headers=self.headers)
+                response = conn.getresponse()
+                response.read()
+                if response.getheader('Connection', '').lower() == 'close':
+                    conn.close()
+                    self._conn = None
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+                self._conn = None
+                continue
+            if response.status >= 400:
+                self.errors += 1
+                continue
+            self.latencies.append(time.monotonic() - start)
+
+
+def run_target(url, path, headers, concurrency, duration):
+    deadline = time.monotonic() + duration
+    clients = [_Client(urllib.parse.urlsplit(url), path, headers, deadline)
+               for _ in range(concurrency)]
+    started = time.monotonic()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(lat for client in clients for lat in client.latencies)
+    return {
+        'requests': len(latencies),
+        'errors': sum(client.errors for client in clients),
+        'rps': len(latencies) / elapsed,
+        'p50': _percentile(latencies, 50) * 1000,
+        'p99': _percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--target', action='append', required=True,
+                        metavar='NAME=URL',
+                        help='magnum-api endpoint to load, may be repeated.')
+    parser.add_argument('--path', default='/v1/clusters',
+                        help='Path requested on every target.')
+    parser.add_argument('--token', help='Keystone token sent with requests.')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='Number of concurrent clients.')
+    parser.add_argument('--duration', type=float, default=30,
+                        help='Seconds to load each target for.')
+    parser.add_argument('--api-version', default='container-infra latest',
+                        help='Value of the OpenStack-API-Version header.')
+    args = parser.parse_args()
+
+    headers = {'Accept': 'application/json',
+               'OpenStack-API-Version': args.api_version}
+    if args.token:
+        headers['X-Auth-Token'] = args.token
+
+    print('%-16s %10s %8s %10s %10s %10s' % (
+        'target', 'requests', 'errors', 'req/s', 'p50 (ms)', 'p99 (ms)'))
+    for target in args.target:
+        name, _, url = target.partition('=')
+        if not url:
+            name = url = target
+        result = run_target(url, args.path, headers, args.concurrency,
+                            args.duration)
+        print('%-16s %10d %8d %10.1f %10.1f %10.1f' % (
+            name, result['requests'], result['errors'], result['rps'],
+            result['p50'], result['p99']))
+
+
+if __name__ == '__main__':
+    main()
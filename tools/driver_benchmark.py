@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the cost of resolving a cluster driver.
+
+Compares loading the driver through stevedore on every call, as
+``Driver.get_driver`` used to, with the cached lookup::
+
+    tools/driver_benchmark.py --cluster-type vm,fedora-coreos,kubernetes
+"""
+
+import argparse
+import timeit
+
+from magnum.common import config
+from magnum.drivers.common import driver
+
+
+def _per_call(func, number):
+    timer = timeit.Timer(func)
+    # Best of a few runs, to leave out the noise of the machine.
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cluster-type',
+                        default='vm,fedora-coreos,kubernetes',
+                        metavar='SERVER_TYPE,OS,COE',
+                        help='Cluster type to resolve the driver of.')
+    parser.add_argument('--number', type=int, default=1000,
+                        help='Calls per measurement.')
+    args = parser.parse_args()
+
+    config.parse_args([], default_config_files=[])
+    cluster_type = tuple(args.cluster_type.split(','))
+
+    uncached = _per_call(lambda: driver.Driver._load_driver(cluster_type),
+                         args.number)
+    driver.Driver.get_driver(*cluster_type)
+    cached = _per_call(lambda: driver.Driver.get_driver(*cluster_type),
+                       args.number)
+
+    print('%-10s %12s' % ('lookup', 'us/call'))
+    print('%-10s %12.2f' % ('uncached', uncached * 1e6))
+    print('%-10s %12.2f' % ('cached', cached * 1e6))
+    print('speedup    %11.0fx' % (uncached / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compare the latency of magnum-api object reads with and without RPC.
+
+Lists and shows clusters as the cluster list and show endpoints do, first
+through a conductor, as magnum-api does by default, then directly from the
+database, as it does with ``[api]/direct_db_reads`` set::
+
+    tools/object_read_benchmark.py --clusters 200 --busy 8
+
+The database is a temporary SQLite file. The conductor runs in process: its
+calls go through the RPC serializer and a JSON encoding, take
+``--rpc-latency`` milliseconds of transport, and are queued for one of
+``--workers`` workers, while ``--busy`` threads keep the conductor loaded
+with calls of ``--work`` milliseconds each.
+
+To compare running services instead, point ``tools/api_benchmark.py`` at two
+magnum-api servers differing by ``[api]/direct_db_reads``.
+"""
+
+import argparse
+from concurrent import futures
+import os
+import tempfile
+import threading
+import time
+
+from oslo_serialization import jsonutils
+from oslo_utils import uuidutils
+
+from magnum.common import config
+from magnum.common import context
+import magnum.conf
+from magnum.db.sqlalchemy import api as db_api
+from magnum.db.sqlalchemy import models
+from magnum import objects
+from magnum.objects import base
+from magnum.tests.unit.db import utils as db_utils
+
+CONF = magnum.conf.CONF
+
+
+def _percentile(samples, percent):
+    if not samples:
+        return 0.0
+    index = int(round(percent / 100.0 * (len(samples) - 1)))
+    return samples[index]
+
+
+class _Conductor(object):
+    """A conductor served in process, with the costs of RPC and load."""
+
+    def __init__(self, workers, rpc_latency):
+        self._workers = futures.ThreadPoolExecutor(workers)
+        self._rpc_latency = rpc_latency
+        self._serializer = base.MagnumObjectSerializer()
+
+    def _wire(self, context, entity):
+        primitive = self._serializer.serialize_entity(context, entity)
+        return self._serializer.deserialize_entity(
+            context, jsonutils.loads(jsonutils.dumps(primitive)))
+
+    def _class_action(self, context, objname, objmethod, objver, args,
+                      kwargs):
+        # The indirection API is set for the whole process, call the
+        # undecorated method as a conductor, which has none, would.
+        objclass = base.MagnumObject.obj_class_from_name(objname, objver)
+        return getattr(objclass, objmethod).original_fn(
+            objclass, context, *args, **kwargs)
+
+    def object_class_action(self, context, objname, objmethod, objver,
+                            args, kwargs):
+        args, kwargs = self._wire(context, (args, kwargs))
+        time.sleep(self._rpc_latency)
+        result = self._workers.submit(self._class_action, context, objname,
+                                      objmethod, objver, args,
+                                      kwargs).result()
+        return self._wire(context, result)
+
+    def busy(self, work, stop):
+        while not stop.is_set():
+            self._workers.submit(time.sleep, work).result()
+
+
+def _measure(func, number):
+    latencies = []
+    for _ in range(number):
+        start = time.monotonic()
+        func()
+        latencies.append(time.monotonic() - start)
+    latencies.sort()
+    return (_percentile(latencies, 50) * 1000,
+            _percentile(latencies, 99) * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clusters', type=int, default=200,
+                        help='Clusters in the database.')
+    parser.add_argument('--limit', type=int, default=50,
+                        help='Clusters per listed page.')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Conductor workers.')
+    parser.add_argument('--busy', type=int, default=8,
+                        help='Threads keeping conductor workers busy.')
+    parser.add_argument('--work', type=float, default=5,
+                        help='Milliseconds of each call keeping a conductor '
+                             'worker busy.')
+    parser.add_argument('--rpc-latency', type=float, default=1,
+                        help='Milliseconds of RPC transport per call.')
+    parser.add_argument('--number', type=int, default=200,
+                        help='Calls per measurement.')
+    args = parser.parse_args()
+
+    config.parse_args([], default_config_files=[])
+    db_file = tempfile.NamedTemporaryFile(suffix='.sqlite', delete=False)
+    db_file.close()
+    CONF.set_override('connection', 'sqlite:///%s' % db_file.name,
+                      group='database')
+    models.Base.metadata.create_all(db_api.get_engine())
+
+    # All tenants, to leave Keystone out of the tenant filter.
+    ctx = context.make_admin_context(all_tenants=True)
+    uuids = []
+    for i in range(args.clusters):
+        uuid = uuidutils.generate_uuid()
+        db_utils.create_test_cluster(uuid=uuid, name='cluster-%d' % i,
+                                     project_id='benchmark')
+        db_utils.create_nodegroups_for_cluster(cluster_id=uuid,
+                                               project_id='benchmark')
+        uuids.append(uuid)
+
+    conductor = _Conductor(args.workers, args.rpc_latency / 1000.0)
+    CONF.set_override('transport_url', 'fake:/')
+    indirection = base.MagnumObjectIndirectionAPI()
+    indirection._conductor = conductor
+    base.MagnumObject.indirection_api = indirection
+
+    stop = threading.Event()
+    for _ in range(args.busy):
+        threading.Thread(target=conductor.busy,
+                         args=(args.work / 1000.0, stop),
+                         daemon=True).start()
+
+    calls = [
+        ('list', lambda: objects.Cluster.list(ctx, limit=args.limit)),
+        ('show', lambda: objects.Cluster.get_by_uuid(ctx, uuids[0])),
+    ]
+    print('%-8s %-10s %10s %10s' % ('call', 'mode', 'p50 (ms)', 'p99 (ms)'))
+    try:
+        for name, call in calls:
+            for mode, direct in (('conductor', False), ('direct', True)):
+                CONF.set_override('direct_db_reads', direct, group='api')
+                p50, p99 = _measure(call, args.number)
+                print('%-8s %-10s %10.2f %10.2f' % (name, mode, p50, p99))
+    finally:
+        stop.set()
+        os.unlink(db_file.name)
+
+
+if __name__ == '__main__':
+    main()
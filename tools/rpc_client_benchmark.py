@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the magnum-api request overhead of creating RPC clients.
+
+Runs ``RPCHook`` alone, then serves ``GET /`` through the magnum-api hooks,
+first creating a conductor RPC client for every request, as ``RPCHook``
+used to, then with the client shared by the whole process::
+
+    tools/rpc_client_benchmark.py --number 2000
+
+The RPC transport is the in-memory fake driver, no message is sent.
+"""
+
+import argparse
+import logging
+import timeit
+from unittest import mock
+
+import pecan.testing
+
+from magnum.api import config as api_config
+from magnum.api import hooks
+from magnum.common import config
+from magnum.common import rpc
+from magnum.common import rpc_service
+import magnum.conf
+
+CONF = magnum.conf.CONF
+
+
+def _per_call(func, number):
+    timer = timeit.Timer(func)
+    # Best of a few runs, to leave out the noise of the machine.
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=1000,
+                        help='Requests per measurement.')
+    args = parser.parse_args()
+
+    config.parse_args([], default_config_files=[])
+    CONF.set_override('transport_url', 'fake:/')
+    rpc.init(CONF)
+    # Leave out the deprecation warning oslo.messaging logs for every
+    # client created.
+    logging.getLogger('oslo_messaging').setLevel(logging.ERROR)
+    app = pecan.testing.load_test_app({'app': api_config.app})
+
+    def request():
+        app.get('/', headers={'Accept': 'application/json'})
+
+    def request_new_client():
+        rpc_service._CLIENTS.clear()
+        request()
+
+    state = mock.Mock()
+    hook = hooks.RPCHook()
+
+    def hook_new_client():
+        rpc_service._CLIENTS.clear()
+        hook.before(state)
+
+    request()
+    results = [
+        ('hook', _per_call(hook_new_client, args.number),
+         _per_call(lambda: hook.before(state), args.number)),
+        ('request', _per_call(request_new_client, args.number),
+         _per_call(request, args.number)),
+    ]
+
+    print('%-10s %14s %14s' % ('us/call', 'client/request', 'pooled'))
+    for name, per_request, pooled in results:
+        print('%-10s %14.2f %14.2f' % (name, per_request * 1e6,
+                                       pooled * 1e6))
+
+
+if __name__ == '__main__':
+    main()